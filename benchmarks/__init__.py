@@ -0,0 +1 @@
+"""Benchmarks for the export pipeline, run against synthetic Jira responses."""
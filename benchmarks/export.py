@@ -0,0 +1,260 @@
+"""Time each export stage on synthetic issues, with throughput and peak memory.
+
+Run with `python -m benchmarks.export --issues 20000`. No network is used: the
+search responses are generated up front and served from memory, so the
+numbers only cover the work done by this package and the `jira` library.
+"""
+
+import argparse
+import gc
+import io
+import json
+import math
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, ClassVar
+
+from jira import JIRA, Issue
+from jira.client import ResultList
+from rich.progress import Progress
+
+from benchmarks.synthetic import make_search_page
+from jira_export.exporter import ExportOptions, export_project
+from jira_export.fetch.pages import PAGE_SIZE, iter_issue_pages
+from jira_export.fetch.scheduler import get_scheduler
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.formats import OutputFormat, writer_for
+
+
+class FakeJira:
+    """Serve pre-encoded search responses the way `JIRA` parses real ones."""
+
+    def __init__(self, payloads: list[str]):
+        self._payloads = payloads
+        self._options = dict(JIRA.DEFAULT_OPTIONS)
+
+    def enhanced_search_issues(
+        self,
+        _jql: str,
+        nextPageToken: str | None = None,
+        *,
+        json_result: bool = False,
+        **_: Any,
+    ) -> ResultList[Issue] | dict[str, Any]:
+        page = json.loads(self._payloads[int(nextPageToken or 0) // PAGE_SIZE])
+        if json_result:
+            return page
+
+        return ResultList(
+            (Issue(self._options, None, raw) for raw in page["issues"]),
+            _isLast=page["isLast"],
+            _nextPageToken=page.get("nextPageToken"),
+        )
+
+    def approximate_issue_count(self, _jql: str) -> int:
+        return 0
+
+
+@dataclass
+class FakeProject:
+    jira: FakeJira
+    domain: str = "benchmark.invalid"
+    project: str = "TEST"
+
+    def get_jira(self, **_: Any) -> FakeJira:
+        return self.jira
+
+
+@dataclass
+class Result:
+    stage: str
+    issues: int
+    seconds: float
+    cpu_seconds: float
+    peak_bytes: int
+
+    HEADER: ClassVar[str] = (
+        f"{'stage':<24}{'seconds':>10}{'issues/s':>12}"
+        f"{'CPU ms/page':>13}{'peak MiB':>10}"
+    )
+
+    def __str__(self) -> str:
+        pages = max(1, self.issues / PAGE_SIZE)
+        return (
+            f"{self.stage:<24}{self.seconds:>10.3f}"
+            f"{self.issues / self.seconds:>12,.0f}"
+            f"{self.cpu_seconds / pages * 1000:>13.2f}"
+            f"{self.peak_bytes / 2**20:>10.1f}"
+        )
+
+
+def measure(stage: str, issues: int, fn: Callable[[], object]) -> Result:
+    """Run `fn` twice: once timed, then once traced, as tracing slows it down.
+
+    Returns:
+        Result: The wall-clock and CPU time, and the peak of traced allocations.
+    """
+    # Do not bill this stage for collecting the garbage of the previous one.
+    gc.collect()
+    start, cpu_start = time.perf_counter(), time.process_time()
+    fn()
+    seconds = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu_start
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(stage, issues, seconds, cpu_seconds, peak)
+
+
+def retained_bytes(fn: Callable[[], object]) -> int:
+    """Measure the memory still allocated by the result of `fn`.
+
+    Returns:
+        int: Traced bytes held by the returned object once `fn` has returned.
+    """
+    tracemalloc.start()
+    try:
+        result = fn()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return current
+
+
+def _payloads(args: argparse.Namespace) -> list[str]:
+    return [
+        json.dumps(
+            make_search_page(
+                start,
+                PAGE_SIZE,
+                total=args.issues,
+                fields=ProjectItem.jira_fields(),
+                description_size=args.description_size,
+                null_ratio=args.null_ratio,
+            )
+        )
+        for start in range(0, args.issues, PAGE_SIZE)
+    ]
+
+
+def _serialize(output_format: OutputFormat, items: list[ProjectItem]) -> None:
+    writer_cls = writer_for(output_format)
+    stream = io.BytesIO() if writer_cls.binary else io.StringIO()
+    with writer_cls(stream) as writer:
+        for start in range(0, len(items), PAGE_SIZE):
+            writer.write(items[start : start + PAGE_SIZE])
+
+
+def _available_formats() -> Iterator[OutputFormat]:
+    for output_format in OutputFormat:
+        try:
+            writer_for(output_format)
+        except ImportError:
+            continue
+        yield output_format
+
+
+def run(args: argparse.Namespace) -> tuple[list[Result], float]:
+    payloads = _payloads(args)
+    jira = FakeJira(payloads)
+    n = args.issues
+    # Only the local work is measured, so requests are not rate limited.
+    get_scheduler(FakeProject.domain).rate = math.inf
+
+    # Stages hold their input in memory, so their peaks exclude it.
+    results = [
+        measure(
+            "fetch pages",
+            n,
+            lambda: sum(map(len, iter_issue_pages(jira, "project=TEST"))),
+        ),
+        # What the export did before reading raw JSON: the `jira` client
+        # hydrates every issue into `Issue` resources.
+        measure(
+            "fetch pages as Issue",
+            n,
+            lambda: sum(
+                len(jira.enhanced_search_issues("", str(start)))
+                for start in range(0, n, PAGE_SIZE)
+            ),
+        ),
+    ]
+    raw_issues = [issue for page in iter_issue_pages(jira, "") for issue in page]
+    issues = [Issue(jira._options, None, raw) for raw in raw_issues]
+    results.extend(
+        [
+            measure(
+                "ProjectItem.from_raw",
+                n,
+                lambda: [ProjectItem.from_raw(issue) for issue in raw_issues],
+            ),
+            measure(
+                "ProjectItem.from_issue",
+                n,
+                lambda: [ProjectItem.from_issue(issue) for issue in issues],
+            ),
+        ]
+    )
+
+    items = [ProjectItem.from_raw(issue) for issue in raw_issues]
+    item_bytes = retained_bytes(
+        lambda: [ProjectItem.from_raw(issue) for issue in raw_issues]
+    )
+    results.extend(
+        measure(
+            f"write {output_format.value}",
+            n,
+            lambda output_format=output_format: _serialize(output_format, items),
+        )
+        for output_format in _available_formats()
+    )
+    raw_issues.clear()
+    issues.clear()
+    items.clear()
+
+    with TemporaryDirectory() as tmp:
+        for output_format in _available_formats():
+            output = Path(tmp) / f"issues.{output_format.value}"
+
+            def export(output_format=output_format, output=output) -> None:
+                with Progress(disable=True) as progress:
+                    export_project(
+                        FakeProject(jira),  # type: ignore[arg-type]
+                        ExportOptions(output_format=output_format),
+                        progress=progress,
+                        output=output,
+                        count_issues=False,
+                    )
+
+            results.append(measure(f"export {output_format.value}", n, export))
+
+    return results, item_bytes / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=10_000)
+    parser.add_argument("--description-size", type=int, default=500)
+    parser.add_argument("--null-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results, item_bytes = run(args)
+    print(Result.HEADER)
+    for result in results:
+        print(result)
+    print(f"ProjectItem: {item_bytes:.0f} bytes/issue retained, excluding strings")
+
+
+if __name__ == "__main__":
+    main()
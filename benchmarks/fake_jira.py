@@ -0,0 +1,417 @@
+"""Serve generated issues over the part of the Jira Cloud API used by the export.
+
+Run with `python -m benchmarks.fake_jira --port 8080 --issues 50000`, then add
+a profile pointing at it and export as usual:
+
+    jira-export projects add -p fake -d 127.0.0.1:8080 --scheme http -P TEST
+    jira-export export -p fake --parallel 4 --output fake.toml
+
+Issue `N` is created `N` minutes after 2024-01-01 00:00 UTC (and never
+updated), so `created` and `updated` windows, as used by `--parallel` and
+`--incremental`, are resolved without scanning the issues. Other JQL clauses
+are ignored.
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.synthetic import make_issue, make_user, select_fields
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+DEFAULT_MAX_RESULTS = 50
+CUSTOM_FIELD_NAMES = {"customfield_10016": "Story Points"}
+
+_PROJECT = re.compile(r'project\s*=\s*"?([A-Za-z0-9_]+)"?')
+_DATE_CLAUSE = re.compile(r'(created|updated)\s*(>=|<)\s*"([^"]+)"')
+_ORDER_DESC = re.compile(r"ORDER BY created DESC", re.IGNORECASE)
+
+
+@dataclass
+class Knobs:
+    issues: int = 10_000
+    latency: float = 0.0
+    # Jira Cloud returns fewer issues than asked when `maxResults` is too high.
+    max_page_size: int = 100
+    # Every Nth request is rejected with a 429 and this `Retry-After`.
+    rate_limit_every: int = 0
+    retry_after: float = 1.0
+    # Probability of a search request failing with a 503.
+    error_rate: float = 0.0
+    # Every search request fails with a 500 after this many have succeeded.
+    fail_after: int | None = None
+    description_size: int = 500
+    null_ratio: float = 0.2
+    # Status changes in the changelog of every issue.
+    histories: int = 3
+    # Attachments of every issue. The Nth attachment of every issue has the
+    # same content, so that they can be deduplicated.
+    attachments: int = 0
+    attachment_size: int = 64 * 1024
+    seed: int = 0
+
+
+@dataclass
+class _Counters:
+    requests: int = 0
+    searches: int = 0
+    downloads: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _field(field_id: str) -> dict[str, Any]:
+    # As on Jira Cloud, custom fields are searched by `cf[N]` or by name, and
+    # results are keyed by ID whatever they were requested by.
+    if field_id.startswith("customfield_"):
+        number = field_id.removeprefix("customfield_")
+        name = CUSTOM_FIELD_NAMES.get(field_id, f"Custom field {number}")
+        clause_names = [f"cf[{number}]", name]
+    else:
+        name = field_id.replace("_", " ").capitalize()
+        clause_names = [field_id]
+
+    return {
+        "id": field_id,
+        "key": field_id,
+        "name": name,
+        "custom": field_id.startswith("customfield_"),
+        "searchable": True,
+        "clauseNames": clause_names,
+    }
+
+
+def created_at(number: int) -> datetime:
+    return EPOCH + timedelta(minutes=number)
+
+
+def _jira_timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def _minutes(jql_datetime: str) -> int:
+    value = datetime.strptime(jql_datetime, "%Y/%m/%d %H:%M").replace(tzinfo=UTC)
+    return int((value - EPOCH).total_seconds() // 60)
+
+
+def issue_range(jql: str, total: int) -> range:
+    """Resolve the issue numbers matched by the date clauses of `jql`.
+
+    Returns:
+        range: The matching issue numbers, in the order of the query.
+
+    >>> issue_range('project = TEST and created >= "2024/01/01 00:10"', 12)
+    range(10, 13)
+    >>> issue_range("project = TEST ORDER BY created DESC", 3)
+    range(3, 0, -1)
+    """
+    low, high = 1, total + 1
+    for _, operator, value in _DATE_CLAUSE.findall(jql):
+        if operator == ">=":
+            low = max(low, _minutes(value))
+        else:
+            high = min(high, _minutes(value))
+
+    if _ORDER_DESC.search(jql):
+        return range(high - 1, low - 1, -1)
+
+    return range(low, max(low, high))
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    server: "FakeJiraServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug(format, *args)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        params["fields"] = parse_qs(url.query).get("fields")
+        self._dispatch(url.path, params)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self._dispatch(urlsplit(self.path).path, body)
+
+    def _dispatch(self, path: str, params: dict[str, Any]) -> None:
+        knobs, counters = self.server.knobs, self.server.counters
+        with counters.lock:
+            counters.requests += 1
+            rate_limited = (
+                knobs.rate_limit_every
+                and counters.requests % knobs.rate_limit_every == 0
+            )
+
+        if knobs.latency:
+            time.sleep(knobs.latency)
+
+        if rate_limited:
+            self._send(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"errorMessages": ["Rate limit exceeded"]},
+                headers={"Retry-After": f"{knobs.retry_after:g}"},
+            )
+            return
+
+        endpoint = path.rpartition("/rest/api/")[2].partition("/")[2]
+        match endpoint:
+            case "serverInfo":
+                self._send(
+                    HTTPStatus.OK,
+                    {
+                        "baseUrl": self.server.base_url,
+                        "version": "1001.0.0-SNAPSHOT",
+                        "versionNumbers": [1001, 0, 0],
+                        "deploymentType": "Cloud",
+                        "serverTitle": "Fake Jira",
+                    },
+                )
+            case "field":
+                self._send(HTTPStatus.OK, self.server.fields)
+            case "myself":
+                self._send(HTTPStatus.OK, {**make_user("Person 0"), "timeZone": "UTC"})
+            case "search/approximate-count":
+                jql = params.get("jql", "")
+                self._send(
+                    HTTPStatus.OK, {"count": len(issue_range(jql, knobs.issues))}
+                )
+            case "search/jql":
+                self._search(params)
+            case "changelog/bulkfetch":
+                self._changelogs(params)
+            case content if content.startswith("attachment/content/"):
+                self._attachment(int(content.rpartition("/")[2]))
+            case _:
+                self._send(
+                    HTTPStatus.NOT_FOUND, {"errorMessages": [f"No route for {path}"]}
+                )
+
+    def _search(self, params: dict[str, Any]) -> None:
+        knobs, counters = self.server.knobs, self.server.counters
+        with counters.lock:
+            counters.searches += 1
+            searches = counters.searches
+
+        if knobs.fail_after is not None and searches > knobs.fail_after:
+            self._send(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"errorMessages": ["Server failure"]}
+            )
+            return
+        if knobs.error_rate and self.server.rng.random() < knobs.error_rate:
+            self._send(
+                HTTPStatus.SERVICE_UNAVAILABLE, {"errorMessages": ["Try again later"]}
+            )
+            return
+
+        jql = params.get("jql", "")
+        project = (match := _PROJECT.search(jql)) and match.group(1) or "TEST"
+        numbers = issue_range(jql, knobs.issues)
+        start = int(params.get("nextPageToken") or 0)
+        size = min(
+            int(params.get("maxResults") or DEFAULT_MAX_RESULTS), knobs.max_page_size
+        )
+        page = numbers[start : start + size]
+
+        issues = [self._issue(number, project, params.get("fields")) for number in page]
+        body: dict[str, Any] = {
+            "issues": issues,
+            "isLast": start + size >= len(numbers),
+        }
+        if not body["isLast"]:
+            body["nextPageToken"] = str(start + size)
+        self._send(HTTPStatus.OK, body)
+
+    def _changelogs(self, params: dict[str, Any]) -> None:
+        knobs = self.server.knobs
+        histories = [
+            (key, index)
+            for key in params.get("issueIdsOrKeys", [])
+            for index in range(knobs.histories)
+        ]
+        start = int(params.get("nextPageToken") or 0)
+        size = min(int(params.get("maxResults") or 1000), knobs.max_page_size)
+
+        changelogs: list[dict[str, Any]] = []
+        for key, index in histories[start : start + size]:
+            number = int(key.rpartition("-")[2])
+            if not changelogs or changelogs[-1]["issueId"] != str(10_000 + number):
+                changelogs.append(
+                    {"issueId": str(10_000 + number), "changeHistories": []}
+                )
+            changelogs[-1]["changeHistories"].append(
+                {
+                    "id": str(index),
+                    "author": make_user("Person 0"),
+                    "created": _jira_timestamp(
+                        created_at(number) + timedelta(hours=index + 1)
+                    ),
+                    "items": [
+                        {
+                            "field": "status",
+                            "fieldtype": "jira",
+                            "fromString": f"Status {index}",
+                            "toString": f"Status {index + 1}",
+                        }
+                    ],
+                }
+            )
+
+        body: dict[str, Any] = {"issueChangeLogs": changelogs}
+        if start + size < len(histories):
+            body["nextPageToken"] = str(start + size)
+        self._send(HTTPStatus.OK, body)
+
+    def _attachment(self, attachment_id: int) -> None:
+        knobs, counters = self.server.knobs, self.server.counters
+        with counters.lock:
+            counters.downloads += 1
+
+        line = f"Attachment {attachment_id % 100}\n".encode()
+        content = (line * (knobs.attachment_size // len(line) + 1))[
+            : knobs.attachment_size
+        ]
+        self._send_bytes(HTTPStatus.OK, content, content_type="text/plain")
+
+    def _issue(
+        self, number: int, project: str, fields: list[str] | None
+    ) -> dict[str, Any]:
+        knobs = self.server.knobs
+        issue = make_issue(
+            number,
+            project=project,
+            description_size=knobs.description_size,
+            null_ratio=knobs.null_ratio,
+            seed=knobs.seed,
+        )
+        created = _jira_timestamp(created_at(number))
+        issue["fields"].update(
+            created=created,
+            updated=created,
+            attachment=[
+                {
+                    "id": str(number * 100 + index),
+                    "filename": f"file-{index}.txt",
+                    "mimeType": "text/plain",
+                    "size": knobs.attachment_size,
+                    "content": f"{self.server.base_url}/rest/api/2/attachment/"
+                    f"content/{number * 100 + index}",
+                }
+                for index in range(knobs.attachments)
+            ],
+        )
+
+        if fields and "*all" not in fields:
+            return select_fields(issue, fields)
+
+        return issue
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        body: dict[str, Any] | list[Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._send_bytes(status, json.dumps(body).encode(), headers)
+
+    def _send_bytes(
+        self,
+        status: HTTPStatus,
+        payload: bytes,
+        headers: dict[str, str] | None = None,
+        content_type: str = "application/json",
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeJiraServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], knobs: Knobs):
+        super().__init__(address, FakeJiraHandler)
+        self.knobs = knobs
+        self.counters = _Counters()
+        self.rng = random.Random(knobs.seed)
+        # The client looks fields up by name to translate `fields` and results.
+        self.fields = [_field(field_id) for field_id in make_issue(1)["fields"]]
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--issues", type=int, default=Knobs.issues)
+    parser.add_argument(
+        "--latency", type=float, default=Knobs.latency, help="seconds per request"
+    )
+    parser.add_argument("--max-page-size", type=int, default=Knobs.max_page_size)
+    parser.add_argument(
+        "--rate-limit-every",
+        type=int,
+        default=Knobs.rate_limit_every,
+        help="reject every Nth request with a 429",
+    )
+    parser.add_argument("--retry-after", type=float, default=Knobs.retry_after)
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=Knobs.error_rate,
+        help="probability of a search failing with a 503",
+    )
+    parser.add_argument(
+        "--fail-after",
+        type=int,
+        default=Knobs.fail_after,
+        help="fail every search with a 500 after N searches",
+    )
+    parser.add_argument("--description-size", type=int, default=Knobs.description_size)
+    parser.add_argument("--null-ratio", type=float, default=Knobs.null_ratio)
+    parser.add_argument(
+        "--histories",
+        type=int,
+        default=Knobs.histories,
+        help="status changes in the changelog of every issue",
+    )
+    parser.add_argument("--attachments", type=int, default=Knobs.attachments)
+    parser.add_argument("--attachment-size", type=int, default=Knobs.attachment_size)
+    parser.add_argument("--seed", type=int, default=Knobs.seed)
+    parser.add_argument("--verbose", action="store_true")
+    args = vars(parser.parse_args())
+
+    logging.basicConfig(level=logging.DEBUG if args.pop("verbose") else logging.INFO)
+    server = FakeJiraServer((args.pop("host"), args.pop("port")), Knobs(**args))
+    print(f"Serving fake Jira on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare search response size and parse time with and without `fields`.
+
+Run with `python -m benchmarks.fields`.
+"""
+
+import json
+import time
+
+from benchmarks.synthetic import make_search_page
+from jira_export.fetch.pages import PAGE_SIZE
+from jira_export.models.project_item import ProjectItem
+
+PAGES = 8
+
+
+def _measure(fields: list[str] | None) -> tuple[float, float]:
+    payloads = [
+        json.dumps(
+            make_search_page(
+                i * PAGE_SIZE, PAGE_SIZE, total=PAGES * PAGE_SIZE, fields=fields
+            )
+        )
+        for i in range(PAGES)
+    ]
+    start = time.perf_counter()
+    for payload in payloads:
+        json.loads(payload)
+    elapsed = time.perf_counter() - start
+
+    issues = PAGES * PAGE_SIZE
+    return sum(map(len, payloads)) / issues, elapsed / PAGES * 1000
+
+
+def main() -> None:
+    full_bytes, full_ms = _measure(None)
+    trimmed_bytes, trimmed_ms = _measure(ProjectItem.jira_fields())
+
+    print(f"{'':<18}{'bytes/issue':>12}{'parse ms/page':>15}")
+    print(f"{'fields=*all':<18}{full_bytes:>12.0f}{full_ms:>15.2f}")
+    print(f"{'fields=ProjectItem':<18}{trimmed_bytes:>12.0f}{trimmed_ms:>15.2f}")
+    print(
+        f"reduction: {1 - trimmed_bytes / full_bytes:.0%} bytes, {1 - trimmed_ms / full_ms:.0%} parse time"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Generate Jira search responses shaped like Atlassian Cloud's."""
+
+import random
+from typing import Any
+
+SITE = "https://example.atlassian.net"
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+PEOPLE = [f"Person {i}" for i in range(25)]
+
+
+def make_user(name: str) -> dict[str, Any]:
+    account_id = f"5b10ac8d82e05b22cc7d{PEOPLE.index(name):04d}"
+    return {
+        "self": f"{SITE}/rest/api/2/user?accountId={account_id}",
+        "accountId": account_id,
+        "emailAddress": f"{name.lower().replace(' ', '.')}@example.com",
+        "avatarUrls": {
+            size: f"https://avatar-management.example.net/{account_id}/{size}.png"
+            for size in ("48x48", "24x24", "16x16", "32x32")
+        },
+        "displayName": name,
+        "active": True,
+        "timeZone": "Europe/Paris",
+        "accountType": "atlassian",
+    }
+
+
+def _status(name: str) -> dict[str, Any]:
+    return {
+        "self": f"{SITE}/rest/api/2/status/{STATUSES.index(name) + 1}",
+        "description": "",
+        "iconUrl": f"{SITE}/images/icons/statuses/generic.png",
+        "name": name,
+        "id": str(STATUSES.index(name) + 1),
+        "statusCategory": {
+            "self": f"{SITE}/rest/api/2/statuscategory/2",
+            "id": 2,
+            "key": "new",
+            "colorName": "blue-gray",
+            "name": "To Do",
+        },
+    }
+
+
+def _comment(rng: random.Random, issue_id: int, index: int) -> dict[str, Any]:
+    author = make_user(rng.choice(PEOPLE))
+    return {
+        "self": f"{SITE}/rest/api/2/issue/{issue_id}/comment/{index}",
+        "id": str(index),
+        "author": author,
+        "body": "Comment " * rng.randint(5, 60),
+        "updateAuthor": author,
+        "created": "2024-01-02T10:00:00.000+0000",
+        "updated": "2024-01-02T10:00:00.000+0000",
+        "jsdPublic": True,
+    }
+
+
+def make_issue(
+    number: int,
+    *,
+    project: str = "TEST",
+    description_size: int = 500,
+    null_ratio: float = 0.2,
+    custom_fields: int = 40,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Build the raw JSON of one issue as returned with `fields=*all`.
+
+    `null_ratio` is the probability of each optional field being empty.
+
+    Returns:
+        dict[str, Any]: The issue, as found in a search response.
+    """
+    rng = random.Random(seed * 1_000_003 + number)
+    issue_id = 10_000 + number
+
+    def maybe(value: Any) -> Any:
+        return None if rng.random() < null_ratio else value
+
+    created = f"2024-01-{1 + number % 28:02d}T{number % 24:02d}:00:00.000+0000"
+    fields: dict[str, Any] = {
+        "summary": f"Issue {number}: " + "words " * rng.randint(3, 12),
+        "status": _status(rng.choice(STATUSES)),
+        "assignee": maybe(make_user(rng.choice(PEOPLE))),
+        "reporter": maybe(make_user(rng.choice(PEOPLE))),
+        "creator": make_user(rng.choice(PEOPLE)),
+        "description": maybe(
+            ("lorem ipsum\n" * (description_size // 12 + 1))[:description_size]
+        ),
+        "created": created,
+        "updated": created,
+        "project": {
+            "self": f"{SITE}/rest/api/2/project/10000",
+            "id": "10000",
+            "key": project,
+            "name": "Test project",
+            "projectTypeKey": "software",
+        },
+        "issuetype": {
+            "self": f"{SITE}/rest/api/2/issuetype/10001",
+            "id": "10001",
+            "description": "A small, distinct piece of work.",
+            "iconUrl": f"{SITE}/rest/api/2/universal_avatar/view/type/issuetype/avatar/10318",
+            "name": "Task",
+            "subtask": False,
+        },
+        "priority": {
+            "self": f"{SITE}/rest/api/2/priority/3",
+            "name": "Medium",
+            "id": "3",
+        },
+        "labels": [f"label-{rng.randint(0, 20)}" for _ in range(rng.randint(0, 4))],
+        "components": [],
+        "fixVersions": [],
+        "watches": {
+            "self": f"{SITE}/rest/api/2/issue/{project}-{number}/watchers",
+            "watchCount": 1,
+            "isWatching": False,
+        },
+        "votes": {
+            "self": f"{SITE}/rest/api/2/issue/{project}-{number}/votes",
+            "votes": 0,
+            "hasVoted": False,
+        },
+        "comment": {
+            "comments": [_comment(rng, issue_id, i) for i in range(rng.randint(0, 4))],
+            "maxResults": 4,
+            "total": 4,
+            "startAt": 0,
+        },
+        "worklog": {"startAt": 0, "maxResults": 20, "total": 0, "worklogs": []},
+        "attachment": [],
+        "subtasks": [],
+        "issuelinks": [],
+        "timetracking": {},
+        "environment": None,
+        "duedate": None,
+        "resolution": None,
+        "resolutiondate": None,
+        "lastViewed": None,
+    }
+    for i in range(custom_fields):
+        fields[f"customfield_{10_000 + i}"] = maybe(
+            rng.choice(
+                [
+                    "value " * rng.randint(1, 10),
+                    {
+                        "self": f"{SITE}/rest/api/2/customFieldOption/{i}",
+                        "value": "Option",
+                        "id": str(i),
+                    },
+                    rng.random() * 100,
+                    [make_user(rng.choice(PEOPLE))],
+                ]
+            )
+        )
+
+    return {
+        "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+        "id": str(issue_id),
+        "self": f"{SITE}/rest/api/2/issue/{issue_id}",
+        "key": f"{project}-{number}",
+        "fields": fields,
+    }
+
+
+def select_fields(issue: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+    """Trim `issue` the way Jira does when the search passes `fields`.
+
+    Returns:
+        dict[str, Any]: A copy of `issue` with only the requested fields.
+    """
+    return {**issue, "fields": {name: issue["fields"].get(name) for name in fields}}
+
+
+def make_search_page(
+    start: int,
+    size: int,
+    *,
+    total: int,
+    fields: list[str] | None = None,
+    **issue_options: Any,
+) -> dict[str, Any]:
+    """Build an enhanced search response for issues `start + 1` to `start + size`.
+
+    Returns:
+        dict[str, Any]: The response body, with `nextPageToken` unless last.
+    """
+    end = min(start + size, total)
+    issues = [
+        make_issue(number, **issue_options) for number in range(start + 1, end + 1)
+    ]
+    if fields is not None:
+        issues = [select_fields(issue, fields) for issue in issues]
+
+    page: dict[str, Any] = {"issues": issues, "isLast": end >= total}
+    if end < total:
+        page["nextPageToken"] = str(end)
+    return page
@@ -6,8 +6,9 @@ import typer
 
 from jira_export.cli.export import export
 from jira_export.cli.projects import projects
+from jira_export.cli.serve import serve
+from jira_export.cli.watch import watch
 from jira_export.constants import APP_NAME
-from jira_export.models.app_state import AppState
 from jira_export.utils.setup_logs import setup_logs
 
 app = typer.Typer(no_args_is_help=True)
@@ -15,6 +16,8 @@ app = typer.Typer(no_args_is_help=True)
 app.add_typer(projects)
 app.add_typer(projects, name="project", hidden=True)
 app.add_typer(export)
+app.add_typer(serve)
+app.add_typer(watch)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,26 @@ def main(
     config_file: Annotated[
         str, typer.Option("--config-file", "-c", help="Configuration file")
     ] = typer.get_app_dir(APP_NAME) + "/config.toml",
+    env_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--env-file",
+            help="Read API keys from this file of NAME=value lines, as "
+            "JIRA_EXPORT_API_KEY_<PROJECT_ID> or JIRA_EXPORT_API_KEY, before "
+            "falling back to the keyring. The same variables are also read "
+            "from the environment",
+            envvar="JIRA_EXPORT_ENV_FILE",
+            dir_okay=False,
+            exists=True,
+            show_default=False,
+        ),
+    ] = None,
 ):
+    from jira_export.models.app_state import AppState
+    from jira_export.models.credentials import CredentialResolver
+
     setup_logs(verbose=verbose)
-    ctx.obj = AppState(config_file=Path(config_file))
+    ctx.obj = AppState(
+        config_file=Path(config_file),
+        credentials=CredentialResolver(env_file=env_file),
+    )
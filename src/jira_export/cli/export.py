@@ -1,30 +1,126 @@
 import logging
-from enum import Enum
-from typing import Annotated, cast
+import sys
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from jira import Issue
-from jira.client import ResultList
-from rich.progress import Progress
+from click.core import ParameterSource
 
-from jira_export.models.app_state import AppState
-from jira_export.models.project_item import ProjectItem
-from jira_export.utils.options import ProjectId, prompt_project_id
+from jira_export.console import err_console
+from jira_export.constants import ATTACHMENT_WORKERS, REQUEST_RATE
+from jira_export.utils.options import ProjectIds, prompt_project_id
+from jira_export.writers.compression import Compression, require_zstandard
+from jira_export.writers.formats import OutputFormat, writer_for
+
+# The export itself (and `jira`, `requests`...) is only imported once the
+# command runs, so that other commands and `--help` start faster.
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from jira_export.exporter import ExportOptions, ExportResult
+    from jira_export.models.app_state import AppState
+    from jira_export.models.project import LoadedProject
+    from jira_export.models.watermarks import Watermarks
 
 export = typer.Typer(name="export")
 
 logger = logging.getLogger(__name__)
 
+PROJECT_ID_PLACEHOLDER = "{project_id}"
+
+
+def _export_all(
+    projects: Mapping[str, "LoadedProject"],
+    outputs: Mapping[str, Path],
+    output_dirs: Mapping[str, Path],
+    checkpoints: Mapping[str, Path],
+    diff_indexes: Mapping[str, Path],
+    options: "ExportOptions",
+    *,
+    progress: "Progress",
+    watermarks: "Watermarks | None",
+    concurrency: int,
+    per_domain: int,
+) -> list[str]:
+    from jira_export.exporter import export_project
+    from jira_export.fetch.scheduler import get_scheduler
+    from jira_export.models.project import DEFAULT_POOL_SIZE
+
+    # Bound the exports running against each site, on top of the global limit,
+    # so one instance with many projects cannot starve the others: projects
+    # wait in a queue per domain, and are only handed to a worker once an
+    # export of their domain completes.
+    queues: dict[str, deque[str]] = defaultdict(deque)
+    for project_id, project in projects.items():
+        queues[project.domain].append(project_id)
+    for project in projects.values():
+        # Warm the shared client and scheduler with room for every concurrent
+        # export of the domain, before the workers start using them.
+        project.get_jira(
+            pool_size=max(DEFAULT_POOL_SIZE, per_domain * options.connections)
+        )
+        get_scheduler(
+            project.domain,
+            max_concurrency=per_domain * options.api_requests,
+            rate=options.rate,
+        )
+
+    def run(project_id: str) -> "ExportResult":
+        return export_project(
+            projects[project_id],
+            options,
+            progress=progress,
+            output=outputs.get(project_id),
+            output_dir=output_dirs.get(project_id),
+            description=f"Fetching {project_id}...",
+            count_issues=not progress.disable,
+            watermark=watermarks.projects.get(project_id) if watermarks else None,
+            checkpoint=checkpoints.get(project_id),
+            diff_against=diff_indexes.get(project_id),
+        )
 
-class OutputFormat(Enum):
-    TOML = "toml"
-    JSON = "json"
+    failed: list[str] = []
+    futures: dict[Future[ExportResult], str] = {}
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="export"
+    ) as executor:
+
+        def submit_next(domain: str) -> None:
+            if queues[domain]:
+                project_id = queues[domain].popleft()
+                futures[executor.submit(run, project_id)] = project_id
+
+        # Take turns between domains, so that they all start early.
+        for _ in range(per_domain):
+            for domain in queues:
+                submit_next(domain)
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                project_id = futures.pop(future)
+                submit_next(projects[project_id].domain)
+                try:
+                    result = future.result()
+                except Exception:
+                    logger.exception("Failed to export project %s", project_id)
+                    failed.append(project_id)
+                    continue
+
+                logger.info("Exported %d issue(s) from %s", result.issues, project_id)
+                if watermarks is not None and result.watermark is not None:
+                    watermarks.projects[project_id] = result.watermark
+
+    return failed
 
 
 @export.callback(invoke_without_command=True)
 def export_callback(
     ctx: typer.Context,
-    project_id: ProjectId = None,
+    project_ids: ProjectIds = None,
     jql: Annotated[
         str | None,
         typer.Option(
@@ -45,67 +141,370 @@ def export_callback(
             autocompletion=lambda: [e.value for e in OutputFormat],
         ),
     ] = OutputFormat.TOML,
+    parallel: Annotated[
+        int,
+        typer.Option(
+            "--parallel",
+            help="Fetch issues with N concurrent workers by splitting the query "
+            "into creation date windows. Issues are then sorted by key",
+            min=1,
+        ),
+    ] = 1,
+    extra_fields: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--fields",
+            help="Additional Jira fields to export, by ID or JQL name. Repeat the "
+            "option or separate fields with commas",
+            show_default=False,
+        ),
+    ] = None,
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Write the export to this file instead of stdout. With several "
+            f"projects, it must contain {PROJECT_ID_PLACEHOLDER}",
+            dir_okay=False,
+            show_default=False,
+        ),
+    ] = None,
+    output_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--output-dir",
+            help="Split the export into numbered files in this directory, listed "
+            "by a manifest.json. With several projects, it must contain "
+            f"{PROJECT_ID_PLACEHOLDER}",
+            file_okay=False,
+            show_default=False,
+        ),
+    ] = None,
+    max_issues_per_file: Annotated[
+        int | None,
+        typer.Option(
+            "--max-issues-per-file",
+            help="Start a new --output-dir file after N issues",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
+    max_bytes: Annotated[
+        int | None,
+        typer.Option(
+            "--max-bytes",
+            help="Start a new --output-dir file once it reaches N bytes",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            help="Maximum number of projects exported at once",
+            min=1,
+        ),
+    ] = 4,
+    per_domain: Annotated[
+        int,
+        typer.Option(
+            "--per-domain",
+            help="Maximum number of projects exported at once from the same "
+            "Jira domain",
+            min=1,
+        ),
+    ] = 2,
+    rate: Annotated[
+        float,
+        typer.Option(
+            "--rate",
+            help="Maximum number of Jira API requests started per second, per "
+            "Jira domain",
+            min=0.1,
+        ),
+    ] = REQUEST_RATE,
+    compression: Annotated[
+        Compression | None,
+        typer.Option(
+            "--compress",
+            help="Compress the --output file, or the --output-dir files, as they "
+            "are written",
+            case_sensitive=False,
+            show_default=False,
+        ),
+    ] = None,
+    checkpoint: Annotated[
+        Path | None,
+        typer.Option(
+            "--checkpoint",
+            help="Store fetched pages in this directory while exporting, so that "
+            "an interrupted export can be continued with --resume",
+            file_okay=False,
+            show_default=False,
+        ),
+    ] = None,
+    attachments_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--attachments",
+            help="Download the attachments of the exported issues to this "
+            "directory, stored once per content, and list them in an "
+            "attachments field. Attachments already stored are skipped",
+            file_okay=False,
+            show_default=False,
+        ),
+    ] = None,
+    attachment_workers: Annotated[
+        int,
+        typer.Option(
+            "--attachment-workers",
+            help="Maximum number of attachments downloaded at once, per project",
+            min=1,
+        ),
+    ] = ATTACHMENT_WORKERS,
+    diff_against: Annotated[
+        Path | None,
+        typer.Option(
+            "--diff-against",
+            help="Only output the issues added, changed or removed since the "
+            "export indexed by this file, as JSON lines, then update the index. "
+            f"With several projects, it must contain {PROJECT_ID_PLACEHOLDER}",
+            dir_okay=False,
+            show_default=False,
+        ),
+    ] = None,
+    *,
+    all_projects: Annotated[
+        bool,
+        typer.Option("--all", help="Export every configured project"),
+    ] = False,
+    progress: Annotated[
+        bool,
+        typer.Option(
+            help="Show a progress bar on stderr. It is never shown when stderr "
+            "is not a terminal",
+        ),
+    ] = True,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Only fetch issues updated since the previous incremental export "
+            "and merge them into the --output file or directory",
+        ),
+    ] = False,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help="Continue the export stored in --checkpoint instead of starting over",
+        ),
+    ] = False,
+    include_changelog: Annotated[
+        bool,
+        typer.Option(
+            "--include-changelog",
+            help="Add the change history of each issue as a changelog field, "
+            "fetched in bulk while the issues are searched",
+        ),
+    ] = False,
 ):
-    project_id = prompt_project_id(project_id, ctx=ctx)
+    from rich.progress import Progress
 
-    app_state: AppState = ctx.obj
-    config = app_state.load_config()
-    project = config.get_and_load_project(project_id)
-
-    jira = project.get_jira()
-    all_issues: list[Issue] = []
-    nextToken = None
-
-    query = f'project="{project.project}"'
-    if jql:
-        query = f"{query} and ({jql})"
-
-    with Progress(transient=True) as progress:
-        count = jira.approximate_issue_count(query)
-        task = progress.add_task("Fetching issues...", total=count)
-
-        while True:
-            logger.debug("Fetching issues, nextToken=%s", nextToken)
-            result = cast(
-                ResultList[Issue],
-                jira.enhanced_search_issues(
-                    query,
-                    maxResults=250,
-                    nextPageToken=nextToken,
-                ),
+    from jira_export.exporter import ExportOptions, export_project, parse_extra_fields
+    from jira_export.fetch.scheduler import get_scheduler
+    from jira_export.models.watermarks import Watermarks
+
+    if resume and checkpoint is None:
+        raise typer.BadParameter(
+            "--resume requires --checkpoint", param_hint="--resume"
+        )
+
+    if output is not None and output_dir is not None:
+        raise typer.BadParameter(
+            "--output cannot be combined with --output-dir", param_hint="--output-dir"
+        )
+    if output_dir is None and (max_issues_per_file or max_bytes):
+        option = "--max-issues-per-file" if max_issues_per_file else "--max-bytes"
+        raise typer.BadParameter(f"{option} requires --output-dir", param_hint=option)
+    destination = output or output_dir
+
+    if diff_against is not None:
+        if output_dir is not None or incremental:
+            option = "--output-dir" if output_dir is not None else "--incremental"
+            raise typer.BadParameter(
+                f"--diff-against cannot be combined with {option}",
+                param_hint="--diff-against",
+            )
+        if ctx.get_parameter_source("output_format") is not ParameterSource.DEFAULT:
+            raise typer.BadParameter(
+                "--diff-against always writes JSON lines", param_hint="--format"
             )
 
-            issues = list(result)
-            all_issues.extend(issues)
-            nextToken = result.nextPageToken if issues else None
+    if incremental and destination is None:
+        raise typer.BadParameter(
+            "--incremental requires --output or --output-dir",
+            param_hint="--incremental",
+        )
 
-            if not issues:
-                break
+    try:
+        writer_cls = writer_for(output_format)
+    except ImportError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--format") from exc
+    if writer_cls.binary and destination is None:
+        raise typer.BadParameter(
+            f"--format {output_format.value} requires --output or --output-dir",
+            param_hint="--format",
+        )
 
-            progress.update(task, advance=len(issues))
+    if compression is not None:
+        if destination is None:
+            raise typer.BadParameter(
+                "--compress requires --output or --output-dir", param_hint="--compress"
+            )
+        if writer_cls.binary:
+            raise typer.BadParameter(
+                f"--format {output_format.value} is already compressed",
+                param_hint="--compress",
+            )
+        if compression is Compression.ZSTD:
+            try:
+                require_zstandard()
+            except ImportError as exc:
+                raise typer.BadParameter(str(exc), param_hint="--compress") from exc
 
-            if not nextToken:
-                break
+    app_state: AppState = ctx.obj
+    config = app_state.load_config()
 
-    output: str
-    output_dict = {
-        "issues": [ProjectItem.from_issue(issue).__dict__ for issue in all_issues]
-    }
+    if all_projects:
+        if project_ids:
+            raise typer.BadParameter(
+                "--all cannot be combined with --project-id", param_hint="--all"
+            )
+        project_ids = list(config.projects)
+        if not project_ids:
+            raise typer.BadParameter(
+                "No projects configured. Run 'jira-export projects add' first.",
+            )
+    elif not project_ids:
+        project_ids = [prompt_project_id(None, ctx=ctx)]
 
-    match output_format:
-        case OutputFormat.TOML:
-            import toml
+    project_ids = list(dict.fromkeys(project_ids))
+    several = len(project_ids) > 1
+    if several and (
+        destination is None
+        or PROJECT_ID_PLACEHOLDER not in str(destination)
+        or (diff_against and PROJECT_ID_PLACEHOLDER not in str(diff_against))
+    ):
+        raise typer.BadParameter(
+            f"exporting several projects requires an --output or --output-dir "
+            f"path, and any --diff-against path, containing {PROJECT_ID_PLACEHOLDER}",
+            param_hint="--output-dir" if output_dir else "--output",
+        )
 
-            output = toml.dumps(output_dict)
-        case OutputFormat.JSON:
-            import json
+    projects = config.load_projects(project_ids, app_state.credentials)
+    outputs = {
+        project_id: Path(str(output).replace(PROJECT_ID_PLACEHOLDER, project_id))
+        for project_id in project_ids
+        if output is not None
+    }
+    output_dirs = {
+        project_id: Path(str(output_dir).replace(PROJECT_ID_PLACEHOLDER, project_id))
+        for project_id in project_ids
+        if output_dir is not None
+    }
 
-            output = json.dumps(output_dict, indent=2)
-        case _:
-            logger.error("Unsupported output format: %s", output_format)
-            raise typer.Exit(code=1)
+    options = ExportOptions(
+        output_format=output_format,
+        jql=jql,
+        extra_fields=parse_extra_fields(extra_fields or []),
+        parallel=parallel,
+        incremental=incremental,
+        compression=compression,
+        resume=resume,
+        max_issues_per_file=max_issues_per_file,
+        max_bytes_per_file=max_bytes,
+        include_changelog=include_changelog,
+        attachments_dir=attachments_dir,
+        attachment_workers=attachment_workers,
+        rate=rate,
+    )
+    checkpoints = {
+        project_id: checkpoint / project_id
+        for project_id in project_ids
+        if checkpoint is not None
+    }
+    diff_indexes = {
+        project_id: Path(str(diff_against).replace(PROJECT_ID_PLACEHOLDER, project_id))
+        for project_id in project_ids
+        if diff_against is not None
+    }
+    watermarks = Watermarks.load(app_state.watermarks_file) if incremental else None
 
-    typer.echo(
-        output.strip(),
-        err=False,
+    # Progress goes to stderr so that stdout only ever carries the document.
+    # It is hidden when nobody would see it, or when the document itself is
+    # printed to the terminal, and the issue count is then never fetched.
+    show_progress = (
+        progress
+        and err_console.is_terminal
+        and not (destination is None and sys.stdout.isatty())
     )
+    failed: list[str] = []
+
+    with Progress(
+        console=err_console,
+        transient=True,
+        redirect_stdout=False,
+        disable=not show_progress,
+    ) as progress_bar:
+        if several:
+            failed = _export_all(
+                projects,
+                outputs,
+                output_dirs,
+                checkpoints,
+                diff_indexes,
+                options,
+                progress=progress_bar,
+                watermarks=watermarks,
+                concurrency=concurrency,
+                per_domain=per_domain,
+            )
+        else:
+            (project_id,) = project_ids
+            result = export_project(
+                projects[project_id],
+                options,
+                progress=progress_bar,
+                output=outputs.get(project_id),
+                output_dir=output_dirs.get(project_id),
+                count_issues=show_progress,
+                watermark=watermarks.projects.get(project_id) if watermarks else None,
+                checkpoint=checkpoints.get(project_id),
+                diff_against=diff_indexes.get(project_id),
+            )
+            if watermarks is not None and result.watermark is not None:
+                watermarks.projects[project_id] = result.watermark
+
+    for domain in dict.fromkeys(project.domain for project in projects.values()):
+        stats = get_scheduler(domain).stats
+        if stats.retries:
+            logger.info(
+                "Retried %d request(s) to %s, %d of them rate limited, after "
+                "waiting %.1fs",
+                stats.retries,
+                domain,
+                stats.rate_limited,
+                stats.throttled_seconds,
+            )
+
+    if watermarks is not None:
+        watermarks.save(app_state.watermarks_file)
+
+    if failed:
+        logger.error(
+            "Failed to export %d project(s): %s", len(failed), ", ".join(failed)
+        )
+        raise typer.Exit(code=1)
@@ -1,24 +1,29 @@
 import logging
-from typing import Annotated
+from enum import Enum
+from typing import TYPE_CHECKING, Annotated
 
-import questionary
 import typer
-from pydantic import SecretStr
-from rich.panel import Panel
-from rich.table import Table
 
 from jira_export.console import console
-from jira_export.models.app_state import AppState
-from jira_export.models.project import LoadedProject
 from jira_export.utils.options import ProjectId, prompt_project_id
 
+if TYPE_CHECKING:
+    from jira_export.models.app_state import AppState
+
 projects = typer.Typer(name="projects", no_args_is_help=True)
 
 logger = logging.getLogger(__name__)
 
 
+class Scheme(Enum):
+    HTTPS = "https"
+    HTTP = "http"
+
+
 @projects.command("list")
 def list_projects(ctx: typer.Context):
+    from rich.table import Table
+
     app_state: AppState = ctx.obj
     config = app_state.load_config()
 
@@ -68,7 +73,19 @@ def add_project(
             hide_input=True,
         ),
     ],
+    scheme: Annotated[
+        Scheme | None,
+        typer.Option(
+            "--scheme",
+            help="URL scheme of the Jira server. Only use http for local test servers",
+            show_default=False,
+        ),
+    ] = None,
 ):
+    from pydantic import SecretStr
+
+    from jira_export.models.project import LoadedProject
+
     app_state: AppState = ctx.obj
     config = app_state.load_config()
 
@@ -88,6 +105,7 @@ def add_project(
         domain=domain,
         project=project,
         api_key=SecretStr(api_key),
+        scheme=scheme.value if scheme else None,
     )
 
     new_project.save()
@@ -102,6 +120,8 @@ def remove_project(
     ctx: typer.Context,
     project_id: ProjectId = None,
 ):
+    import questionary
+
     app_state: AppState = ctx.obj
     config = app_state.load_config()
 
@@ -130,7 +150,7 @@ def ping_project(
     config = app_state.load_config()
 
     project_id = prompt_project_id(project_id, ctx=ctx)
-    project = config.get_and_load_project(project_id)
+    project = config.get_and_load_project(project_id, app_state.credentials)
 
     try:
         jira = project.get_jira()
@@ -140,6 +160,8 @@ def ping_project(
         )
         return
     except Exception as e:
+        from rich.panel import Panel
+
         console.print(
             Panel(
                 f"Failed to ping project: {e}",
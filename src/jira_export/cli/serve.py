@@ -0,0 +1,65 @@
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+from jira_export.console import err_console
+
+if TYPE_CHECKING:
+    from jira_export.models.app_state import AppState
+
+serve = typer.Typer(name="serve")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+@serve.callback(invoke_without_command=True)
+def serve_callback(
+    ctx: typer.Context,
+    host: Annotated[
+        str,
+        typer.Option(
+            "--host",
+            help="Address to listen on. Jobs run with the configured API keys, "
+            "so only bind other addresses on trusted networks, with --token",
+        ),
+    ] = "127.0.0.1",
+    port: Annotated[
+        int,
+        typer.Option("--port", help="Port to listen on, or 0 for any free port"),
+    ] = DEFAULT_PORT,
+    token: Annotated[
+        str | None,
+        typer.Option(
+            "--token",
+            envvar="JIRA_EXPORT_SERVE_TOKEN",
+            help="Require every request to send this token as an "
+            "'Authorization: Bearer' header. Required for non-local addresses",
+            show_default=False,
+        ),
+    ] = None,
+):
+    """Keep clients warm and run export jobs posted to a local HTTP API.
+
+    POST a JSON job such as {"project_id": "my-project", "format": "json"} to
+    /export, and the export is streamed back as it is fetched.
+    """  # noqa: DOC501 - the docstring is the command's help
+    from jira_export.server import ExportServer
+
+    if host not in LOCAL_HOSTS:
+        if not token:
+            raise typer.BadParameter(
+                "a --token is required to serve on a non-local address",
+                param_hint="--host",
+            )
+        logger.warning("Serving exports on %s, which is not a local address", host)
+
+    app_state: AppState = ctx.obj
+    with ExportServer((host, port), app_state, token=token or None) as server:
+        err_console.print(f"Serving exports on {server.base_url}")
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
@@ -0,0 +1,85 @@
+import contextlib
+import logging
+import sys
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+from jira_export.utils.options import ProjectId, prompt_project_id
+
+if TYPE_CHECKING:
+    from jira_export.models.app_state import AppState
+
+watch = typer.Typer(name="watch")
+
+logger = logging.getLogger(__name__)
+
+
+@watch.callback(invoke_without_command=True)
+def watch_callback(
+    ctx: typer.Context,
+    project_id: ProjectId = None,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--interval",
+            help="Seconds between the start of two polls",
+            min=1,
+        ),
+    ] = 60,
+    jql: Annotated[
+        str | None,
+        typer.Option(
+            "--jql",
+            "-j",
+            help="Jira Query Language (JQL) query to filter issues",
+            show_default=False,
+        ),
+    ] = None,
+    extra_fields: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--fields",
+            help="Additional Jira fields to export, by ID or JQL name. Repeat the "
+            "option or separate fields with commas",
+            show_default=False,
+        ),
+    ] = None,
+    since: Annotated[
+        datetime | None,
+        typer.Option(
+            "--since",
+            help="Only emit issues updated since this date (UTC unless an offset "
+            "is given). By default, every issue is emitted by the first poll",
+            show_default=False,
+        ),
+    ] = None,
+):
+    """Poll a project and print new or updated issues as JSON lines.
+
+    Each line is one issue, in the same form as the items of a JSON export.
+    Issues fetched again by consecutive polls are only printed if they changed.
+    """
+    from jira_export.exporter import ExportOptions, parse_extra_fields
+    from jira_export.watcher import watch_project
+    from jira_export.writers.ndjson_writer import NdjsonWriter
+
+    app_state: AppState = ctx.obj
+    project_id = prompt_project_id(project_id, ctx=ctx)
+    config = app_state.load_config()
+    project = config.get_and_load_project(project_id, app_state.credentials)
+
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    options = ExportOptions(
+        jql=jql, extra_fields=parse_extra_fields(extra_fields or [])
+    )
+
+    # A consumer closing the pipe, or Ctrl+C, ends the watch.
+    with (
+        contextlib.suppress(KeyboardInterrupt, BrokenPipeError),
+        NdjsonWriter(sys.stdout) as writer,
+    ):
+        for items in watch_project(project, options, interval=interval, since=since):
+            writer.write(items)
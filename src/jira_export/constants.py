@@ -1 +1,7 @@
 APP_NAME = "jira-export"
+
+ATTACHMENT_WORKERS = 4
+# Jira API requests started per second, per domain.
+REQUEST_RATE = 10.0
+# Attachment downloads started per second, per export.
+ATTACHMENT_RATE = 100.0
@@ -0,0 +1,413 @@
+"""Export the issues of a single project, as used by the `export` command."""
+
+import functools
+import logging
+import shutil
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+from jira import JIRA
+from rich.progress import Progress
+
+from jira_export.constants import ATTACHMENT_RATE, REQUEST_RATE
+from jira_export.fetch.attachments import ATTACHMENT_WORKERS, AttachmentStore
+from jira_export.fetch.changelog import fetch_changelogs
+from jira_export.fetch.checkpoint import Checkpoint
+from jira_export.fetch.incremental import (
+    cap_watermark,
+    latest_update,
+    merge_items,
+    updated_since,
+)
+from jira_export.fetch.lookahead import iter_ahead
+from jira_export.fetch.pages import (
+    RawIssue,
+    iter_issue_page_tokens,
+    resolve_field_ids,
+)
+from jira_export.fetch.scheduler import RequestScheduler, get_scheduler
+from jira_export.fetch.shards import iter_sharded_pages
+from jira_export.models.project import DEFAULT_POOL_SIZE, LoadedProject
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.base import IssueWriter
+from jira_export.writers.compression import Compression, open_file
+from jira_export.writers.diff import DiffWriter
+from jira_export.writers.formats import OutputFormat, read_items, writer_for
+from jira_export.writers.split import SplitWriter, read_split_items
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExportOptions:
+    output_format: OutputFormat = OutputFormat.TOML
+    jql: str | None = None
+    extra_fields: list[str] = field(default_factory=list)
+    parallel: int = 1
+    incremental: bool = False
+    compression: Compression | None = None
+    # Continue from the checkpoint passed to `export_project`, if there is one.
+    resume: bool = False
+    # Limits of each file written to the `output_dir` of `export_project`.
+    max_issues_per_file: int | None = None
+    max_bytes_per_file: int | None = None
+    # Attach the changes of every issue to it, as a `changelog` extra field.
+    include_changelog: bool = False
+    # Download attachments to this directory, and list them as an
+    # `attachments` extra field.
+    attachments_dir: Path | None = None
+    attachment_workers: int = ATTACHMENT_WORKERS
+    # Jira API requests started per second against the project's domain.
+    rate: float = REQUEST_RATE
+
+    @property
+    def fields(self) -> list[str]:
+        fields = [*ProjectItem.jira_fields(), *self.extra_fields]
+        if self.incremental:
+            fields.append("updated")
+        if self.attachments_dir is not None:
+            fields.append("attachment")
+
+        return fields
+
+    @property
+    def api_requests(self) -> int:
+        """Jira API requests that one export may have in flight at once.
+
+        >>> ExportOptions().api_requests
+        2
+        >>> ExportOptions(parallel=4, include_changelog=True).api_requests
+        6
+
+        Returns:
+            int: The search workers, plus the issue count and the changelog
+                lookups that overlap with them.
+        """
+        return self.parallel + 1 + int(self.include_changelog)
+
+    @property
+    def connections(self) -> int:
+        """Connections that one export may use at once.
+
+        Returns:
+            int: The API requests, plus the attachment downloads.
+        """
+        downloads = self.attachment_workers if self.attachments_dir else 0
+        return self.api_requests + downloads
+
+
+@dataclass
+class ExportResult:
+    issues: int
+    watermark: datetime | None
+
+
+def parse_extra_fields(values: Iterable[str]) -> list[str]:
+    """Split comma-separated field lists, dropping the fields always exported.
+
+    Returns:
+        list[str]: The extra fields, in order.
+
+    >>> parse_extra_fields(["labels, priority", "key"])
+    ['labels', 'priority']
+    """
+    return [
+        name
+        for value in values
+        for name in map(str.strip, value.split(","))
+        if name and name not in ProjectItem.field_names()
+    ]
+
+
+def build_query(project: LoadedProject, jql: str | None) -> str:
+    query = f'project="{project.project}"'
+    if jql:
+        query = f"{query} and ({jql})"
+
+    return query
+
+
+def _count_or_none(count_future: Future[int]) -> int | None:
+    try:
+        return count_future.result()
+    except Exception as exc:  # noqa: BLE001 - the count is only informative
+        logger.debug("Could not count issues: %s", exc)
+        return None
+
+
+def _serial_pages(
+    jira: JIRA,
+    query: str,
+    options: ExportOptions,
+    scheduler: RequestScheduler,
+    checkpoint: Checkpoint | None,
+) -> Iterator[list[RawIssue]]:
+    fetch = functools.partial(
+        iter_issue_page_tokens, jira, query, fields=options.fields, scheduler=scheduler
+    )
+    if checkpoint is None:
+        return (page for page, _ in fetch())
+
+    checkpoint.plan(lambda: [query])
+    return checkpoint.iter_pages(0, fetch)
+
+
+def _with_lookups(
+    items: Iterable[ProjectItem], lookups: Mapping[str, Mapping[str, list[Any]]]
+) -> Iterator[ProjectItem]:
+    for item in items:
+        item.extra = {
+            **item.extra,
+            **{name: values.get(item.key, []) for name, values in lookups.items()},
+        }
+        yield item
+
+
+def _discard_on_error(path: Path) -> Callable[..., None]:
+    # A failed export leaves the previous output, if any, untouched.
+    def discard(exc_type: type[BaseException] | None, *_: object) -> None:
+        if exc_type is None:
+            return
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink(missing_ok=True)
+
+    return discard
+
+
+def _replace(partial: Path, target: Path) -> None:
+    if not partial.is_dir():
+        partial.replace(target)
+        return
+
+    # Directories cannot be replaced in one step, so the previous one is only
+    # removed once the new one is in place.
+    previous = target.with_name(f"{target.name}.previous")
+    # Left behind if a previous replace was interrupted.
+    shutil.rmtree(previous, ignore_errors=True)
+    if target.exists():
+        target.rename(previous)
+    partial.rename(target)
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def export_project(
+    project: LoadedProject,
+    options: ExportOptions,
+    *,
+    progress: Progress,
+    output: Path | None = None,
+    output_dir: Path | None = None,
+    description: str = "Fetching issues...",
+    count_issues: bool = True,
+    watermark: datetime | None = None,
+    checkpoint: Path | None = None,
+    stream: IO[Any] | None = None,
+    diff_against: Path | None = None,
+) -> ExportResult:
+    """Export `project` to `output`, or to `stream` when there is no output file.
+
+    `stream` defaults to stdout, and is left open.
+
+    With `output_dir`, the export is split into files of at most
+    `options.max_issues_per_file` issues or `options.max_bytes_per_file`
+    bytes in that directory instead, listed by its `manifest.json`.
+
+    With `options.incremental`, only issues updated since `watermark` are
+    fetched and merged into the existing output. The output is written
+    through a `.partial` file or directory, and only replaced once the export
+    is complete.
+
+    Fetched pages are stored in the `checkpoint` directory, if given, which is
+    removed once the export completes. With `options.resume`, the export
+    continues from the pages stored by a previous, interrupted run.
+
+    With `diff_against`, only the changes since the snapshot indexed by that
+    file are written, as JSON lines, and the index is updated (see
+    `DiffWriter`).
+
+    Returns:
+        ExportResult: The number of issues fetched and the new watermark,
+            capped by `cap_watermark`.
+    """
+    jira = project.get_jira(pool_size=max(DEFAULT_POOL_SIZE, options.connections))
+    scheduler = get_scheduler(
+        project.domain, max_concurrency=options.api_requests, rate=options.rate
+    )
+    query = build_query(project, options.jql)
+    writer_cls = writer_for(options.output_format)
+    field_ids = resolve_field_ids(jira, options.extra_fields, scheduler=scheduler)
+
+    started = datetime.now(UTC)
+    latest: datetime | None = None
+    previous: list[ProjectItem] | None = None
+    target = output_dir or output
+    if options.incremental and watermark and target and target.exists():
+        latest = watermark
+        previous = (
+            read_split_items(target)
+            if output_dir
+            else read_items(target, options.output_format, options.compression)
+        )
+
+        time_zone = scheduler.call(jira.myself)["timeZone"]
+        query = f"{query} and {updated_since(watermark, time_zone)}"
+        logger.debug("Incremental export of %s since %s", project.project, watermark)
+
+    stored_pages = (
+        Checkpoint(
+            checkpoint,
+            {
+                "domain": project.domain,
+                "query": query,
+                "fields": options.fields,
+                "sharded": options.parallel > 1,
+            },
+            resume=options.resume,
+        )
+        if checkpoint
+        else None
+    )
+
+    partial = target.with_name(f"{target.name}.partial") if target else None
+    fetched = 0
+
+    with ExitStack() as stack:
+        if partial:
+            stack.push(_discard_on_error(partial))
+
+        writer: IssueWriter | SplitWriter
+        if output_dir and partial:
+            shutil.rmtree(partial, ignore_errors=True)
+            writer = stack.enter_context(
+                SplitWriter(
+                    partial,
+                    options.output_format,
+                    compression=options.compression,
+                    max_issues=options.max_issues_per_file,
+                    max_bytes=options.max_bytes_per_file,
+                )
+            )
+        else:
+            mode = "wb" if writer_cls.binary else "w"
+            stream = (
+                stack.enter_context(open_file(partial, mode, options.compression))
+                if partial
+                else stream or sys.stdout
+            )
+            writer = stack.enter_context(
+                DiffWriter(stream, diff_against) if diff_against else writer_cls(stream)
+            )
+        task = progress.add_task(description, total=None)
+
+        # The count only sizes the progress bar (and the shards), so it is
+        # fetched alongside the first page rather than before it.
+        count_future: Future[int] | None = None
+        if count_issues or options.parallel > 1:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="count")
+            stack.callback(executor.shutdown, wait=False, cancel_futures=True)
+            count_future = executor.submit(
+                scheduler.call, jira.approximate_issue_count, query
+            )
+
+        count = None
+        if options.parallel > 1 and count_future is not None:
+            count = _count_or_none(count_future)
+            progress.update(task, total=count)
+            count_future = None
+
+        pages = (
+            iter_sharded_pages(
+                jira,
+                query,
+                workers=options.parallel,
+                count=count,
+                fields=options.fields,
+                scheduler=scheduler,
+                checkpoint=stored_pages,
+            )
+            if options.parallel > 1
+            else _serial_pages(jira, query, options, scheduler, stored_pages)
+        )
+        # Extra fields fetched by page, alongside the search of the next pages.
+        lookups: dict[str, Callable[[list[RawIssue]], Mapping[str, list[Any]]]] = {}
+        if options.include_changelog:
+            lookups["changelog"] = functools.partial(
+                fetch_changelogs, jira, scheduler=scheduler
+            )
+        attachments: AttachmentStore | None = None
+        if options.attachments_dir is not None:
+            attachments = stack.enter_context(
+                AttachmentStore(
+                    options.attachments_dir,
+                    jira,
+                    domain=project.domain,
+                    workers=options.attachment_workers,
+                    # Downloads are bounded by the workers, and retried, but
+                    # do not wait for the rate of the API requests.
+                    scheduler=RequestScheduler(
+                        rate=ATTACHMENT_RATE,
+                        burst=options.attachment_workers,
+                        max_concurrency=options.attachment_workers,
+                    ),
+                )
+            )
+            lookups["attachments"] = attachments.store_page
+
+        looked_up_pages = (
+            iter_ahead(
+                pages, lambda page: {name: fn(page) for name, fn in lookups.items()}
+            )
+            if lookups
+            else ((page, None) for page in pages)
+        )
+        changed: dict[str, ProjectItem] = {}
+        for issues, found in looked_up_pages:
+            if options.incremental:
+                latest = latest_update(issues, latest)
+
+            items = (
+                ProjectItem.from_raw(issue, options.extra_fields, field_ids)
+                for issue in issues
+            )
+            if found is not None:
+                items = _with_lookups(items, found)
+            if previous is None:
+                writer.write(items)
+            else:
+                changed.update((item.key, item) for item in items)
+
+            fetched += len(issues)
+            progress.update(task, advance=len(issues))
+            if count_future is not None and count_future.done():
+                progress.update(task, total=_count_or_none(count_future))
+                count_future = None
+
+        if previous is not None:
+            logger.debug("Merging %d changed issue(s)", len(changed))
+            writer.write(merge_items(previous, changed))
+
+    if attachments is not None:
+        logger.info(
+            "Downloaded %d attachment(s) of %s, %d already stored",
+            attachments.downloaded,
+            project.project,
+            attachments.skipped,
+        )
+    if target and partial:
+        _replace(partial, target)
+    # The index describes the output, so it is only updated once the output
+    # is in place.
+    if isinstance(writer, DiffWriter):
+        writer.commit_index()
+    if stored_pages:
+        stored_pages.remove()
+
+    return ExportResult(issues=fetched, watermark=cap_watermark(latest, started))
@@ -0,0 +1 @@
+"""Helpers for fetching issues from the Jira API."""
@@ -0,0 +1,143 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from jira import JIRA
+
+from jira_export.constants import ATTACHMENT_WORKERS
+from jira_export.fetch.pages import RawIssue
+from jira_export.fetch.scheduler import RequestScheduler, scheduled
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+# An attachment of an exported issue, pointing at its stored content.
+type StoredAttachment = dict[str, Any]
+
+
+class AttachmentStore:
+    """Download the attachments of exported issues into `directory`.
+
+    Contents are stored once per SHA-256 under `sha256/`, whatever issue or
+    file name they belong to, and streamed to disk `CHUNK_SIZE` bytes at a
+    time. `refs/<domain>/<attachment ID>` records where each attachment was
+    stored, so that attachments downloaded by a previous export are skipped:
+    Jira never changes the content of an attachment once uploaded.
+
+    At most `workers` downloads run at once, across every page.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        jira: JIRA,
+        *,
+        domain: str,
+        workers: int = ATTACHMENT_WORKERS,
+        scheduler: RequestScheduler | None = None,
+    ):
+        self.directory = directory
+        self.jira = jira
+        self.downloaded = 0
+        self.skipped = 0
+
+        self._refs = directory / "refs" / domain
+        self._refs.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._download = scheduled(self._download_content, scheduler)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="attachment"
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._executor.shutdown(cancel_futures=exc_type is not None)
+
+    def _download_content(self, url: str) -> str:
+        # The client's session holds the credentials and raises on errors.
+        response = self.jira._session.get(url, stream=True)
+        digest = hashlib.sha256()
+        fd, name = tempfile.mkstemp(dir=self.directory, prefix=".download-")
+        tmp = Path(name)
+        try:
+            with closing(response), os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+        sha = digest.hexdigest()
+        path = Path("sha256", sha[:2], sha)
+        target = self.directory / path
+        if target.exists():
+            tmp.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp.replace(target)
+
+        return path.as_posix()
+
+    def _store(self, attachment: dict[str, Any]) -> StoredAttachment:
+        ref = self._refs / str(attachment["id"])
+        try:
+            path = ref.read_text()
+        except FileNotFoundError:
+            path = None
+
+        if path is not None and (self.directory / path).exists():
+            with self._lock:
+                self.skipped += 1
+        else:
+            path = self._download(attachment["content"])
+            tmp = ref.with_name(f"{ref.name}.tmp")
+            tmp.write_text(path)
+            tmp.replace(ref)
+            with self._lock:
+                self.downloaded += 1
+
+        return {
+            "id": attachment["id"],
+            "filename": attachment.get("filename"),
+            "mimeType": attachment.get("mimeType"),
+            "size": attachment.get("size"),
+            "path": path,
+        }
+
+    def store_page(self, issues: list[RawIssue]) -> dict[str, list[StoredAttachment]]:
+        """Download the attachments of `issues` that are not stored yet.
+
+        Returns:
+            dict[str, list[StoredAttachment]]: The attachments of each issue,
+                by key, with their `path` relative to `directory`. Issues
+                without attachments are left out.
+        """
+        futures = {
+            issue["key"]: [
+                self._executor.submit(self._store, attachment)
+                for attachment in issue["fields"].get("attachment") or ()
+            ]
+            for issue in issues
+        }
+
+        return {
+            key: [f.result() for f in stored]
+            for key, stored in futures.items()
+            if stored
+        }
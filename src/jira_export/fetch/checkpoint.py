@@ -0,0 +1,149 @@
+import json
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from jira_export.fetch.pages import RawIssue
+from jira_export.models.errors import CheckpointMismatchError
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# Fetch a shard from a `nextPageToken`, yielding each page with the token that
+# follows it, as `iter_issue_page_tokens` does.
+type PageFetcher = Callable[[str | None], Iterator[tuple[list[RawIssue], str | None]]]
+
+
+def _write_atomic(path: Path, data: Any) -> None:
+    # Written aside then renamed, so a crash never leaves a truncated file.
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp.replace(path)
+
+
+class Checkpoint:
+    """Persist fetched pages and pagination progress so an export can resume.
+
+    Every page is written to `directory` before it is handed to the export,
+    together with the `nextPageToken` that follows it in its shard. Resuming
+    replays the stored pages, then continues each shard from its last token,
+    so the export sees exactly the pages of an uninterrupted run.
+
+    `fingerprint` identifies the export (query, fields...): resuming a
+    checkpoint written with another fingerprint raises
+    `CheckpointMismatchError`.
+    """
+
+    def __init__(
+        self, directory: Path, fingerprint: dict[str, Any], *, resume: bool = False
+    ):
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._shards: list[dict[str, Any]] | None = None
+
+        state = self._load() if resume else None
+        if state is None:
+            self.clear()
+        elif state.get("fingerprint") != fingerprint:
+            raise CheckpointMismatchError(directory)
+        else:
+            self._shards = state["shards"]
+            logger.info(
+                "Resuming from %d stored page(s) in %s",
+                sum(shard["pages"] for shard in self._shards),
+                directory,
+            )
+
+    @property
+    def _state_file(self) -> Path:
+        return self.directory / "state.json"
+
+    def _page_file(self, shard: int, page: int) -> Path:
+        return self.directory / f"{shard:03d}-{page:06d}.json"
+
+    def _load(self) -> dict[str, Any] | None:
+        try:
+            state = json.loads(self._state_file.read_text())
+        except FileNotFoundError:
+            logger.info("No checkpoint in %s, starting from scratch", self.directory)
+            return None
+
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise CheckpointMismatchError(self.directory)
+
+        return state
+
+    def _save(self) -> None:
+        _write_atomic(
+            self._state_file,
+            {
+                "version": CHECKPOINT_VERSION,
+                "fingerprint": self.fingerprint,
+                "shards": self._shards,
+            },
+        )
+
+    def clear(self) -> None:
+        self.remove()
+        self.directory.mkdir(parents=True)
+
+    def remove(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def plan(self, plan: Callable[[], list[str]]) -> list[str]:
+        """Return the shard queries stored in the checkpoint, or plan and store them.
+
+        Returns:
+            list[str]: The queries of the shards, in order.
+        """
+        with self._lock:
+            if self._shards is None:
+                self._shards = [
+                    {"query": query, "pages": 0, "next_token": None, "done": False}
+                    for query in plan()
+                ]
+                self._save()
+
+            return [shard["query"] for shard in self._shards]
+
+    def iter_pages(self, shard: int, fetch: PageFetcher) -> Iterator[list[RawIssue]]:
+        """Replay the stored pages of `shard`, then fetch and store the others.
+
+        Yields:
+            list[RawIssue]: Every page of the shard, in order.
+
+        Raises:
+            RuntimeError: If the shards have not been planned yet.
+        """
+        if self._shards is None:
+            raise RuntimeError("Checkpoint.plan must be called first")
+
+        state = self._shards[shard]
+        for index in range(state["pages"]):
+            yield json.loads(self._page_file(shard, index).read_text())
+
+        if state["done"]:
+            return
+
+        for page, next_token in fetch(state["next_token"]):
+            _write_atomic(self._page_file(shard, state["pages"]), page)
+            with self._lock:
+                state["pages"] += 1
+                state["next_token"] = next_token
+                state["done"] = next_token is None
+                self._save()
+
+            yield page
+
+        with self._lock:
+            state["done"] = True
+            self._save()
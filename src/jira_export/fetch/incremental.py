@@ -0,0 +1,84 @@
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from jira_export.fetch.pages import RawIssue
+from jira_export.models.project_item import ProjectItem
+
+# Watermarks never pass this long before the export started: an issue fetched
+# early may be updated again before the export ends, and the Jira and local
+# clocks may disagree.
+WATERMARK_MARGIN = timedelta(minutes=5)
+
+
+def updated_since(watermark: datetime, time_zone: str) -> str:
+    """Build a JQL clause matching issues updated at or after `watermark`.
+
+    JQL dates are read in the Jira user's time zone and only have minute
+    precision, so the bound is rounded down: the last exported issues are
+    fetched again rather than risking a gap. Without time zone data the
+    window is widened by a day instead.
+
+    Returns:
+        str: The `updated >= ...` clause.
+
+    >>> updated_since(datetime(2024, 1, 1, 12, 30, 45, tzinfo=UTC), "Europe/Paris")
+    'updated >= "2024/01/01 13:30"'
+    """
+    try:
+        local = watermark.astimezone(ZoneInfo(time_zone))
+    except ZoneInfoNotFoundError:
+        local = watermark.astimezone(UTC) - timedelta(days=1)
+
+    return f'updated >= "{local:%Y/%m/%d %H:%M}"'
+
+
+def latest_update(
+    issues: Iterable[RawIssue], current: datetime | None
+) -> datetime | None:
+    """Return the most recent `updated` timestamp among `issues` and `current`.
+
+    Returns:
+        datetime | None: The new watermark, or `current` if `issues` is empty.
+    """
+    for issue in issues:
+        updated = datetime.fromisoformat(issue["fields"]["updated"])
+        if current is None or updated > current:
+            current = updated
+
+    return current
+
+
+def cap_watermark(watermark: datetime | None, started: datetime) -> datetime | None:
+    """Keep `watermark` from passing the start of the export, minus a margin.
+
+    Issues fetched on the first pages may be updated again while the last
+    pages are fetched, after the latest `updated` timestamp of the export.
+    The next export starts from the capped watermark so as not to miss them.
+
+    Returns:
+        datetime | None: `watermark`, at most `WATERMARK_MARGIN` before `started`.
+
+    >>> started = datetime(2024, 1, 1, 10, 10, tzinfo=UTC)
+    >>> cap_watermark(datetime(2024, 1, 1, 10, 8, tzinfo=UTC), started)
+    datetime.datetime(2024, 1, 1, 10, 5, tzinfo=datetime.timezone.utc)
+    """
+    if watermark is None:
+        return None
+
+    return min(watermark, started - WATERMARK_MARGIN)
+
+
+def merge_items(
+    previous: Iterable[ProjectItem], changed: dict[str, ProjectItem]
+) -> Iterator[ProjectItem]:
+    """Replace `previous` items by their `changed` version, then add new ones.
+
+    Yields:
+        ProjectItem: Items in their previous order, followed by new issues.
+    """
+    remaining = dict(changed)
+    for item in previous:
+        yield remaining.pop(item.key, item)
+
+    yield from remaining.values()
@@ -0,0 +1,40 @@
+import collections
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Pages whose lookups run ahead of the page being written.
+PAGES_AHEAD = 2
+
+
+def iter_ahead[T, R](
+    items: Iterable[T], fetch: Callable[[T], R], *, workers: int = PAGES_AHEAD
+) -> Iterator[tuple[T, R]]:
+    """Run `fetch` on each item in the background, while the next are produced.
+
+    `fetch` runs at most `workers` items ahead of the item being yielded,
+    which bounds the memory held for the results.
+
+    Yields:
+        tuple[T, R]: Each item, in order, with the result of `fetch` for it.
+
+    >>> list(iter_ahead([1, 2, 3], lambda n: n * 10))
+    [(1, 10), (2, 20), (3, 30)]
+    """
+    pending: collections.deque[tuple[T, Future[R]]] = collections.deque()
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="ahead"
+    ) as executor:
+        try:
+            for item in items:
+                pending.append((item, executor.submit(fetch, item)))
+                if len(pending) > workers:
+                    ready, future = pending.popleft()
+                    yield ready, future.result()
+
+            while pending:
+                ready, future = pending.popleft()
+                yield ready, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
@@ -0,0 +1,105 @@
+import logging
+from collections.abc import Iterator, Sequence
+from typing import Any, cast
+
+from jira import JIRA
+
+from jira_export.fetch.scheduler import RequestScheduler, scheduled
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 250
+
+# An issue as found in the search response, before any `jira.Issue` parsing.
+type RawIssue = dict[str, Any]
+
+
+def resolve_field_ids(
+    jira: JIRA,
+    names: Sequence[str],
+    *,
+    scheduler: RequestScheduler | None = None,
+) -> dict[str, str]:
+    """Map fields requested by JQL name, such as "Story Points", to their ID.
+
+    Raw search results are keyed by field ID, whatever `fields` asked for.
+    Names that are not known clause names, such as IDs, map to themselves.
+
+    Returns:
+        dict[str, str]: The ID of each of `names`.
+    """
+    if not names:
+        return {}
+
+    # The client loads its cache of clause names from the fields endpoint once,
+    # and uses it to translate the `fields` of every search.
+    cache = scheduled(lambda: jira._fields_cache, scheduler)()
+    return {name: cache.get(name, name) for name in names}
+
+
+def iter_issue_page_tokens(
+    jira: JIRA,
+    query: str,
+    page_token: str | None = None,
+    *,
+    fields: Sequence[str] | None = None,
+    page_size: int = PAGE_SIZE,
+    scheduler: RequestScheduler | None = None,
+) -> Iterator[tuple[list[RawIssue], str | None]]:
+    """Fetch the issues matching `query` one page at a time, as raw JSON.
+
+    Pagination starts at `page_token` when given. Only `fields` are requested
+    when given, instead of every field of the issue. Pages are not turned
+    into `jira.Issue` resources, whose construction costs more than the rest
+    of the export.
+
+    Yields:
+        tuple[list[RawIssue], str | None]: Each non-empty page, with the
+            `nextPageToken` of the following one, or None after the last.
+    """
+    search = scheduled(jira.enhanced_search_issues, scheduler)
+    next_token = page_token
+
+    while True:
+        logger.debug("Fetching issues, nextToken=%s", next_token)
+        response = cast(
+            dict[str, Any],
+            search(
+                query,
+                maxResults=page_size,
+                nextPageToken=next_token,
+                # The client rewrites the list in place, so pass a fresh one.
+                fields=list(fields) if fields is not None else None,
+                json_result=True,
+            ),
+        )
+
+        issues = response.get("issues") or []
+        if not issues:
+            return
+
+        next_token = response.get("nextPageToken") or None
+        yield issues, next_token
+
+        if not next_token:
+            return
+
+
+def iter_issue_pages(
+    jira: JIRA,
+    query: str,
+    *,
+    fields: Sequence[str] | None = None,
+    page_size: int = PAGE_SIZE,
+    scheduler: RequestScheduler | None = None,
+) -> Iterator[list[RawIssue]]:
+    """Fetch the issues matching `query` one page at a time, as raw JSON.
+
+    Yields:
+        list[RawIssue]: Each non-empty page, following `nextPageToken` until
+            exhausted.
+    """
+    for page, _ in iter_issue_page_tokens(
+        jira, query, fields=fields, page_size=page_size, scheduler=scheduler
+    ):
+        yield page
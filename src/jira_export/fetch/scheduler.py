@@ -0,0 +1,248 @@
+import functools
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from requests import ConnectionError as RequestsConnectionError
+from requests import Response, Timeout
+
+from jira_export.constants import REQUEST_RATE
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+@dataclass
+class SchedulerStats:
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    # Summed over workers, so it can exceed the wall-clock time of the export.
+    throttled_seconds: float = 0.0
+
+
+def _retry_after(response: Response | None) -> float | None:
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(
+            0.0, (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds()
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """Throttle and retry idempotent Jira requests issued by concurrent workers.
+
+    Requests draw from a token bucket refilled at `rate` per second, holding up
+    to `burst` tokens (one second worth by default), and at most
+    `concurrency_limit` run at once. The limit grows by one every `limit`
+    successful requests and halves on each 429 (AIMD), between 1 and
+    `max_concurrency`. A 429 pauses every worker until its `Retry-After` has
+    elapsed; other transient failures are retried with jittered exponential
+    backoff, up to `max_retries` times per request.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = REQUEST_RATE,
+        burst: int | None = None,
+        max_concurrency: int = 8,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        rng: random.Random | None = None,
+    ):
+        self.rate = rate
+        self.burst = burst or max(1, math.ceil(rate))
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = SchedulerStats()
+
+        self._rng = rng or random.Random()  # noqa: S311 - only used for jitter
+        self._condition = threading.Condition()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._paused_until = 0.0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(1, int(self._limit))
+
+    def set_rate(self, rate: float) -> None:
+        with self._condition:
+            self.rate = rate
+            self.burst = max(1, math.ceil(rate))
+            self._tokens = min(self._tokens, self.burst)
+            self._condition.notify_all()
+
+    def call[**P, T](self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run `fn`, waiting for capacity first and retrying transient failures.
+
+        Errors that are not retryable, or still happen after `max_retries`
+        retries, are re-raised as is.
+
+        Returns:
+            T: The value returned by `fn`.
+        """
+        attempt = 0
+
+        while True:
+            self._acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                delay = self._on_failure(exc, attempt)
+                if delay is None:
+                    raise
+
+                attempt += 1
+                logger.debug(
+                    "Retrying %s in %.1fs (attempt %d): %s",
+                    getattr(fn, "__name__", fn),
+                    delay,
+                    attempt,
+                    exc,
+                )
+                time.sleep(delay)
+                continue
+
+            self._on_success()
+            return result
+
+    def _acquire(self) -> None:
+        started = time.monotonic()
+
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = None
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._in_flight < self.concurrency_limit:
+                    self._tokens = min(
+                        self.burst, self._tokens + (now - self._refilled_at) * self.rate
+                    )
+                    self._refilled_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._in_flight += 1
+                        self.stats.requests += 1
+                        self.stats.throttled_seconds += now - started
+                        return
+
+                    wait = (1 - self._tokens) / self.rate
+
+                self._condition.wait(wait)
+
+    def _on_success(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def _on_failure(self, exc: Exception, attempt: int) -> float | None:
+        status_code = getattr(exc, "status_code", None)
+        retryable = status_code in RETRYABLE_STATUS_CODES or isinstance(
+            exc, RequestsConnectionError | Timeout
+        )
+
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+            if not retryable or attempt >= self.max_retries:
+                return None
+
+            self.stats.retries += 1
+            retry_after = _retry_after(getattr(exc, "response", None))
+
+            if status_code == 429:
+                self.stats.rate_limited += 1
+                self._limit = max(1.0, self._limit / 2)
+                # Everyone waits for the server, not only the rejected request.
+                pause = (
+                    retry_after if retry_after is not None else self._backoff(attempt)
+                )
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                # The pause itself is counted by `_acquire`.
+                jitter = self._rng.uniform(0, self.base_delay)
+                self.stats.throttled_seconds += jitter
+                return jitter
+
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            self.stats.throttled_seconds += delay
+            return delay
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: spread retries of concurrent workers over the window.
+        return self._rng.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+def scheduled[**P, T](
+    fn: Callable[P, T], scheduler: RequestScheduler | None
+) -> Callable[P, T]:
+    """Route calls to `fn` through `scheduler`, if there is one.
+
+    Returns:
+        Callable[P, T]: `fn` itself, or a wrapper calling it via the scheduler.
+    """
+    if scheduler is None:
+        return fn
+
+    return functools.partial(scheduler.call, fn)
+
+
+_schedulers: dict[str, RequestScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(
+    domain: str, *, max_concurrency: int = 8, rate: float | None = None
+) -> RequestScheduler:
+    """Return the scheduler shared by every export against `domain`.
+
+    The scheduler is created with `rate` (`REQUEST_RATE` by default). Later
+    calls may raise its `max_concurrency`, and change its `rate`.
+
+    Returns:
+        RequestScheduler: The scheduler, created on first use.
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(domain)
+        if scheduler is None:
+            scheduler = _schedulers[domain] = RequestScheduler(
+                rate=REQUEST_RATE if rate is None else rate,
+                max_concurrency=max_concurrency,
+            )
+        elif max_concurrency > scheduler.max_concurrency:
+            scheduler.max_concurrency = max_concurrency
+        if rate is not None and rate != scheduler.rate:
+            scheduler.set_rate(rate)
+
+        return scheduler
+
+
+def clear_schedulers():
+    with _schedulers_lock:
+        _schedulers.clear()
@@ -0,0 +1,183 @@
+import functools
+import heapq
+import logging
+import math
+import queue
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import batched, pairwise
+from typing import Any, cast
+
+from jira import JIRA
+
+from jira_export.fetch.checkpoint import Checkpoint
+from jira_export.fetch.pages import PAGE_SIZE, RawIssue, iter_issue_page_tokens
+from jira_export.fetch.scheduler import RequestScheduler, scheduled
+from jira_export.models.project_item import issue_sort_key
+
+logger = logging.getLogger(__name__)
+
+# Pages buffered per shard before its worker waits for the merge to catch up.
+SHARD_BUFFER_PAGES = 4
+
+_JQL_DATETIME_FORMAT = "%Y/%m/%d %H:%M"
+_DONE = object()
+
+
+def _created_edge(
+    jira: JIRA, query: str, order: str, scheduler: RequestScheduler | None
+) -> datetime | None:
+    response = cast(
+        dict[str, Any],
+        scheduled(jira.enhanced_search_issues, scheduler)(
+            f"{query} ORDER BY created {order}",
+            maxResults=1,
+            fields=["created"],
+            json_result=True,
+        ),
+    )
+    issues = response.get("issues")
+    if not issues:
+        return None
+
+    return datetime.fromisoformat(issues[0]["fields"]["created"])
+
+
+def plan_created_shards(
+    jira: JIRA,
+    query: str,
+    shards: int,
+    *,
+    scheduler: RequestScheduler | None = None,
+) -> list[str]:
+    """Split `query` into at most `shards` disjoint queries over `created` windows.
+
+    The first and last windows are open-ended, so issues created while the
+    export runs (or timezone differences between the client and the Jira
+    profile) can never fall between two shards.
+
+    Returns:
+        list[str]: Queries that together match exactly the issues of `query`.
+    """
+    if shards <= 1:
+        return [query]
+
+    oldest = _created_edge(jira, query, "ASC", scheduler)
+    newest = _created_edge(jira, query, "DESC", scheduler)
+    if oldest is None or newest is None:
+        return [query]
+
+    step = (newest - oldest) / shards
+    bounds = sorted(
+        {(oldest + step * i).strftime(_JQL_DATETIME_FORMAT) for i in range(1, shards)}
+    )
+    if not bounds:
+        return [query]
+
+    clauses = [f'created < "{bounds[0]}"']
+    clauses.extend(
+        f'created >= "{lower}" and created < "{upper}"'
+        for lower, upper in pairwise(bounds)
+    )
+    clauses.append(f'created >= "{bounds[-1]}"')
+
+    return [f"{query} and {clause}" for clause in clauses]
+
+
+def _fetch_shard(
+    pages: Iterator[list[RawIssue]],
+    out: queue.Queue,
+    cancelled: threading.Event,
+) -> None:
+    def put(item: object) -> None:
+        while not cancelled.is_set():
+            try:
+                out.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return
+
+    try:
+        for page in pages:
+            put(page)
+            if cancelled.is_set():
+                return
+        put(_DONE)
+    except Exception as exc:  # noqa: BLE001 - re-raised by the consumer
+        put(exc)
+
+
+def _drain(out: queue.Queue) -> Iterator[RawIssue]:
+    while (page := out.get()) is not _DONE:
+        if isinstance(page, Exception):
+            raise page
+        yield from page
+
+
+def iter_sharded_pages(
+    jira: JIRA,
+    query: str,
+    *,
+    workers: int,
+    count: int | None,
+    fields: Sequence[str] | None = None,
+    page_size: int = PAGE_SIZE,
+    scheduler: RequestScheduler | None = None,
+    checkpoint: Checkpoint | None = None,
+) -> Iterator[list[RawIssue]]:
+    """Fetch `query` as concurrent `created` shards, merged in key order.
+
+    `count` (usually from `approximate_issue_count`) caps the number of shards
+    so that small projects are not split into mostly empty windows; without
+    it, one shard is planned per worker. Each shard
+    buffers at most `SHARD_BUFFER_PAGES` pages ahead of the merge. With a
+    `checkpoint`, the shards and their progress are stored there, and resumed
+    from it.
+
+    Yields:
+        list[RawIssue]: Pages of up to `page_size` issues, in ascending key order.
+    """
+    shards = (
+        workers if count is None else max(1, min(workers, math.ceil(count / page_size)))
+    )
+
+    def plan() -> list[str]:
+        return plan_created_shards(jira, query, shards, scheduler=scheduler)
+
+    queries = checkpoint.plan(plan) if checkpoint else plan()
+    logger.debug("Fetching %d shard(s) with %d worker(s)", len(queries), shards)
+
+    cancelled = threading.Event()
+    outputs = [queue.Queue(maxsize=SHARD_BUFFER_PAGES) for _ in queries]
+
+    # One worker per shard: the merge needs the head of every shard to advance.
+    with ThreadPoolExecutor(
+        max_workers=len(queries), thread_name_prefix="shard"
+    ) as executor:
+        for index, (shard_query, out) in enumerate(zip(queries, outputs, strict=True)):
+            fetch = functools.partial(
+                iter_issue_page_tokens,
+                jira,
+                f"{shard_query} ORDER BY key ASC",
+                fields=fields,
+                page_size=page_size,
+                scheduler=scheduler,
+            )
+            pages = (
+                checkpoint.iter_pages(index, fetch)
+                if checkpoint
+                else (page for page, _ in fetch())
+            )
+            executor.submit(_fetch_shard, pages, out, cancelled)
+
+        try:
+            merged = heapq.merge(
+                *(_drain(out) for out in outputs),
+                key=lambda issue: issue_sort_key(issue["key"]),
+            )
+            for page in batched(merged, page_size):
+                yield list(page)
+        finally:
+            cancelled.set()
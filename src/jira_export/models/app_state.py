@@ -2,15 +2,27 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from jira_export.models.config import Config
+from jira_export.models.credentials import CredentialResolver
 
 
 @dataclass
 class AppState:
     __config: Config | None = field(default=None, init=False)
     config_file: Path
+    # Resolves and caches API keys for the whole command.
+    credentials: CredentialResolver = field(default_factory=CredentialResolver)
 
     def load_config(self) -> Config:
         if self.__config is None:
-            self.__config = Config.load(self.config_file)
+            self.__config = Config.load(self.config_file, cache=self.config_cache_file)
 
         return self.__config
+
+    @property
+    def config_cache_file(self) -> Path:
+        # Hidden, as it is only ever read back by `Config.load`.
+        return self.config_file.with_name(f".{self.config_file.name}.cache")
+
+    @property
+    def watermarks_file(self) -> Path:
+        return self.config_file.with_name("watermarks.toml")
@@ -1,40 +1,144 @@
+import json
 import logging
+import tomllib
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from pathlib import Path
+from typing import Any
 
 import toml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from jira_export.models.credentials import CredentialResolver
 from jira_export.models.errors import ProjectNotFoundError
 from jira_export.models.project import LoadedProject, Project
 
 logger = logging.getLogger(__name__)
 
 
+class LazyProjects(MutableMapping[str, Project]):
+    """Project profiles by ID, each validated the first time it is accessed.
+
+    Commands usually touch a single profile, so the others are kept as parsed
+    from the config file, and written back as is by `Config.save`.
+    """
+
+    def __init__(self, projects: Mapping[str, Project | dict[str, Any]] | None = None):
+        self._projects: dict[str, Project | dict[str, Any]] = dict(projects or {})
+
+    def __getitem__(self, project_id: str) -> Project:
+        project = self._projects[project_id]
+        if not isinstance(project, Project):
+            project = self._projects[project_id] = Project.model_validate(project)
+
+        return project
+
+    def __setitem__(self, project_id: str, project: Project) -> None:
+        self._projects[project_id] = project
+
+    def __delitem__(self, project_id: str) -> None:
+        del self._projects[project_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._projects)
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def __contains__(self, project_id: object) -> bool:
+        return project_id in self._projects
+
+    def dump(self) -> dict[str, dict[str, Any]]:
+        """Serialize the profiles, without validating those never accessed.
+
+        Returns:
+            dict[str, dict[str, Any]]: The profiles, as written to the file.
+        """
+        return {
+            project_id: project.model_dump(exclude_none=True)
+            if isinstance(project, Project)
+            else project
+            for project_id, project in self._projects.items()
+        }
+
+
+def _read_cache(cache: Path, stat_key: list[int]) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(cache.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("stat") != stat_key:
+        return None
+
+    return cached["data"]
+
+
+def _write_cache(cache: Path, stat_key: list[int], data: dict[str, Any]) -> None:
+    tmp = cache.with_name(f"{cache.name}.tmp")
+    try:
+        tmp.write_text(json.dumps({"stat": stat_key, "data": data}))
+        tmp.replace(cache)
+    except (OSError, TypeError) as exc:
+        # Only a shortcut for the next command, which can parse the file again.
+        logger.debug("Could not cache config in %s: %s", cache, exc)
+
+
 class Config(BaseModel):
-    projects: dict[str, Project] = Field(default_factory=dict)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    projects: LazyProjects = Field(default_factory=LazyProjects)
 
+    @field_validator("projects", mode="before")
     @classmethod
-    def load(cls, path: Path) -> "Config":
-        if not path.exists():
+    def _lazy_projects(cls, projects: Mapping[str, Any]) -> LazyProjects:
+        if isinstance(projects, LazyProjects):
+            return projects
+
+        return LazyProjects(projects)
+
+    @classmethod
+    def load(cls, path: Path, cache: Path | None = None) -> "Config":
+        """Parse the config file at `path`, leaving projects unvalidated.
+
+        With `cache`, the parsed file is stored there as JSON, and reused as
+        long as the file keeps the same modification time and size.
+
+        Returns:
+            Config: The configuration, empty if `path` does not exist.
+
+        Raises:
+            ValueError: If the file is not valid TOML.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             logger.debug("Config file %s does not exist. Returning empty config.", path)
             return cls()
 
-        logger.debug("Loading config file %s", path)
-        try:
-            data = toml.loads(path.read_text())
-        except toml.TomlDecodeError as exc:
-            raise ValueError(
-                f"Failed to parse config file '{path}': {exc}"
-            ) from exc
+        stat_key = [stat.st_mtime_ns, stat.st_size]
+        data = _read_cache(cache, stat_key) if cache else None
+        if data is not None:
+            logger.debug("Loading config file %s from %s", path, cache)
+        else:
+            logger.debug("Loading config file %s", path)
+            try:
+                data = tomllib.loads(path.read_text())
+            except tomllib.TOMLDecodeError as exc:
+                raise ValueError(
+                    f"Failed to parse config file '{path}': {exc}"
+                ) from exc
 
-        return cls.model_validate(data)
+            if cache:
+                _write_cache(cache, stat_key, data)
+
+        return cls(projects=LazyProjects(data.get("projects", {})))
 
     def save(self, path: Path):
         path.parent.mkdir(exist_ok=True, parents=True)
 
         logger.debug("Saving config file %s", path)
         with path.open("w") as f:
-            toml.dump(self.model_dump(exclude_none=True), f)
+            toml.dump({"projects": self.projects.dump()}, f)
 
     def get_project(self, project_id: str) -> Project:
         project = self.projects.get(project_id)
@@ -49,5 +153,27 @@ class Config(BaseModel):
         project.delete_api_key()
         del self.projects[project_id]
 
-    def get_and_load_project(self, project_id: str) -> LoadedProject:
-        return self.get_project(project_id).load()
+    def load_projects(
+        self,
+        project_ids: Iterable[str],
+        credentials: CredentialResolver | None = None,
+    ) -> dict[str, LoadedProject]:
+        """Load several projects, resolving their API keys in one batch.
+
+        Returns:
+            dict[str, LoadedProject]: The loaded projects, by project ID.
+        """
+        projects = {
+            project_id: self.get_project(project_id) for project_id in project_ids
+        }
+        api_keys = (credentials or CredentialResolver()).resolve(projects)
+
+        return {
+            project_id: project.load(api_keys[project_id])
+            for project_id, project in projects.items()
+        }
+
+    def get_and_load_project(
+        self, project_id: str, credentials: CredentialResolver | None = None
+    ) -> LoadedProject:
+        return self.load_projects([project_id], credentials)[project_id]
@@ -0,0 +1,152 @@
+import logging
+import os
+import re
+import time
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import SecretStr
+
+if TYPE_CHECKING:
+    from jira_export.models.project import _Project
+
+logger = logging.getLogger(__name__)
+
+API_KEY_ENV = "JIRA_EXPORT_API_KEY"
+
+_ENV_LINE = re.compile(r"\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*")
+
+
+def api_key_env_names(project_id: str) -> list[str]:
+    """Variables holding the API key of `project_id`, most specific first.
+
+    Returns:
+        list[str]: The project's own variable, then the one shared by every
+            project.
+
+    >>> api_key_env_names("my-project")
+    ['JIRA_EXPORT_API_KEY_MY_PROJECT', 'JIRA_EXPORT_API_KEY']
+    """
+    suffix = re.sub(r"[^A-Za-z0-9]", "_", project_id).upper()
+    return [f"{API_KEY_ENV}_{suffix}", API_KEY_ENV]
+
+
+def read_env_file(path: Path) -> dict[str, str]:
+    """Parse `NAME=value` lines, as written in a `.env` file.
+
+    Blank lines and `#` comments are skipped, and values may be quoted.
+
+    Returns:
+        dict[str, str]: The variables defined in the file.
+    """
+    variables: dict[str, str] = {}
+    for line in path.read_text().splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+
+        match = _ENV_LINE.fullmatch(line)
+        if match is None:
+            logger.warning("Ignoring malformed line in %s: %s", path, line)
+            continue
+
+        name, value = match.groups()
+        for quote in "'\"":
+            if len(value) > 1 and value.startswith(quote) and value.endswith(quote):
+                value = value[1:-1]
+                break
+        variables[name] = value
+
+    return variables
+
+
+class CredentialResolver:
+    """Resolve the API keys of projects once per command, from every source.
+
+    A key is looked up in the environment, then in `env_file`, under the
+    names of `api_key_env_names`; the keyring is only queried for projects
+    that have none. Keyring lookups are shared by projects with the same
+    domain, project and user, and every resolved key is cached, so that slow
+    keyring backends are queried at most once per key.
+    """
+
+    def __init__(
+        self,
+        *,
+        env_file: Path | None = None,
+        environ: Mapping[str, str] | None = None,
+    ):
+        self.env_file = env_file
+        self.environ = os.environ if environ is None else environ
+        self._file_variables: dict[str, str] | None = None
+        self._keyring: dict[tuple[str, str, str], str | None] = {}
+        self._resolved: dict[str, SecretStr] = {}
+
+    def _file(self) -> Mapping[str, str]:
+        if self._file_variables is None:
+            self._file_variables = (
+                read_env_file(self.env_file) if self.env_file is not None else {}
+            )
+
+        return self._file_variables
+
+    def _from_variables(self, project_id: str) -> tuple[str, str] | None:
+        for name in api_key_env_names(project_id):
+            if value := self.environ.get(name):
+                return value, "environment"
+            if value := self._file().get(name):
+                return value, "env file"
+
+        return None
+
+    def resolve(self, projects: Mapping[str, "_Project"]) -> dict[str, SecretStr]:
+        """Resolve the API key of every project in `projects`, by project ID.
+
+        Returns:
+            dict[str, SecretStr]: The API key of each project.
+
+        Raises:
+            ValueError: If a project has no API key in any source.
+        """
+        started = time.perf_counter()
+        sources: Counter[str] = Counter()
+        keyring_seconds = 0.0
+
+        for project_id, project in projects.items():
+            if project_id in self._resolved:
+                sources["cache"] += 1
+                continue
+
+            found = self._from_variables(project_id)
+            if found is None:
+                keyring_key = (project.domain, project.project, project.user)
+                if keyring_key not in self._keyring:
+                    keyring_started = time.perf_counter()
+                    self._keyring[keyring_key] = project.read_api_key()
+                    keyring_seconds += time.perf_counter() - keyring_started
+                    sources["keyring"] += 1
+                else:
+                    sources["cache"] += 1
+                secret = self._keyring[keyring_key]
+            else:
+                secret, source = found
+                sources[source] += 1
+
+            if secret is None:
+                names = " or ".join(api_key_env_names(project_id))
+                raise ValueError(
+                    f"API key for project ID '{project_id}' not found in keyring, "
+                    f"nor in {names}."
+                )
+            self._resolved[project_id] = SecretStr(secret)
+
+        logger.debug(
+            "Resolved %d API key(s) in %.0fms (%s), %.0fms of it in the keyring",
+            len(projects),
+            (time.perf_counter() - started) * 1000,
+            ", ".join(f"{source}: {count}" for source, count in sources.items())
+            or "none",
+            keyring_seconds * 1000,
+        )
+        return {project_id: self._resolved[project_id] for project_id in projects}
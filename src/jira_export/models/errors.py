@@ -28,3 +28,12 @@ class ProjectNotFoundError(UsageError):
             console.export_text(styles=True),
             ctx=ctx,
         )
+
+
+class CheckpointMismatchError(UsageError):
+    def __init__(self, directory: Path, ctx: Context | None = None):
+        super().__init__(
+            f"The checkpoint in '{directory}' was written by a different export. "
+            "Run the same export again to resume it, or drop --resume to start over.",
+            ctx=ctx,
+        )
@@ -1,26 +1,55 @@
 import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
 
-import keyring
-from jira import JIRA
-from keyring.errors import PasswordDeleteError
 from pydantic import BaseModel, SecretStr
-from rich.panel import Panel
 
 from jira_export.constants import APP_NAME
 
+# `jira`, `keyring` and `rich` are imported where they are used: commands that
+# never talk to Jira or the keyring should not pay for importing them.
+if TYPE_CHECKING:
+    from jira import JIRA
+    from rich.panel import Panel
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_SIZE = 10
+
+
+@dataclass
+class _CachedClient:
+    api_key: str
+    client: "JIRA"
+    pool_size: int = 0
+
+
+_clients: dict[tuple[str, str], _CachedClient] = {}
+_clients_lock = threading.Lock()
+
+
+def clear_jira_clients():
+    with _clients_lock:
+        for cached in _clients.values():
+            cached.client.close()
+        _clients.clear()
+
 
 class _Project(BaseModel):
     user: str
     domain: str
     project: str
+    # Only set to "http" for local test servers; Jira Cloud requires https.
+    scheme: Literal["https", "http"] | None = None
 
     @property
     def _project_key(self) -> str:
         return f"{APP_NAME}-{self.domain}-{self.project}"
 
-    def to_rich(self, project_id: str | None = None) -> Panel:
+    def to_rich(self, project_id: str | None = None) -> "Panel":
+        from rich.panel import Panel
+
         return Panel(
             f"[bold]User:[/bold] {self.user}\n"
             f"[bold]Domain:[/bold] {self.domain}\n"
@@ -29,10 +58,17 @@ class _Project(BaseModel):
         )
 
     def set_api_key(self, api_key: SecretStr):
+        import keyring
+
         keyring.set_password(self._project_key, self.user, api_key.get_secret_value())
 
+    def read_api_key(self) -> str | None:
+        import keyring
+
+        return keyring.get_password(self._project_key, self.user)
+
     def get_api_key(self) -> SecretStr:
-        secret = keyring.get_password(self._project_key, self.user)
+        secret = self.read_api_key()
 
         if secret is None:
             raise ValueError(
@@ -42,6 +78,9 @@ class _Project(BaseModel):
         return SecretStr(secret)
 
     def delete_api_key(self):
+        import keyring
+        from keyring.errors import PasswordDeleteError
+
         try:
             keyring.delete_password(self._project_key, self.user)
         except PasswordDeleteError:
@@ -54,20 +93,57 @@ class _Project(BaseModel):
 class Project(_Project):
     api_key: None = None
 
-    def load(self) -> "LoadedProject":
-        api_key = self.get_api_key()
+    def load(self, api_key: SecretStr | None = None) -> "LoadedProject":
+        api_key = api_key or self.get_api_key()
         return LoadedProject(**self.model_dump(exclude={"api_key"}), api_key=api_key)
 
 
 class LoadedProject(_Project):
     api_key: SecretStr
 
-    def get_jira(self) -> JIRA:
-        logger.debug("Creating JIRA client for project %s", self.project)
-        return JIRA(
-            server=f"https://{self.domain}",
-            basic_auth=(self.user, self.api_key.get_secret_value()),
-        )
+    def get_jira(
+        self, *, pool_size: int = DEFAULT_POOL_SIZE, get_server_info: bool = False
+    ) -> "JIRA":
+        """Return the client shared by every project on this domain and user.
+
+        The client keeps its connections alive between calls, and its pool is
+        grown to `pool_size` so that concurrent requests do not open and
+        discard connections. The server info probe is skipped unless
+        `get_server_info` is set, since profiles always target Jira Cloud.
+
+        Returns:
+            JIRA: A client authenticated with this project's credentials.
+        """
+        from jira import JIRA
+        from requests.adapters import HTTPAdapter
+
+        api_key = self.api_key.get_secret_value()
+        cache_key = (self.domain, self.user)
+
+        with _clients_lock:
+            cached = _clients.get(cache_key)
+            if cached is None or cached.api_key != api_key:
+                logger.debug("Creating JIRA client for project %s", self.project)
+                client = JIRA(
+                    server=f"{self.scheme or 'https'}://{self.domain}",
+                    basic_auth=(self.user, api_key),
+                    get_server_info=get_server_info,
+                    # Retries are left to `RequestScheduler`, which needs to
+                    # see rate limiting to adapt its concurrency.
+                    max_retries=0,
+                )
+                if not get_server_info:
+                    client.deploymentType = "Cloud"
+
+                cached = _clients[cache_key] = _CachedClient(api_key, client)
+
+            if pool_size > cached.pool_size:
+                adapter = HTTPAdapter(pool_maxsize=pool_size)
+                cached.client._session.mount("https://", adapter)
+                cached.client._session.mount("http://", adapter)
+                cached.pool_size = pool_size
+
+            return cached.client
 
     def save(self):
         self.set_api_key(self.api_key)
@@ -1,9 +1,32 @@
-from dataclasses import dataclass
+import functools
+import hashlib
+import json
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from jira import Issue
+if TYPE_CHECKING:
+    from jira import Issue
 
+# Shared by every item without extra fields, instead of one empty dict each.
+_NO_EXTRA: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+def issue_sort_key(key: str) -> tuple[str, int]:
+    """Sort issue keys the way Jira does, numerically within a project.
+
+    Returns:
+        tuple[str, int]: The project key and the issue number.
+
+    >>> sorted(["TEST-10", "TEST-9"], key=issue_sort_key)
+    ['TEST-9', 'TEST-10']
+    """
+    project, _, number = key.rpartition("-")
+    return project, int(number)
+
+
+@dataclass(slots=True)
 class ProjectItem:
     key: str
     summary: str
@@ -11,9 +34,30 @@ class ProjectItem:
     assignee: str | None
     reporter: str | None
     description: str | None
+    # Raw values of the additional Jira fields requested with `--fields`.
+    extra: Mapping[str, Any] = _NO_EXTRA
+
+    @classmethod
+    @functools.cache
+    def field_names(cls) -> tuple[str, ...]:
+        return tuple(f.name for f in fields(cls) if f.name != "extra")
+
+    @classmethod
+    def jira_fields(cls) -> list[str]:
+        """Jira fields read by `from_issue`, to pass as the search `fields`.
+
+        Returns:
+            list[str]: Every exported field except the issue key.
+
+        >>> ProjectItem.jira_fields()
+        ['summary', 'status', 'assignee', 'reporter', 'description']
+        """
+        return [name for name in cls.field_names() if name != "key"]
 
     @classmethod
-    def from_issue(cls, issue: Issue) -> "ProjectItem":
+    def from_issue(
+        cls, issue: "Issue", extra_fields: Sequence[str] = ()
+    ) -> "ProjectItem":
         return cls(
             key=issue.key,
             summary=issue.fields.summary,
@@ -25,4 +69,93 @@ class ProjectItem:
             if issue.fields.reporter
             else None,
             description=issue.fields.description,
+            extra={name: issue.raw["fields"].get(name) for name in extra_fields}
+            if extra_fields
+            else _NO_EXTRA,
+        )
+
+    @classmethod
+    def from_raw(
+        cls,
+        raw: dict[str, Any],
+        extra_fields: Sequence[str] = (),
+        field_ids: Mapping[str, str] | None = None,
+    ) -> "ProjectItem":
+        """Build an item from an issue of a search response, as `from_issue`.
+
+        Search results are keyed by field ID, so `field_ids` maps the extra
+        fields requested by name to their ID (see `resolve_field_ids`). Values
+        are stored under the requested name.
+
+        Returns:
+            ProjectItem: The item, without creating a `jira.Issue` first.
+
+        >>> raw = {"key": "A-1", "fields": {"status": {"name": "Done"}}}
+        >>> ProjectItem.from_raw(raw).status
+        'Done'
+        """
+        fields = raw["fields"]
+        status = fields.get("status")
+        assignee = fields.get("assignee")
+        reporter = fields.get("reporter")
+        return cls(
+            key=raw["key"],
+            summary=fields.get("summary"),
+            status=status["name"] if status else None,
+            assignee=assignee["displayName"] if assignee else None,
+            reporter=reporter["displayName"] if reporter else None,
+            description=fields.get("description"),
+            extra={
+                name: fields.get(field_ids.get(name, name) if field_ids else name)
+                for name in extra_fields
+            }
+            if extra_fields
+            else _NO_EXTRA,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProjectItem":
+        names = cls.field_names()
+        return cls(
+            *(data.get(name) for name in names),
+            extra={k: v for k, v in data.items() if k not in names} or _NO_EXTRA,
+        )
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over the serialized fields without building a dict.
+
+        Yields:
+            tuple[str, Any]: Field names and values, in `to_dict` order.
+        """
+        for name in self.field_names():
+            yield name, getattr(self, name)
+        yield from self.extra.items()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten the item, with extra fields after the built-in ones.
+
+        Returns:
+            dict[str, Any]: The serialized form used by every output format.
+        """
+        return dict(self.items())
+
+    def content_hash(self) -> bytes:
+        """Digest of every field, stable across runs and Python versions.
+
+        Fields are hashed as canonical JSON, so the digest does not depend on
+        the order of extra fields either.
+
+        Returns:
+            bytes: A 16-byte BLAKE2b digest.
+
+        >>> item = ProjectItem("A-1", "Summary", None, None, None, None)
+        >>> item.content_hash().hex()
+        '6fce9092b445d4e6141e66cb3fedc7bb'
+        >>> item.status = "Done"
+        >>> item.content_hash().hex()
+        '443277a64539ce62d89bdd33e78d44e3'
+        """
+        encoded = json.dumps(
+            self.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False
         )
+        return hashlib.blake2b(encoded.encode(), digest_size=16).digest()
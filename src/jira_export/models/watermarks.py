@@ -0,0 +1,37 @@
+import logging
+from datetime import datetime
+from pathlib import Path
+
+import toml
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class Watermarks(BaseModel):
+    """Latest `updated` timestamp exported for each project ID."""
+
+    projects: dict[str, datetime] = Field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Watermarks":
+        if not path.exists():
+            logger.debug("Watermarks file %s does not exist.", path)
+            return cls()
+
+        logger.debug("Loading watermarks file %s", path)
+        try:
+            data = toml.loads(path.read_text())
+        except toml.TomlDecodeError as exc:
+            raise ValueError(
+                f"Failed to parse watermarks file '{path}': {exc}"
+            ) from exc
+
+        return cls.model_validate(data)
+
+    def save(self, path: Path):
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        logger.debug("Saving watermarks file %s", path)
+        with path.open("w") as f:
+            toml.dump(self.model_dump(mode="json"), f)
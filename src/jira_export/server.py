@@ -0,0 +1,322 @@
+"""Serve exports over a local HTTP API, as used by the `serve` command.
+
+The configuration, API keys and Jira clients are loaded once and shared by
+every job, so that each export only pays for its own requests:
+
+    curl -N localhost:8765/export -H 'Content-Type: application/json' \
+        -d '{"project_id": "my-project", "format": "json"}'
+
+Jobs run with the configured API keys, so requests are only accepted with the
+server's own address as `Host` and no foreign `Origin`, which web pages cannot
+forge (even through DNS rebinding), or with the server's token.
+"""
+
+import hmac
+import io
+import json
+import logging
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, BinaryIO
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from rich.progress import Progress
+
+from jira_export.exporter import ExportOptions, export_project, parse_extra_fields
+from jira_export.models.app_state import AppState
+from jira_export.models.config import Config
+from jira_export.models.project import LoadedProject
+from jira_export.writers.formats import OutputFormat, writer_for
+
+logger = logging.getLogger(__name__)
+
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+# Bytes buffered before a chunk is sent, unless a writer flushes first.
+STREAM_BUFFER_SIZE = 64 * 1024
+# Jobs are small JSON documents, larger bodies are rejected unread.
+MAX_JOB_SIZE = 64 * 1024
+
+_CONTENT_TYPES = {
+    OutputFormat.TOML: "application/toml",
+    OutputFormat.JSON: "application/json",
+}
+
+
+class ExportJob(BaseModel):
+    """An export of one project, as posted to `/export`."""
+
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    project_id: str
+    jql: str | None = None
+    output_format: OutputFormat = Field(default=OutputFormat.TOML, alias="format")
+    fields: list[str] = Field(default_factory=list)
+    parallel: int = Field(default=1, ge=1)
+    include_changelog: bool = False
+
+    def options(self) -> ExportOptions:
+        return ExportOptions(
+            output_format=self.output_format,
+            jql=self.jql,
+            extra_fields=parse_extra_fields(self.fields),
+            parallel=self.parallel,
+            include_changelog=self.include_changelog,
+        )
+
+
+class _ChunkedStream(io.RawIOBase):
+    """Write each flushed buffer as one chunk of a chunked HTTP response."""
+
+    def __init__(self, wfile: BinaryIO):
+        self._wfile = wfile
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        size = len(data)
+        if size:
+            self._wfile.write(b"%x\r\n%s\r\n" % (size, bytes(data)))
+
+        return size
+
+    def finish(self) -> None:
+        self._wfile.write(b"0\r\n\r\n")
+
+
+class ExportHandler(BaseHTTPRequestHandler):
+    server: "ExportServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug(format, *args)
+
+    def _reject(self, status: HTTPStatus, error: str) -> None:
+        # The body of a rejected request is never read, so the connection
+        # cannot be used for another request.
+        self.close_connection = True
+        self._send(status, {"error": error})
+
+    def _authorized(self) -> bool:
+        """Check that the request comes from a local client, or has the token.
+
+        Returns:
+            bool: Whether the request may proceed. Otherwise, the error
+                response was sent and the connection will be closed.
+        """
+        if self.server.token is not None:
+            scheme, _, token = (self.headers.get("Authorization") or "").partition(" ")
+            if scheme.lower() == "bearer" and hmac.compare_digest(
+                token.encode(), self.server.token.encode()
+            ):
+                return True
+
+            self._reject(HTTPStatus.UNAUTHORIZED, "Missing or invalid token")
+            return False
+
+        origin = self.headers.get("Origin")
+        if self.headers.get("Host") not in self.server.allowed_hosts or (
+            origin is not None
+            and urlsplit(origin).netloc not in self.server.allowed_hosts
+        ):
+            self._reject(HTTPStatus.FORBIDDEN, "Requests must come from a local client")
+            return False
+
+        return True
+
+    def do_GET(self) -> None:
+        if not self._authorized():
+            return
+
+        match urlsplit(self.path).path:
+            case "/health":
+                self._send(HTTPStatus.OK, {"status": "ok"})
+            case "/projects":
+                self._send(
+                    HTTPStatus.OK, {"projects": list(self.server.config().projects)}
+                )
+            case path:
+                self._send(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {path}"})
+
+    def do_POST(self) -> None:
+        if not self._authorized():
+            return
+        path = urlsplit(self.path).path
+        if path != "/export":
+            self._reject(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+            return
+        # Web pages can only send other content types without a CORS preflight,
+        # which is never answered.
+        content_type = (self.headers.get("Content-Type") or "").partition(";")[0]
+        if content_type.strip().lower() != "application/json":
+            self._reject(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                "Jobs must be sent as application/json",
+            )
+            return
+        length = self.headers.get("Content-Length") or "0"
+        if not (length.isascii() and length.isdigit()):
+            self._reject(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {length}")
+            return
+        if int(length) > MAX_JOB_SIZE:
+            self._reject(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Jobs are limited to {MAX_JOB_SIZE} bytes",
+            )
+            return
+
+        body = self.rfile.read(int(length))
+
+        try:
+            job = ExportJob.model_validate_json(body or b"{}")
+        except ValidationError as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+
+        try:
+            writer_cls = writer_for(job.output_format)
+        except ImportError as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        if writer_cls.binary:
+            self._send(
+                HTTPStatus.BAD_REQUEST,
+                {"error": f"Format {job.output_format.value} cannot be streamed"},
+            )
+            return
+
+        config = self.server.config()
+        if job.project_id not in config.projects:
+            self._send(
+                HTTPStatus.NOT_FOUND,
+                {"error": f"Project with ID '{job.project_id}' not found in config."},
+            )
+            return
+        try:
+            project = self.server.load_project(config, job.project_id)
+        except ValueError as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+
+        self._stream_export(project, job)
+
+    def _stream_export(self, project: LoadedProject, job: ExportJob) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", _CONTENT_TYPES[job.output_format])
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        chunked = _ChunkedStream(self.wfile)
+        stream = io.TextIOWrapper(
+            io.BufferedWriter(chunked, STREAM_BUFFER_SIZE), encoding="utf-8"
+        )
+        started = time.perf_counter()
+        try:
+            result = export_project(
+                project,
+                job.options(),
+                progress=Progress(disable=True),
+                count_issues=False,
+                stream=stream,
+            )
+            stream.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning(
+                "Client disconnected during the export of %s", job.project_id
+            )
+            self.close_connection = True
+            return
+        except Exception:
+            # The status is already sent, so the response is cut short instead:
+            # without its last chunk, clients see it as incomplete.
+            logger.exception("Failed to export project %s", job.project_id)
+            self.close_connection = True
+            return
+
+        chunked.finish()
+        logger.info(
+            "Exported %d issue(s) from %s in %.1fs",
+            result.issues,
+            job.project_id,
+            time.perf_counter() - started,
+        )
+
+    def _send(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class ExportServer(ThreadingHTTPServer):
+    """Run export jobs concurrently, sharing warm state between them.
+
+    The configuration is only parsed again when its file changes. API keys are
+    cached by `app_state.credentials`, and Jira clients and request schedulers
+    are shared by domain, as in a single `export` command.
+
+    Without a `token`, only requests addressed to the server by its own
+    address, or by a loopback name when it listens on one, are accepted. With
+    it, every request needs it as an `Authorization: Bearer` header instead.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        app_state: AppState,
+        *,
+        token: str | None = None,
+    ):
+        super().__init__(address, ExportHandler)
+        self.app_state = app_state
+        self.token = token
+
+        host, port = self.server_address[:2]
+        names = LOOPBACK_HOSTS if host in LOOPBACK_HOSTS else (host,)
+        self.allowed_hosts = {
+            f"[{name}]:{port}" if ":" in name else f"{name}:{port}" for name in names
+        }
+        self._lock = threading.Lock()
+        self._config: Config | None = None
+        self._config_key: tuple[int, int] | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def config(self) -> Config:
+        """Return the configuration, reloaded if its file changed.
+
+        Returns:
+            Config: The current configuration.
+        """
+        try:
+            stat = self.app_state.config_file.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            key = None
+
+        with self._lock:
+            if self._config is None or key != self._config_key:
+                self._config = Config.load(
+                    self.app_state.config_file, cache=self.app_state.config_cache_file
+                )
+                self._config_key = key
+
+            return self._config
+
+    def load_project(self, config: Config, project_id: str) -> LoadedProject:
+        # The resolver is not thread-safe, and is only slow the first time.
+        with self._lock:
+            return config.get_and_load_project(project_id, self.app_state.credentials)
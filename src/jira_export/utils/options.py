@@ -1,11 +1,11 @@
 """Common CLI option helpers for selecting configured Jira projects."""
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
-import questionary
 import typer
 
-from jira_export.models.app_state import AppState
+if TYPE_CHECKING:
+    from jira_export.models.app_state import AppState
 
 ProjectId = Annotated[
     str | None,
@@ -17,12 +17,25 @@ ProjectId = Annotated[
     ),
 ]
 
+ProjectIds = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--project-id",
+        "-p",
+        help="Unique project ID. Repeat the option to use several projects",
+        prompt=False,
+        show_default=False,
+    ),
+]
+
 
 def prompt_project_id(project_id: str | None, ctx: typer.Context) -> str:
     app_state: AppState = ctx.obj
     config = app_state.load_config()
 
     if project_id is None:
+        import questionary
+
         choices = list(config.projects)
         if not choices:
             raise typer.BadParameter(
@@ -1,10 +1,10 @@
 import logging
 
-from rich.console import Console
-from rich.logging import RichHandler
-
 
 def setup_logs(*, verbose: bool) -> None:
+    from rich.console import Console
+    from rich.logging import RichHandler
+
     console = Console(stderr=True)
     logging.basicConfig(
         level=logging.DEBUG if verbose else logging.INFO,
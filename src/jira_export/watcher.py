@@ -0,0 +1,111 @@
+"""Poll a project for changed issues, as used by the `watch` command."""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+
+from jira_export.exporter import ExportOptions, build_query
+from jira_export.fetch.incremental import cap_watermark, latest_update, updated_since
+from jira_export.fetch.pages import iter_issue_page_tokens, resolve_field_ids
+from jira_export.fetch.scheduler import get_scheduler
+from jira_export.models.project import LoadedProject
+from jira_export.models.project_item import ProjectItem
+
+logger = logging.getLogger(__name__)
+
+
+def watch_project(
+    project: LoadedProject,
+    options: ExportOptions,
+    *,
+    interval: float,
+    since: datetime | None = None,
+    polls: int | None = None,
+    sleep: Callable[[float], None] | None = None,
+) -> Iterator[list[ProjectItem]]:
+    """Poll `project` every `interval` seconds for issues updated since the last poll.
+
+    The first poll fetches every issue updated since `since`, or every issue
+    without it. Each following poll starts from the latest `updated` timestamp
+    seen so far, capped as in `cap_watermark` and rounded down as in
+    `updated_since`, so the issues updated around it are fetched again: they
+    are only yielded again if their `updated` timestamp changed. The watermark
+    never moves back, so every unchanged issue a poll can fetch again was
+    fetched by the previous one. Issues are requested in update order, so a
+    failed poll is logged and the next one continues after the issues already
+    yielded.
+
+    The same client and scheduler are used by every poll. Stops after `polls`
+    polls, if given. Polls are spaced with `sleep`, `time.sleep` by default.
+
+    Yields:
+        list[ProjectItem]: Pages of new or updated issues, as they arrive.
+    """
+    jira = project.get_jira()
+    scheduler = get_scheduler(project.domain, rate=options.rate)
+    time_zone = scheduler.call(jira.myself)["timeZone"]
+    field_ids = resolve_field_ids(jira, options.extra_fields, scheduler=scheduler)
+    fields = options.fields
+    if "updated" not in fields:
+        fields.append("updated")
+
+    watermark = since
+    # The `updated` timestamp of the issues of the last poll, the only ones
+    # that the next poll can fetch again without them having changed.
+    seen: dict[str, str] = {}
+    poll = 0
+
+    while True:
+        started = time.monotonic()
+        polled_at = datetime.now(UTC)
+        query = build_query(project, options.jql)
+        if watermark is not None:
+            query = f"{query} and {updated_since(watermark, time_zone)}"
+
+        polled: dict[str, str] = {}
+        latest = watermark
+        changed = 0
+        try:
+            for issues, _ in iter_issue_page_tokens(
+                jira,
+                f"{query} ORDER BY updated ASC, key ASC",
+                fields=fields,
+                scheduler=scheduler,
+            ):
+                new = [
+                    issue
+                    for issue in issues
+                    if seen.get(issue["key"]) != issue["fields"]["updated"]
+                ]
+                polled.update(
+                    (issue["key"], issue["fields"]["updated"]) for issue in issues
+                )
+                latest = latest_update(issues, latest)
+                if new:
+                    changed += len(new)
+                    yield [
+                        ProjectItem.from_raw(issue, options.extra_fields, field_ids)
+                        for issue in new
+                    ]
+        except Exception:
+            logger.exception("Failed to poll %s", project.project)
+            polled = seen | polled
+
+        capped = cap_watermark(latest, polled_at)
+        if watermark is None or (capped is not None and capped > watermark):
+            watermark = capped
+        seen = polled
+        poll += 1
+        logger.debug(
+            "Poll %d of %s: %d changed issue(s) of %d fetched, in %.1fs",
+            poll,
+            project.project,
+            changed,
+            len(polled),
+            time.monotonic() - started,
+        )
+        if polls is not None and poll >= polls:
+            return
+
+        (sleep or time.sleep)(max(0.0, interval - (time.monotonic() - started)))
@@ -0,0 +1 @@
+"""Streaming writers that serialize exported issues as pages arrive."""
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from types import TracebackType
+from typing import IO, Any, ClassVar, Self
+
+from jira_export.models.project_item import ProjectItem
+
+
+class IssueWriter(ABC):
+    """Serialize `ProjectItem`s to a stream, one page at a time.
+
+    The document is only finalized when the writer exits without an error, so
+    an interrupted export never looks like a complete one.
+    """
+
+    # Whether the writer expects a binary stream rather than a text one.
+    binary: ClassVar[bool] = False
+
+    def __init__(self, stream: IO[Any]):
+        self.stream = stream
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+
+    @abstractmethod
+    def write(self, items: Iterable[ProjectItem]) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
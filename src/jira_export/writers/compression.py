@@ -0,0 +1,71 @@
+import gzip
+import io
+from enum import Enum
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any, Literal
+
+
+class Compression(Enum):
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def suffix(self) -> str:
+        return {Compression.GZIP: ".gz", Compression.ZSTD: ".zst"}[self]
+
+
+def require_zstandard() -> ModuleType:
+    """Import zstandard, which is only installed with the `zstd` extra.
+
+    Returns:
+        ModuleType: The `zstandard` module.
+
+    Raises:
+        ImportError: If zstandard is not installed.
+    """
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "zstd compression requires zstandard. Install it with "
+            "`pip install 'jira-export[zstd]'`"
+        ) from exc
+
+    return zstandard
+
+
+def open_file(
+    path: Path,
+    mode: Literal["r", "w", "rb", "wb"],
+    compression: Compression | None = None,
+) -> IO[Any]:
+    """Open `path`, compressing or decompressing on the fly.
+
+    Data is compressed as it is written, so the uncompressed document is never
+    held in memory.
+
+    >>> import tempfile
+    >>> path = Path(tempfile.mkdtemp()) / "issues.json.gz"
+    >>> with open_file(path, "w", Compression.GZIP) as f:
+    ...     _ = f.write("{}")
+    >>> gzip.decompress(path.read_bytes())
+    b'{}'
+
+    Returns:
+        IO[Any]: A text stream for "r" and "w", a binary one otherwise.
+    """
+    if compression is None:
+        return path.open(mode)
+
+    binary_mode: Literal["rb", "wb"] = "rb" if mode.startswith("r") else "wb"
+    match compression:
+        case Compression.GZIP:
+            stream: IO[bytes] = gzip.open(path, binary_mode)  # noqa: SIM115
+        case Compression.ZSTD:
+            stream = require_zstandard().open(path, binary_mode)
+
+    if mode.endswith("b"):
+        return stream
+
+    return io.TextIOWrapper(stream, encoding="utf-8")
@@ -0,0 +1,112 @@
+import json
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TextIO
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.base import IssueWriter
+
+logger = logging.getLogger(__name__)
+
+
+def read_hash_index(path: Path) -> dict[str, bytes]:
+    """Read the `<key> <hex digest>` lines written by `DiffWriter`.
+
+    Returns:
+        dict[str, bytes]: The content hash of each issue, by key, in file
+            order. Empty if `path` does not exist.
+    """
+    try:
+        with path.open() as f:
+            return {
+                key: bytes.fromhex(digest)
+                for key, digest in (line.split() for line in f if line.strip())
+            }
+    except FileNotFoundError:
+        logger.debug("Hash index %s does not exist, every issue is new", path)
+        return {}
+
+
+class DiffWriter(IssueWriter):
+    """Write only the changes since the snapshot indexed by `index`, as JSON lines.
+
+    `index` holds the `ProjectItem.content_hash` of every issue of the previous
+    snapshot, and only that index is kept in memory: each item is hashed and
+    compared as it arrives, then dropped. Added and changed issues are written
+    with their content, and the keys left in the index once every item was
+    written are the removed issues:
+
+        {"change": "added", "key": "A-3", "issue": {...}}
+        {"change": "changed", "key": "A-1", "issue": {...}}
+        {"change": "removed", "key": "A-2"}
+
+    The new index is written alongside, and only replaces `index` when
+    `commit_index` is called, once the changes were delivered. It is discarded
+    if the writer fails.
+    """
+
+    def __init__(self, stream: TextIO, index: Path):
+        super().__init__(stream)
+        self.index = index
+        self.added = self.changed = self.removed = 0
+
+        self._previous = read_hash_index(index)
+        self._partial = index.with_name(f"{index.name}.partial")
+        index.parent.mkdir(parents=True, exist_ok=True)
+        self._new_index = self._partial.open("w")
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            super().__exit__(exc_type, exc, tb)
+        finally:
+            self._new_index.close()
+            if exc_type is not None:
+                self._partial.unlink(missing_ok=True)
+
+    def _emit(self, change: str, key: str, item: ProjectItem | None = None) -> None:
+        record: dict[str, Any] = {"change": change, "key": key}
+        if item is not None:
+            record["issue"] = item.to_dict()
+        self.stream.write(json.dumps(record) + "\n")
+
+    def write(self, items: Iterable[ProjectItem]) -> None:
+        for item in items:
+            digest = item.content_hash()
+            self._new_index.write(f"{item.key} {digest.hex()}\n")
+
+            previous = self._previous.pop(item.key, None)
+            if previous is None:
+                self.added += 1
+                self._emit("added", item.key, item)
+            elif previous != digest:
+                self.changed += 1
+                self._emit("changed", item.key, item)
+
+        self.stream.flush()
+
+    def close(self) -> None:
+        for key in self._previous:
+            self.removed += 1
+            self._emit("removed", key)
+        self._previous.clear()
+        self.stream.flush()
+
+        self._new_index.close()
+        logger.info(
+            "%d issue(s) added, %d changed and %d removed since %s",
+            self.added,
+            self.changed,
+            self.removed,
+            self.index,
+        )
+
+    def commit_index(self) -> None:
+        # Only once the writer was closed, when the new index is complete.
+        self._partial.replace(self.index)
@@ -0,0 +1,68 @@
+import json
+import tomllib
+from enum import Enum
+from pathlib import Path
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.base import IssueWriter
+from jira_export.writers.compression import Compression, open_file
+from jira_export.writers.json_writer import JsonWriter
+from jira_export.writers.parquet_writer import (
+    ParquetWriter,
+    read_parquet_items,
+    require_pyarrow,
+)
+from jira_export.writers.toml_writer import TomlWriter
+
+
+class OutputFormat(Enum):
+    TOML = "toml"
+    JSON = "json"
+    PARQUET = "parquet"
+
+
+def read_items(
+    path: Path, output_format: OutputFormat, compression: Compression | None = None
+) -> list[ProjectItem]:
+    """Parse a document previously written by the export in `output_format`.
+
+    Returns:
+        list[ProjectItem]: The exported issues, in document order.
+    """
+    match output_format:
+        case OutputFormat.TOML:
+            # The `toml` package misreads some strings, such as '"' or
+            # trailing spaces in multi-line strings.
+            with open_file(path, "rb", compression) as f:
+                data = tomllib.load(f)
+        case OutputFormat.JSON:
+            with open_file(path, "r", compression) as f:
+                data = json.load(f)
+        case OutputFormat.PARQUET:
+            with open_file(path, "rb", compression) as f:
+                return read_parquet_items(f)
+
+    return [ProjectItem.from_dict(item) for item in data.get("issues", [])]
+
+
+def writer_for(output_format: OutputFormat) -> type[IssueWriter]:
+    """Return the writer class for `output_format`.
+
+    Parquet fails with an `ImportError` when pyarrow is not installed.
+
+    Returns:
+        type[IssueWriter]: The writer class.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    match output_format:
+        case OutputFormat.TOML:
+            return TomlWriter
+        case OutputFormat.JSON:
+            return JsonWriter
+        case OutputFormat.PARQUET:
+            require_pyarrow()
+            return ParquetWriter
+
+    raise ValueError(f"Unsupported output format: {output_format}")
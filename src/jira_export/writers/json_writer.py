@@ -0,0 +1,63 @@
+import json
+from collections.abc import Iterable
+from json.encoder import encode_basestring_ascii
+from typing import Any, TextIO
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.base import IssueWriter
+
+_ITEM_INDENT = " " * 4
+_FIELD_SEPARATOR = ",\n" + _ITEM_INDENT + "  "
+
+
+def _encode_value(value: Any) -> str:
+    # Most values are strings or missing, so skip the encoder setup for them.
+    if value is None:
+        return "null"
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+
+    return json.dumps(value, indent=2).replace("\n", "\n" + _ITEM_INDENT + "  ")
+
+
+class JsonWriter(IssueWriter):
+    """Stream a `{"issues": [...]}` document.
+
+    The output is byte-identical to `json.dumps({"issues": items}, indent=2)`
+    followed by a newline, but only one item is serialized at a time.
+
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> with JsonWriter(stream) as writer:
+    ...     writer.write([ProjectItem("A-1", "Summary", None, None, None, None)])
+    >>> json.loads(stream.getvalue())["issues"][0]["key"]
+    'A-1'
+    """
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._count = 0
+
+    def write(self, items: Iterable[ProjectItem]) -> None:
+        for item in items:
+            separator = '{\n  "issues": [\n' if self._count == 0 else ",\n"
+            # Same layout as `json.dumps(item.to_dict(), indent=2)`, indented
+            # into the array, without building the dict.
+            encoded = _FIELD_SEPARATOR.join(
+                f"{encode_basestring_ascii(name)}: {_encode_value(value)}"
+                for name, value in item.items()
+            )
+            self.stream.write(
+                f"{separator}{_ITEM_INDENT}{{\n{_ITEM_INDENT}  {encoded}\n{_ITEM_INDENT}}}"
+            )
+            self._count += 1
+
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self._count == 0:
+            self.stream.write('{\n  "issues": []\n}\n')
+        else:
+            self.stream.write("\n  ]\n}\n")
+
+        self.stream.flush()
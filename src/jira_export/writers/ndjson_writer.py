@@ -0,0 +1,27 @@
+import json
+from collections.abc import Iterable
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.base import IssueWriter
+
+
+class NdjsonWriter(IssueWriter):
+    """Write one JSON object per line, flushed after every page.
+
+    Unlike a document, every line stands on its own, so consumers can process
+    items while more are still being written.
+
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> with NdjsonWriter(stream) as writer:
+    ...     writer.write([ProjectItem("A-1", "Summary", None, None, None, None)])
+    >>> json.loads(stream.getvalue().splitlines()[0])["key"]
+    'A-1'
+    """
+
+    def write(self, items: Iterable[ProjectItem]) -> None:
+        self.stream.writelines(json.dumps(item.to_dict()) + "\n" for item in items)
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.flush()
@@ -0,0 +1,115 @@
+import functools
+import json
+from collections.abc import Iterable
+from types import ModuleType
+from typing import TYPE_CHECKING, BinaryIO
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.base import IssueWriter
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ROW_GROUP_SIZE = 10_000
+
+# Few distinct values per file, so dictionary pages shrink them to a few bytes.
+DICTIONARY_COLUMNS = ["status", "assignee", "reporter"]
+
+
+def require_pyarrow() -> tuple[ModuleType, ModuleType]:
+    """Import pyarrow, which is only installed with the `parquet` extra.
+
+    Returns:
+        tuple[ModuleType, ModuleType]: The `pyarrow` and `pyarrow.parquet` modules.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet output requires pyarrow. Install it with "
+            "`pip install 'jira-export[parquet]'`"
+        ) from exc
+
+    return pa, pq
+
+
+@functools.cache
+def _schema() -> "pa.Schema":
+    pa, _ = require_pyarrow()
+    return pa.schema(
+        [
+            *((name, pa.string()) for name in ProjectItem.field_names()),
+            # Extra fields vary per export and may be nested, so they are kept
+            # as a single JSON object rather than widening the schema.
+            ("extra", pa.string()),
+        ]
+    )
+
+
+class ParquetWriter(IssueWriter):
+    """Write items as Parquet, one row group every `row_group_size` items.
+
+    Only the current row group is held in memory.
+    """
+
+    binary = True
+
+    def __init__(self, stream: BinaryIO, *, row_group_size: int = ROW_GROUP_SIZE):
+        super().__init__(stream)
+        self.row_group_size = row_group_size
+        self._pa, pq = require_pyarrow()
+        self._columns: dict[str, list[str | None]] = {
+            name: [] for name in _schema().names
+        }
+        self._rows = 0
+        self._writer = pq.ParquetWriter(
+            stream, _schema(), use_dictionary=DICTIONARY_COLUMNS
+        )
+
+    def write(self, items: Iterable[ProjectItem]) -> None:
+        for item in items:
+            for name in ProjectItem.field_names():
+                self._columns[name].append(getattr(item, name))
+            self._columns["extra"].append(
+                json.dumps(item.extra) if item.extra else None
+            )
+
+            self._rows += 1
+            if self._rows >= self.row_group_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+
+        self._writer.write_batch(
+            self._pa.record_batch(list(self._columns.values()), schema=_schema())
+        )
+        for values in self._columns.values():
+            values.clear()
+        self._rows = 0
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+        self.stream.flush()
+
+
+def read_parquet_items(stream: BinaryIO) -> list[ProjectItem]:
+    """Parse a document written by `ParquetWriter`.
+
+    Returns:
+        list[ProjectItem]: The exported issues, in document order.
+    """
+    _, pq = require_pyarrow()
+
+    items = []
+    for row in pq.read_table(stream).to_pylist():
+        extra = row.pop("extra")
+        items.append(ProjectItem.from_dict({**row, **json.loads(extra or "{}")}))
+
+    return items
@@ -0,0 +1,161 @@
+import itertools
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self
+
+from jira_export.models.project_item import ProjectItem, issue_sort_key
+from jira_export.writers.base import IssueWriter
+from jira_export.writers.compression import Compression, open_file
+from jira_export.writers.formats import OutputFormat, read_items, writer_for
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+# Items written to a file at most at once, between two checks of its size: as
+# many as a search page.
+RUN_SIZE = 250
+
+
+@dataclass
+class ManifestFile:
+    path: str
+    issues: int
+    # The smallest and largest keys in the file, in Jira order, whatever the
+    # order the issues were written in.
+    first_key: str
+    last_key: str
+    bytes: int = 0
+
+
+class SplitWriter:
+    """Stream items to numbered files in `directory`, rolling over when full.
+
+    A file is full once it holds `max_issues` items, or once `max_bytes` have
+    reached the disk. Sizes are only checked after each run of up to
+    `RUN_SIZE` items, and compressed data still buffered by the compressor, and
+    Parquet row groups not yet flushed, are only counted once written: files
+    may exceed `max_bytes` by that much.
+    `manifest.json` lists every file with its issue count and key range.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        output_format: OutputFormat,
+        *,
+        compression: Compression | None = None,
+        max_issues: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.directory = directory
+        self.output_format = output_format
+        self.compression = compression
+        self.max_issues = max_issues
+        self.max_bytes = max_bytes
+        self.files: list[ManifestFile] = []
+
+        self._writer_cls = writer_for(output_format)
+        self._stream: IO[Any] | None = None
+        self._writer: IssueWriter | None = None
+        self._path: Path | None = None
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._stream is not None:
+            self._stream.close()
+
+    def _open_next(self, key: str) -> IssueWriter:
+        suffix = self.compression.suffix if self.compression else ""
+        name = f"issues-{len(self.files) + 1:05d}.{self.output_format.value}{suffix}"
+        self._path = self.directory / name
+        mode = "wb" if self._writer_cls.binary else "w"
+        self._stream = open_file(self._path, mode, self.compression)
+        self._writer = self._writer_cls(self._stream)
+        self.files.append(ManifestFile(name, 0, key, key))
+        return self._writer
+
+    def _close_current(self) -> None:
+        if self._writer is None or self._stream is None or self._path is None:
+            return
+
+        self._writer.close()
+        self._stream.close()
+        self.files[-1].bytes = self._path.stat().st_size
+        logger.debug("Wrote %d issue(s) to %s", self.files[-1].issues, self._path)
+        self._writer = self._stream = self._path = None
+
+    def _is_full(self, current: ManifestFile) -> bool:
+        if self.max_issues is not None and current.issues >= self.max_issues:
+            return True
+
+        return (
+            self.max_bytes is not None
+            and self._path is not None
+            and self._path.stat().st_size >= self.max_bytes
+        )
+
+    def write(self, items: Iterable[ProjectItem]) -> None:
+        # Each file's writer gets whole runs of items, as it flushes (and so do
+        # compressors) at the end of every write.
+        remaining = iter(items)
+        for first in remaining:
+            writer = self._writer or self._open_next(first.key)
+            current = self.files[-1]
+            room = RUN_SIZE
+            if self.max_issues is not None:
+                room = min(room, self.max_issues - current.issues)
+            run = [first, *itertools.islice(remaining, room - 1)]
+            writer.write(run)
+
+            current.issues += len(run)
+            keys = [current.first_key, current.last_key, *(item.key for item in run)]
+            current.first_key = min(keys, key=issue_sort_key)
+            current.last_key = max(keys, key=issue_sort_key)
+            if self._is_full(current):
+                self._close_current()
+
+    def close(self) -> None:
+        self._close_current()
+        manifest = {
+            "format": self.output_format.value,
+            "compression": self.compression.value if self.compression else None,
+            "issues": sum(file.issues for file in self.files),
+            "files": [asdict(file) for file in self.files],
+        }
+        (self.directory / MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=2) + "\n"
+        )
+
+
+def read_split_items(directory: Path) -> list[ProjectItem]:
+    """Parse every file listed in the manifest of a `SplitWriter` directory.
+
+    Returns:
+        list[ProjectItem]: The exported issues, in manifest order.
+    """
+    manifest = json.loads((directory / MANIFEST_NAME).read_text())
+    output_format = OutputFormat(manifest["format"])
+    compression = (
+        Compression(manifest["compression"]) if manifest["compression"] else None
+    )
+
+    return [
+        item
+        for file in manifest["files"]
+        for item in read_items(directory / file["path"], output_format, compression)
+    ]
@@ -0,0 +1,121 @@
+import math
+import re
+from collections.abc import Iterable
+from typing import Any, TextIO
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.base import IssueWriter
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+_ESCAPES = {
+    "\\": "\\\\",
+    '"': '\\"',
+    "\b": "\\b",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\f": "\\f",
+    "\r": "\\r",
+}
+_CONTROL = re.compile(r'[\\"\x00-\x1f\x7f]')
+# Newlines and tabs are kept as is in multi-line strings.
+_MULTILINE_CONTROL = re.compile(r'[\\"\x00-\x08\x0b-\x1f\x7f]')
+_TRAILING_BLANK = re.compile(r"[ \t]\r?\n")
+
+
+def _escape(match: re.Match[str]) -> str:
+    char = match.group()
+    return _ESCAPES.get(char) or f"\\u{ord(char):04x}"
+
+
+def _encode_key(key: str) -> str:
+    if _BARE_KEY.fullmatch(key):
+        return key
+
+    return _encode_string(key)
+
+
+def _encode_string(value: str, *, multiline: bool = False) -> str:
+    # The newline right after the opening quotes is not part of the value, and
+    # the `toml` package drops any further leading newlines too. It also
+    # misreads multi-line strings nested in arrays and inline tables, so only
+    # top-level values may use them, and drops blanks before line breaks.
+    if (
+        multiline
+        and "\n" in value
+        and not value.startswith(("\n", "\r"))
+        and not _TRAILING_BLANK.search(value)
+    ):
+        return '"""\n' + _MULTILINE_CONTROL.sub(_escape, value) + '"""'
+
+    return '"' + _CONTROL.sub(_escape, value) + '"'
+
+
+def _encode_value(value: Any, *, top_level: bool = False) -> str:
+    match value:
+        case bool():
+            return "true" if value else "false"
+        case int():
+            return str(value)
+        case float() if math.isnan(value):
+            return "nan"
+        case float() if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        case float():
+            return repr(value)
+        case str():
+            return _encode_string(value, multiline=top_level)
+        case list() | tuple():
+            # TOML has no null, so missing values are left out, as in tables.
+            return (
+                "["
+                + ", ".join(_encode_value(item) for item in value if item is not None)
+                + "]"
+            )
+        case dict():
+            pairs = ", ".join(
+                f"{_encode_key(str(key))} = {_encode_value(item)}"
+                for key, item in value.items()
+                if item is not None
+            )
+            return "{ " + pairs + " }" if pairs else "{}"
+
+    raise TypeError(f"Cannot encode {type(value).__name__} as TOML")
+
+
+class TomlWriter(IssueWriter):
+    r"""Stream an `issues` array of tables, one `[[issues]]` entry per item.
+
+    The output parses back to the same document as `toml.dumps({"issues":
+    items})`: keys with a `None` value are left out, and nested values are
+    written as inline tables.
+
+    >>> import io, toml
+    >>> stream = io.StringIO()
+    >>> with TomlWriter(stream) as writer:
+    ...     writer.write([ProjectItem("A-1", "Summary", None, None, None, "a\nb")])
+    >>> toml.loads(stream.getvalue())["issues"][0]["description"]
+    'a\nb'
+    """
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._count = 0
+
+    def write(self, items: Iterable[ProjectItem]) -> None:
+        for item in items:
+            lines = [
+                f"{_encode_key(key)} = {_encode_value(value, top_level=True)}\n"
+                for key, value in item.items()
+                if value is not None
+            ]
+            self.stream.write(("\n" if self._count else "") + "[[issues]]\n")
+            self.stream.writelines(lines)
+            self._count += 1
+
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self._count == 0:
+            self.stream.write("issues = []\n")
+
+        self.stream.flush()
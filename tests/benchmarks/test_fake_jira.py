@@ -0,0 +1,198 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from jira_export.cli.app import app
+from jira_export.fetch.scheduler import get_scheduler
+
+runner = CliRunner()
+
+
+def _export(tmp_path, *args):
+    with patch("keyring.get_password", return_value="key"):
+        return runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(tmp_path / "config.toml"),
+                "export",
+                "-p",
+                "fake",
+                "--format",
+                "json",
+                "--output",
+                str(tmp_path / "fake.json"),
+                *args,
+            ],
+        )
+
+
+def _export_diff(tmp_path, *args):
+    with patch("keyring.get_password", return_value="key"):
+        return runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(tmp_path / "config.toml"),
+                "export",
+                "-p",
+                "fake",
+                *args,
+            ],
+        )
+
+
+@pytest.mark.parametrize("parallel", ["1", "3"])
+def test_export_against_fake_server(fake_jira, tmp_path, parallel):
+    server = fake_jira(issues=620, max_page_size=100)
+
+    result = _export(tmp_path, "--parallel", parallel)
+
+    assert result.exit_code == 0, result.output
+    issues = json.loads((tmp_path / "fake.json").read_text())["issues"]
+    assert [issue["key"] for issue in issues] == [f"FAKE-{n}" for n in range(1, 621)]
+    assert server.counters.searches >= 7
+
+
+def test_export_retries_rate_limited_requests(fake_jira, tmp_path):
+    server = fake_jira(issues=250, max_page_size=50, rate_limit_every=4, retry_after=0)
+
+    result = _export(tmp_path)
+
+    assert result.exit_code == 0, result.output
+    issues = json.loads((tmp_path / "fake.json").read_text())["issues"]
+    assert len(issues) == 250
+    assert server.counters.requests > server.counters.searches
+
+
+def test_export_fails_when_the_server_fails(fake_jira, tmp_path):
+    fake_jira(issues=250, max_page_size=50, fail_after=2)
+
+    result = _export(tmp_path)
+
+    assert result.exit_code != 0
+    assert not (tmp_path / "fake.json").exists()
+
+
+@pytest.mark.parametrize("parallel", ["1", "3"])
+def test_resumed_export_matches_uninterrupted_one(fake_jira, tmp_path, parallel):
+    server = fake_jira(issues=620, max_page_size=50)
+    args = ["--parallel", parallel, "--checkpoint", str(tmp_path / "checkpoint")]
+
+    server.knobs.fail_after = 5
+    interrupted = _export(tmp_path, *args)
+    server.knobs.fail_after = None
+    searches = server.counters.searches
+    resumed = _export(tmp_path, *args, "--resume")
+
+    assert interrupted.exit_code != 0
+    assert resumed.exit_code == 0, resumed.output
+    issues = json.loads((tmp_path / "fake.json").read_text())["issues"]
+    assert [issue["key"] for issue in issues] == [f"FAKE-{n}" for n in range(1, 621)]
+    # Pages stored before the failure are not fetched again.
+    assert server.counters.searches - searches < 620 // 50 + 2
+    assert not (tmp_path / "checkpoint").joinpath("fake").exists()
+
+
+@pytest.mark.parametrize("parallel", ["1", "3"])
+def test_export_includes_changelog(fake_jira, tmp_path, parallel):
+    fake_jira(issues=250, max_page_size=50, histories=3)
+
+    result = _export(tmp_path, "--include-changelog", "--parallel", parallel)
+
+    assert result.exit_code == 0, result.output
+    issues = json.loads((tmp_path / "fake.json").read_text())["issues"]
+    assert len(issues) == 250
+    for issue in issues:
+        assert [(change["from"], change["to"]) for change in issue["changelog"]] == [
+            ("Status 0", "Status 1"),
+            ("Status 1", "Status 2"),
+            ("Status 2", "Status 3"),
+        ]
+
+
+def test_export_downloads_attachments(fake_jira, tmp_path):
+    server = fake_jira(issues=30, max_page_size=10, attachments=2, attachment_size=1000)
+    attachments = tmp_path / "attachments"
+
+    result = _export(tmp_path, "--attachments", str(attachments))
+
+    assert result.exit_code == 0, result.output
+    issues = json.loads((tmp_path / "fake.json").read_text())["issues"]
+    paths = {
+        attachment["path"] for issue in issues for attachment in issue["attachments"]
+    }
+    # Every issue has the same two attachment contents.
+    assert len(paths) == 2
+    assert all((attachments / path).stat().st_size == 1000 for path in paths)
+    assert server.counters.downloads == 60
+    # Downloads are not throttled with the API requests.
+    host, port = server.server_address[:2]
+    assert get_scheduler(f"{host}:{port}").stats.requests < 10
+
+    result = _export(tmp_path, "--attachments", str(attachments))
+
+    assert result.exit_code == 0, result.output
+    assert server.counters.downloads == 60
+
+
+def test_export_diff_against_previous_index(fake_jira, tmp_path):
+    server = fake_jira(issues=30, max_page_size=10)
+    index = tmp_path / "fake.index"
+
+    def diff() -> list[tuple[str, str]]:
+        with patch("keyring.get_password", return_value="key"):
+            result = runner.invoke(
+                app,
+                [
+                    "--config-file",
+                    str(tmp_path / "config.toml"),
+                    "export",
+                    "-p",
+                    "fake",
+                    "--diff-against",
+                    str(index),
+                ],
+            )
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        return [(record["change"], record["key"]) for record in records]
+
+    assert len(diff()) == 30
+    assert diff() == []
+
+    server.knobs.issues = 32
+    assert diff() == [("added", "FAKE-31"), ("added", "FAKE-32")]
+
+    server.knobs.issues = 31
+    assert diff() == [("removed", "FAKE-32")]
+
+
+def test_export_diff_keeps_index_if_output_is_not_replaced(fake_jira, tmp_path):
+    server = fake_jira(issues=10)
+    index = tmp_path / "fake.index"
+    args = ["--diff-against", str(index), "--output", str(tmp_path / "fake.jsonl")]
+
+    result = _export_diff(tmp_path, *args)
+    assert result.exit_code == 0, result.output
+    previous = index.read_text()
+
+    server.knobs.issues = 12
+    with patch("jira_export.exporter._replace", side_effect=OSError("disk full")):
+        result = _export_diff(tmp_path, *args)
+
+    assert result.exit_code != 0
+    assert index.read_text() == previous
+
+
+def test_export_fields_requested_by_name(fake_jira, tmp_path):
+    fake_jira(issues=20, null_ratio=0)
+
+    result = _export(tmp_path, "--fields", "Story Points,customfield_10016")
+
+    assert result.exit_code == 0, result.output
+    issues = json.loads((tmp_path / "fake.json").read_text())["issues"]
+    assert all(issue["Story Points"] is not None for issue in issues)
+    assert all(issue["Story Points"] == issue["customfield_10016"] for issue in issues)
@@ -1,31 +1,32 @@
-from types import SimpleNamespace
+import gzip
+import io
+import json
+import threading
+from datetime import UTC, datetime
 from unittest.mock import patch
 
+import pytest
+import toml
+from rich.console import Console
 from typer.testing import CliRunner
 
 from jira_export.cli.app import app
+from jira_export.fetch.incremental import WATERMARK_MARGIN
 from jira_export.models.app_state import AppState
 from jira_export.models.config import Config
 from jira_export.models.project import Project
+from jira_export.models.project_item import ProjectItem
+from jira_export.models.watermarks import Watermarks
 
 runner = CliRunner()
 
 
-class FakeResult:
-    """Minimal iterable that mimics `ResultList` from jira library."""
-
-    def __init__(self, issues, next_page_token=None):
-        self._issues = issues
-        self.nextPageToken = next_page_token
-
-    def __iter__(self):
-        return iter(self._issues)
-
-    def __len__(self):
-        return len(self._issues)
-        
-    def __bool__(self):
-        return bool(self._issues)
+def fake_result(issues, next_page_token=None) -> dict:
+    # Minimal search response, as returned with `json_result=True`.
+    result = {"issues": issues}
+    if next_page_token:
+        result["nextPageToken"] = next_page_token
+    return result
 
 
 def make_issue(
@@ -36,21 +37,22 @@ def make_issue(
     assignee: str | None = "Test User",
     reporter: str | None = "Reporter",
     description: str | None = "Description",
+    updated: str = "2024-01-01T10:00:00.000+0000",
+    raw_fields: dict | None = None,
 ):
-    status = SimpleNamespace(name=status_name) if status_name else None
-    assignee_obj = SimpleNamespace(displayName=assignee) if assignee else None
-    reporter_obj = SimpleNamespace(displayName=reporter) if reporter else None
-
-    fields = SimpleNamespace(
-        summary=summary,
-        status=status,
-        assignee=assignee_obj,
-        reporter=reporter_obj,
-        description=description,
-    )
-
-    # Create an issue object that matches what the ProjectItem.from_issue expects
-    return SimpleNamespace(key=key, fields=fields)
+    # Raw issue JSON, as found in a search response
+    return {
+        "key": key,
+        "fields": {
+            "summary": summary,
+            "status": {"name": status_name} if status_name else None,
+            "assignee": {"displayName": assignee} if assignee else None,
+            "reporter": {"displayName": reporter} if reporter else None,
+            "description": description,
+            "updated": updated,
+            **(raw_fields or {}),
+        },
+    }
 
 
 def _config_file(tmp_path):
@@ -68,12 +70,12 @@ def test_export_toml(tmp_path):
     config = _config_args(tmp_path)
     issue = make_issue()
 
-    with patch("jira_export.models.project.keyring.get_password", return_value="secret"), patch(
+    with patch("keyring.get_password", return_value="secret"), patch(
         "jira.JIRA"
     ) as mock_jira_class:
         mock_jira = mock_jira_class.return_value
         mock_jira.approximate_issue_count.return_value = 1
-        mock_jira.enhanced_search_issues.return_value = FakeResult([issue])
+        mock_jira.enhanced_search_issues.return_value = fake_result([issue])
 
         result = runner.invoke(
             app,
@@ -91,12 +93,12 @@ def test_export_json(tmp_path):
     config_file = _config_file(tmp_path)
     issue = make_issue(status_name=None, assignee=None, reporter=None, description=None)
 
-    with patch("jira_export.models.project.keyring.get_password", return_value="secret"), patch(
+    with patch("keyring.get_password", return_value="secret"), patch(
         "jira.JIRA"
     ) as mock_jira_class:
         mock_jira = mock_jira_class.return_value
         mock_jira.approximate_issue_count.return_value = 1
-        mock_jira.enhanced_search_issues.return_value = FakeResult([issue])
+        mock_jira.enhanced_search_issues.return_value = fake_result([issue])
 
         result = runner.invoke(
             app,
@@ -118,7 +120,7 @@ def test_export_with_jql(tmp_path):
     ) as mock_jira_class:
         mock_jira = mock_jira_class.return_value
         mock_jira.approximate_issue_count.return_value = 1
-        mock_jira.enhanced_search_issues.return_value = FakeResult([issue])
+        mock_jira.enhanced_search_issues.return_value = fake_result([issue])
 
         result = runner.invoke(
             app,
@@ -137,3 +139,651 @@ def test_export_with_jql(tmp_path):
     # Since in the test environment, the enhanced_search_issues might not be called
     # with exactly what we expect, we're just checking the result here
     assert result.stdout.strip() != ""
+
+
+def test_export_json_streams_all_pages(tmp_path):
+    config_file = _config_file(tmp_path)
+    issues = [make_issue(key=f"TEST-{i}") for i in range(1, 4)]
+
+    with patch("keyring.get_password", return_value="secret"), patch(
+        "jira.JIRA"
+    ) as mock_jira_class:
+        mock_jira = mock_jira_class.return_value
+        mock_jira.approximate_issue_count.return_value = 3
+        mock_jira.enhanced_search_issues.side_effect = [
+            fake_result(issues[:2], next_page_token="next"),
+            fake_result(issues[2:]),
+        ]
+
+        result = runner.invoke(
+            app,
+            ["--config-file", str(config_file), "export", "--project-id", "alpha", "--format", "json"],
+        )
+
+    assert result.exit_code == 0
+    expected = {
+        "issues": [ProjectItem.from_raw(issue).to_dict() for issue in issues]
+    }
+    assert result.stdout == json.dumps(expected, indent=2) + "\n"
+
+
+def test_export_toml_matches_toml_dumps(tmp_path):
+    config_file = _config_file(tmp_path)
+    issues = [make_issue(key="TEST-1"), make_issue(key="TEST-2", assignee=None)]
+
+    with patch("keyring.get_password", return_value="secret"), patch(
+        "jira.JIRA"
+    ) as mock_jira_class:
+        mock_jira = mock_jira_class.return_value
+        mock_jira.approximate_issue_count.return_value = 2
+        mock_jira.enhanced_search_issues.return_value = fake_result(issues)
+
+        result = runner.invoke(
+            app,
+            ["--config-file", str(config_file), "export", "--project-id", "alpha"],
+        )
+
+    assert result.exit_code == 0
+    assert toml.loads(result.stdout) == {
+        "issues": [
+            {k: v for k, v in ProjectItem.from_raw(issue).to_dict().items() if v is not None}
+            for issue in issues
+        ]
+    }
+
+
+def test_export_parallel_sorts_by_key(tmp_path):
+    config_file = _config_file(tmp_path)
+    issues = [make_issue(key="TEST-2"), make_issue(key="TEST-10")]
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira = mock_jira_class.return_value
+        mock_jira.approximate_issue_count.return_value = 2
+        mock_jira.enhanced_search_issues.return_value = fake_result(issues)
+
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(config_file),
+                "export",
+                "--project-id",
+                "alpha",
+                "--format",
+                "json",
+                "--parallel",
+                "4",
+            ],
+        )
+
+    assert result.exit_code == 0
+    assert [issue["key"] for issue in json.loads(result.stdout)["issues"]] == [
+        "TEST-2",
+        "TEST-10",
+    ]
+    query = mock_jira.enhanced_search_issues.call_args.args[0]
+    assert query.endswith("ORDER BY key ASC")
+
+
+def test_export_incremental_requires_output(tmp_path):
+    config_file = _config_file(tmp_path)
+
+    result = runner.invoke(
+        app,
+        [
+            "--config-file",
+            str(config_file),
+            "export",
+            "--project-id",
+            "alpha",
+            "--incremental",
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert "--incremental requires --output" in result.output
+
+
+def test_export_incremental_merges_changes(tmp_path):
+    config_file = _config_file(tmp_path)
+    output = tmp_path / "alpha.json"
+    args = [
+        "--config-file",
+        str(config_file),
+        "export",
+        "--project-id",
+        "alpha",
+        "--format",
+        "json",
+        "--output",
+        str(output),
+        "--incremental",
+    ]
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira = mock_jira_class.return_value
+        mock_jira.myself.return_value = {"timeZone": "UTC"}
+        mock_jira.approximate_issue_count.return_value = 2
+        mock_jira.enhanced_search_issues.return_value = fake_result([
+            make_issue(key="TEST-1", updated="2024-01-01T10:00:00.000+0000"),
+            make_issue(key="TEST-2", updated="2024-01-02T10:00:00.000+0000"),
+        ])
+        first = runner.invoke(app, args)
+
+        mock_jira.enhanced_search_issues.return_value = fake_result([
+            make_issue(
+                key="TEST-1", summary="Changed", updated="2024-01-03T10:00:00.000+0000"
+            ),
+            make_issue(key="TEST-3", updated="2024-01-03T11:00:00.000+0000"),
+        ])
+        second = runner.invoke(app, args)
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    query = mock_jira.enhanced_search_issues.call_args.args[0]
+    assert query.endswith('and updated >= "2024/01/02 10:00"')
+
+    issues = json.loads(output.read_text())["issues"]
+    assert [(issue["key"], issue["summary"]) for issue in issues] == [
+        ("TEST-1", "Changed"),
+        ("TEST-2", "Test issue"),
+        ("TEST-3", "Test issue"),
+    ]
+    assert "2024-01-03T11:00:00Z" in (tmp_path / "watermarks.toml").read_text()
+
+
+def test_export_incremental_watermark_stops_before_export_start(tmp_path):
+    # An issue fetched early may be updated again while the export runs, so the
+    # watermark must not reach the updates seen at the end of the export.
+    updated = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira = mock_jira_class.return_value
+        mock_jira.approximate_issue_count.return_value = 1
+        mock_jira.enhanced_search_issues.return_value = fake_result([
+            make_issue(key="TEST-1", updated=updated)
+        ])
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(_config_file(tmp_path)),
+                "export",
+                "--project-id",
+                "alpha",
+                "--output",
+                str(tmp_path / "alpha.toml"),
+                "--incremental",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    watermark = Watermarks.load(tmp_path / "watermarks.toml").projects["alpha"]
+    assert watermark <= datetime.now(UTC) - WATERMARK_MARGIN
+
+
+def test_export_requests_only_needed_fields(tmp_path):
+    config_file = _config_file(tmp_path)
+    issue = make_issue(raw_fields={"labels": ["backend"], "customfield_1": 3})
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira = mock_jira_class.return_value
+        mock_jira.approximate_issue_count.return_value = 1
+        mock_jira._fields_cache = {"labels": "labels", "cf[1]": "customfield_1"}
+        mock_jira.enhanced_search_issues.return_value = fake_result([issue])
+
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(config_file),
+                "export",
+                "--project-id",
+                "alpha",
+                "--format",
+                "json",
+                "--fields",
+                "labels, summary",
+                "--fields",
+                "customfield_1",
+            ],
+        )
+
+    assert result.exit_code == 0
+    assert mock_jira.enhanced_search_issues.call_args.kwargs["fields"] == [
+        *ProjectItem.jira_fields(),
+        "labels",
+        "customfield_1",
+    ]
+    exported = json.loads(result.stdout)["issues"][0]
+    assert exported["labels"] == ["backend"]
+    assert exported["customfield_1"] == 3
+
+
+def _export_with_terminal(tmp_path, *extra_args):
+    config_file = _config_file(tmp_path)
+    terminal = Console(file=io.StringIO(), force_terminal=True)
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+        patch("jira_export.cli.export.err_console", terminal),
+    ):
+        mock_jira = mock_jira_class.return_value
+        mock_jira.approximate_issue_count.return_value = 1
+        mock_jira.enhanced_search_issues.return_value = fake_result([make_issue()])
+
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(config_file),
+                "export",
+                "--project-id",
+                "alpha",
+                "--output",
+                str(tmp_path / "out.toml"),
+                *extra_args,
+            ],
+        )
+
+    assert result.exit_code == 0
+    return mock_jira
+
+
+def test_export_counts_issues_for_progress_bar(tmp_path):
+    mock_jira = _export_with_terminal(tmp_path)
+    mock_jira.approximate_issue_count.assert_called_once()
+
+
+def test_export_no_progress_skips_count(tmp_path):
+    mock_jira = _export_with_terminal(tmp_path, "--no-progress")
+    mock_jira.approximate_issue_count.assert_not_called()
+
+
+def test_export_skips_count_without_terminal(tmp_path):
+    config_file = _config_file(tmp_path)
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira = mock_jira_class.return_value
+        mock_jira.enhanced_search_issues.return_value = fake_result([make_issue()])
+
+        result = runner.invoke(
+            app,
+            ["--config-file", str(config_file), "export", "--project-id", "alpha"],
+        )
+
+    assert result.exit_code == 0
+    mock_jira.approximate_issue_count.assert_not_called()
+
+
+def test_export_ignores_count_failure(tmp_path):
+    config_file = _config_file(tmp_path)
+    terminal = Console(file=io.StringIO(), force_terminal=True)
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+        patch("jira_export.cli.export.err_console", terminal),
+    ):
+        mock_jira = mock_jira_class.return_value
+        mock_jira.approximate_issue_count.side_effect = RuntimeError("no count")
+        mock_jira.enhanced_search_issues.return_value = fake_result([make_issue()])
+
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(config_file),
+                "export",
+                "--project-id",
+                "alpha",
+                "--output",
+                str(tmp_path / "out.toml"),
+            ],
+        )
+
+    assert result.exit_code == 0
+    assert "TEST-1" in (tmp_path / "out.toml").read_text()
+
+
+def _multi_project_config_file(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(
+        "\n".join(
+            f'[projects.{project_id}]\nuser = "test@example.com"\n'
+            f'domain = "{domain}"\nproject = "{project}"\n'
+            for project_id, domain, project in [
+                ("alpha", "one.atlassian.net", "ALPHA"),
+                ("beta", "one.atlassian.net", "BETA"),
+                ("gamma", "two.atlassian.net", "GAMMA"),
+            ]
+        )
+    )
+    return config_file
+
+
+def _search_by_project(jql, **_):
+    project = jql.split('"')[1]
+    if project == "BETA" and "fail" in jql:
+        raise RuntimeError("boom")
+
+    return fake_result([make_issue(key=f"{project}-1", summary=project)])
+
+
+def _export_projects(tmp_path, *args):
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira_class.return_value.enhanced_search_issues.side_effect = (
+            _search_by_project
+        )
+        return runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(_multi_project_config_file(tmp_path)),
+                "export",
+                "--format",
+                "json",
+                *args,
+            ],
+        )
+
+
+def test_export_several_projects(tmp_path):
+    output = tmp_path / "{project_id}.json"
+
+    result = _export_projects(
+        tmp_path, "-p", "alpha", "-p", "gamma", "--output", str(output)
+    )
+
+    assert result.exit_code == 0, result.output
+    for project_id, project in [("alpha", "ALPHA"), ("gamma", "GAMMA")]:
+        issues = json.loads((tmp_path / f"{project_id}.json").read_text())["issues"]
+        assert [issue["key"] for issue in issues] == [f"{project}-1"]
+    assert not (tmp_path / "beta.json").exists()
+
+
+def test_export_all_projects(tmp_path):
+    output = tmp_path / "{project_id}.json"
+
+    result = _export_projects(
+        tmp_path, "--all", "--output", str(output), "--concurrency", "3"
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == [
+        "alpha.json",
+        "beta.json",
+        "gamma.json",
+    ]
+
+
+def test_export_all_projects_does_not_let_a_busy_domain_starve_others(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(
+        "\n".join(
+            f'[projects.{project.lower()}]\nuser = "test@example.com"\n'
+            f'domain = "{domain}"\nproject = "{project}"\n'
+            for project, domain in [
+                *((f"BUSY{n}", "busy.atlassian.net") for n in range(5)),
+                ("OTHER", "other.atlassian.net"),
+            ]
+        )
+    )
+    other_started = threading.Event()
+    waited = []
+
+    def search(jql, **_):
+        project = jql.split('"')[1]
+        if project == "OTHER":
+            other_started.set()
+        else:
+            # The busy domain's exports only complete once the other domain's
+            # export started, which requires a free worker.
+            waited.append(other_started.wait(timeout=2))
+
+        return fake_result([make_issue(key=f"{project}-1")])
+
+    with (
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira_class.return_value.enhanced_search_issues.side_effect = search
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(config_file),
+                "export",
+                "--all",
+                "--output",
+                str(tmp_path / "{project_id}.json"),
+                "--concurrency",
+                "2",
+                "--per-domain",
+                "1",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert waited == [True] * 5
+    assert len(list(tmp_path.glob("*.json"))) == 6
+
+
+def test_export_several_projects_requires_output_template(tmp_path):
+    result = _export_projects(
+        tmp_path, "-p", "alpha", "-p", "beta", "--output", str(tmp_path / "out.json")
+    )
+
+    assert result.exit_code != 0
+    assert "{project_id}" in result.output
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_export_several_projects_reports_failures(tmp_path):
+    output = tmp_path / "{project_id}.json"
+
+    result = _export_projects(
+        tmp_path, "--all", "--output", str(output), "--jql", "summary ~ fail"
+    )
+
+    assert result.exit_code == 1
+    assert (tmp_path / "alpha.json").exists()
+    assert (tmp_path / "gamma.json").exists()
+    assert not (tmp_path / "beta.json").exists()
+    assert not (tmp_path / "beta.json.partial").exists()
+
+
+def test_export_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "alpha.parquet"
+
+    result = _export_projects(
+        tmp_path, "-p", "alpha", "--format", "parquet", "--output", str(output)
+    )
+
+    assert result.exit_code == 0, result.output
+    assert pq.read_table(output, columns=["key", "summary"]).to_pylist() == [
+        {"key": "ALPHA-1", "summary": "ALPHA"}
+    ]
+
+
+def test_export_parquet_requires_output(tmp_path):
+    result = _export_projects(tmp_path, "-p", "alpha", "--format", "parquet")
+
+    assert result.exit_code != 0
+    assert "--output" in result.output
+
+
+def test_export_compressed(tmp_path):
+    output = tmp_path / "alpha.json.gz"
+
+    result = _export_projects(
+        tmp_path, "-p", "alpha", "--output", str(output), "--compress", "gzip"
+    )
+
+    assert result.exit_code == 0, result.output
+    issues = json.loads(gzip.decompress(output.read_bytes()))["issues"]
+    assert [issue["key"] for issue in issues] == ["ALPHA-1"]
+
+
+def test_export_compress_requires_output(tmp_path):
+    result = _export_projects(tmp_path, "-p", "alpha", "--compress", "gzip")
+
+    assert result.exit_code != 0
+    assert "--output" in result.output
+
+
+def test_export_output_dir(tmp_path):
+    output_dir = tmp_path / "{project_id}"
+
+    result = _export_projects(
+        tmp_path,
+        "-p",
+        "alpha",
+        "-p",
+        "gamma",
+        "--output-dir",
+        str(output_dir),
+        "--max-issues-per-file",
+        "1",
+    )
+
+    assert result.exit_code == 0, result.output
+    for project_id, project in [("alpha", "ALPHA"), ("gamma", "GAMMA")]:
+        manifest = json.loads((tmp_path / project_id / "manifest.json").read_text())
+        assert manifest["issues"] == 1
+        (file,) = manifest["files"]
+        issues = json.loads((tmp_path / project_id / file["path"]).read_text())
+        assert [issue["key"] for issue in issues["issues"]] == [f"{project}-1"]
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_export_output_dir_replaces_previous_export(tmp_path):
+    output_dir = tmp_path / "alpha"
+    output_dir.mkdir()
+    (output_dir / "stale.json").write_text("{}")
+
+    result = _export_projects(tmp_path, "-p", "alpha", "--output-dir", str(output_dir))
+
+    assert result.exit_code == 0, result.output
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "issues-00001.json",
+        "manifest.json",
+    ]
+
+
+def test_export_output_dir_removes_stale_previous_directory(tmp_path):
+    output_dir = tmp_path / "alpha"
+    output_dir.mkdir()
+    # Left behind by an interrupted replace.
+    (tmp_path / "alpha.previous").mkdir()
+    (tmp_path / "alpha.previous" / "manifest.json").write_text("{}")
+
+    result = _export_projects(tmp_path, "-p", "alpha", "--output-dir", str(output_dir))
+
+    assert result.exit_code == 0, result.output
+    assert (output_dir / "manifest.json").exists()
+    assert not (tmp_path / "alpha.previous").exists()
+
+
+def test_export_max_issues_per_file_requires_output_dir(tmp_path):
+    result = _export_projects(
+        tmp_path, "-p", "alpha", "--output", "out.json", "--max-issues-per-file", "1"
+    )
+
+    assert result.exit_code != 0
+    assert "--output-dir" in result.output
+
+
+def test_export_output_and_output_dir_are_exclusive(tmp_path):
+    result = _export_projects(
+        tmp_path,
+        "-p",
+        "alpha",
+        "--output",
+        str(tmp_path / "out.json"),
+        "--output-dir",
+        str(tmp_path / "out"),
+    )
+
+    assert result.exit_code != 0
+    assert "--output-dir" in result.output
+
+
+def test_export_reads_api_keys_from_env_file(tmp_path):
+    env_file = tmp_path / "keys.env"
+    env_file.write_text("JIRA_EXPORT_API_KEY_ALPHA=from-file\n")
+
+    with (
+        patch("keyring.get_password") as get_password,
+        patch("jira.JIRA") as mock_jira_class,
+    ):
+        mock_jira_class.return_value.enhanced_search_issues.side_effect = (
+            _search_by_project
+        )
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(_multi_project_config_file(tmp_path)),
+                "--env-file",
+                str(env_file),
+                "export",
+                "-p",
+                "alpha",
+                "--format",
+                "json",
+                "--output",
+                str(tmp_path / "alpha.json"),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    get_password.assert_not_called()
+    assert mock_jira_class.call_args.kwargs["basic_auth"][1] == "from-file"
+
+
+@pytest.mark.parametrize(
+    ("args", "error"),
+    [
+        (["--output-dir", "out"], "--output-dir"),
+        (["--output", "out.toml", "--incremental"], "--incremental"),
+        (["--format", "json"], "JSON lines"),
+    ],
+)
+def test_diff_against_invalid_options(tmp_path, args, error):
+    result = runner.invoke(
+        app,
+        [
+            "--config-file",
+            str(_config_file(tmp_path)),
+            "export",
+            "-p",
+            "alpha",
+            "--diff-against",
+            str(tmp_path / "alpha.index"),
+            *args,
+        ],
+    )
+
+    assert result.exit_code != 0
+    assert error in result.output
@@ -137,8 +137,8 @@ def test_remove_project_cancel(tmp_path):
 def test_ping_project_success(tmp_path):
     config_file = _config_path(tmp_path)
     with (
-        patch("jira_export.models.project.keyring.get_password", return_value="secret"),
-        patch("jira_export.models.project.JIRA") as mock_jira,
+        patch("keyring.get_password", return_value="secret"),
+        patch("jira.JIRA") as mock_jira,
     ):
         mock_instance = mock_jira.return_value
         mock_instance.myself.return_value = {"displayName": "Test User"}
@@ -0,0 +1,54 @@
+"""Guard the CLI startup time, which scripts pay on every invocation.
+
+Each command runs in a fresh interpreter with `-X importtime`, whose report
+lists every imported module with its cumulative import time.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Only imported by the commands that talk to Jira or prompt the user.
+HEAVY_MODULES = ["jira", "requests", "keyring", "questionary", "rich.progress"]
+# Import time of `jira_export.cli.app`, in microseconds: about 100ms on a
+# developer machine, against over 500ms when every command was imported
+# eagerly. The margin is for slower CI machines.
+BUDGET_US = 250_000
+
+_RUN_CLI = "from jira_export.__main__ import main; main()"
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUN_CLI, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param(["--help"], id="help"),
+        pytest.param(["export", "--help"], id="export-help"),
+        pytest.param(["projects", "list"], id="projects-list"),
+    ],
+)
+def test_startup_skips_heavy_modules(tmp_path, args):
+    if args[0] == "projects":
+        args = ["--config-file", str(tmp_path / "config.toml"), *args]
+
+    times = _import_times(*args)
+
+    assert "jira_export.cli.app" in times
+    assert [module for module in HEAVY_MODULES if module in times] == []
+    assert times["jira_export.cli.app"] < BUDGET_US
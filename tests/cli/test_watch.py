@@ -0,0 +1,37 @@
+import json
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from jira_export.cli.app import app
+
+runner = CliRunner()
+
+
+def test_watch_prints_issues_as_json_lines(fake_jira, tmp_path):
+    fake_jira(issues=5)
+
+    # Interrupt the watch instead of waiting for the second poll.
+    with (
+        patch("keyring.get_password", return_value="key"),
+        patch("jira_export.watcher.time.sleep", side_effect=KeyboardInterrupt),
+    ):
+        result = runner.invoke(
+            app,
+            [
+                "--config-file",
+                str(tmp_path / "config.toml"),
+                "watch",
+                "-p",
+                "fake",
+                "--fields",
+                "labels",
+                "--since",
+                "2024-01-01T00:03:00",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["key"] for line in lines] == ["FAKE-3", "FAKE-4", "FAKE-5"]
+    assert "labels" in lines[0]
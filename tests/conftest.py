@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from benchmarks.fake_jira import FakeJiraServer, Knobs
+from jira_export.fetch.scheduler import clear_schedulers
+from jira_export.models.project import clear_jira_clients
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_clients():
+    clear_jira_clients()
+    clear_schedulers()
+    yield
+    clear_jira_clients()
+    clear_schedulers()
+
+
+@pytest.fixture
+def fake_jira(tmp_path):
+    # Start a fake Jira server with the given knobs, configured as the `fake`
+    # project of `tmp_path / "config.toml"`.
+    servers = []
+
+    def start(**knobs) -> FakeJiraServer:
+        server = FakeJiraServer(("127.0.0.1", 0), Knobs(**knobs))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+        host, port = server.server_address[:2]
+        (tmp_path / "config.toml").write_text(
+            f'[projects.fake]\nuser = "fake@example.com"\ndomain = "{host}:{port}"\n'
+            f'project = "FAKE"\nscheme = "http"\n'
+        )
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,88 @@
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from jira_export.fetch.attachments import AttachmentStore
+
+
+def _jira(contents):
+    jira = MagicMock()
+
+    def get(url, *, stream):
+        assert stream is True
+        response = MagicMock()
+        response.iter_content.return_value = [contents[url][:3], contents[url][3:]]
+        return response
+
+    jira._session.get.side_effect = get
+    return jira
+
+
+def _attachment(attachment_id, url):
+    return {
+        "id": attachment_id,
+        "filename": f"{attachment_id}.txt",
+        "mimeType": "text/plain",
+        "size": 6,
+        "content": url,
+    }
+
+
+def _issue(key, *attachments):
+    return {"key": key, "fields": {"attachment": list(attachments)}}
+
+
+def test_stores_content_once(tmp_path):
+    jira = _jira({"u1": b"same!!", "u2": b"same!!", "u3": b"other!"})
+    page = [
+        _issue("TEST-1", _attachment("1", "u1"), _attachment("2", "u3")),
+        _issue("TEST-2", _attachment("3", "u2")),
+        _issue("TEST-3"),
+    ]
+
+    with AttachmentStore(tmp_path, jira, domain="example") as store:
+        stored = store.store_page(page)
+
+    sha = hashlib.sha256(b"same!!").hexdigest()
+    assert stored["TEST-1"][0] == {
+        "id": "1",
+        "filename": "1.txt",
+        "mimeType": "text/plain",
+        "size": 6,
+        "path": f"sha256/{sha[:2]}/{sha}",
+    }
+    assert stored["TEST-2"][0]["path"] == stored["TEST-1"][0]["path"]
+    assert "TEST-3" not in stored
+    assert (tmp_path / stored["TEST-1"][0]["path"]).read_bytes() == b"same!!"
+    assert len(list((tmp_path / "sha256").rglob("*"))) == 4  # 2 dirs, 2 files
+    assert not list(tmp_path.glob(".download-*"))
+
+
+def test_skips_stored_attachments(tmp_path):
+    jira = _jira({"u1": b"content"})
+    page = [_issue("TEST-1", _attachment("1", "u1"))]
+
+    with AttachmentStore(tmp_path, jira, domain="example") as store:
+        first = store.store_page(page)
+    with AttachmentStore(tmp_path, jira, domain="example") as store:
+        second = store.store_page(page)
+
+    assert first == second
+    assert jira._session.get.call_count == 1
+    assert (store.downloaded, store.skipped) == (0, 1)
+
+
+def test_failed_download_leaves_nothing_behind(tmp_path):
+    jira = MagicMock()
+    jira._session.get.return_value.iter_content.side_effect = OSError("reset")
+    page = [_issue("TEST-1", _attachment("1", "u1"))]
+
+    with (
+        pytest.raises(OSError, match="reset"),
+        AttachmentStore(tmp_path, jira, domain="example") as store,
+    ):
+        store.store_page(page)
+
+    assert not list(tmp_path.glob(".download-*"))
+    assert not list((tmp_path / "refs" / "example").iterdir())
@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+from jira_export.fetch.changelog import fetch_changelogs
+
+
+def _history(created, status_from, status_to):
+    return {
+        "created": created,
+        "author": {"displayName": "Ada"},
+        "items": [
+            {"field": "status", "fromString": status_from, "toString": status_to}
+        ],
+    }
+
+
+def test_fetch_changelogs_follows_next_page_token():
+    jira = MagicMock()
+    jira._get_json.side_effect = [
+        {
+            "issueChangeLogs": [
+                {"issueId": "1", "changeHistories": [_history("t1", "Open", "Doing")]}
+            ],
+            "nextPageToken": "token-1",
+        },
+        {
+            "issueChangeLogs": [
+                {"issueId": "1", "changeHistories": [_history("t2", "Doing", "Done")]},
+            ]
+        },
+    ]
+    issues = [{"id": "1", "key": "TEST-1"}, {"id": "2", "key": "TEST-2"}]
+
+    changelogs = fetch_changelogs(jira, issues)
+
+    assert [(entry["from"], entry["to"]) for entry in changelogs["TEST-1"]] == [
+        ("Open", "Doing"),
+        ("Doing", "Done"),
+    ]
+    assert "TEST-2" not in changelogs
+    first, second = (call.kwargs for call in jira._get_json.call_args_list)
+    assert first["params"]["issueIdsOrKeys"] == ["TEST-1", "TEST-2"]
+    assert "nextPageToken" not in first["params"]
+    assert second["params"]["nextPageToken"] == "token-1"
+    assert first["use_post"] is True
+
+
+def test_fetch_changelogs_in_batches(monkeypatch):
+    monkeypatch.setattr("jira_export.fetch.changelog.CHANGELOG_BATCH_SIZE", 2)
+    jira = MagicMock()
+    jira._get_json.return_value = {"issueChangeLogs": []}
+    issues = [{"id": str(i), "key": f"TEST-{i}"} for i in range(5)]
+
+    fetch_changelogs(jira, issues)
+
+    assert [
+        len(call.kwargs["params"]["issueIdsOrKeys"])
+        for call in jira._get_json.call_args_list
+    ] == [2, 2, 1]
@@ -0,0 +1,72 @@
+import pytest
+
+from jira_export.fetch.checkpoint import Checkpoint
+from jira_export.models.errors import CheckpointMismatchError
+
+PAGES = [[{"key": f"TEST-{i}"}] for i in range(1, 5)]
+
+
+class Fetcher:
+    """Serve `PAGES` from a token, optionally failing after some pages."""
+
+    def __init__(self, fail_after: int | None = None):
+        self.fail_after = fail_after
+        self.tokens: list[str | None] = []
+
+    def __call__(self, page_token):
+        self.tokens.append(page_token)
+        for index in range(int(page_token or 0), len(PAGES)):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise RuntimeError("interrupted")
+            next_token = str(index + 1) if index + 1 < len(PAGES) else None
+            yield PAGES[index], next_token
+
+
+def _checkpoint(tmp_path, *, resume=False, fingerprint=None) -> Checkpoint:
+    checkpoint = Checkpoint(
+        tmp_path / "checkpoint", fingerprint or {"query": "q"}, resume=resume
+    )
+    checkpoint.plan(lambda: ["q"])
+    return checkpoint
+
+
+def test_resume_replays_stored_pages_then_continues(tmp_path):
+    pages = []
+    with pytest.raises(RuntimeError, match="interrupted"):
+        pages.extend(_checkpoint(tmp_path).iter_pages(0, Fetcher(fail_after=2)))
+
+    fetcher = Fetcher()
+    resumed = list(_checkpoint(tmp_path, resume=True).iter_pages(0, fetcher))
+
+    assert pages == PAGES[:2]
+    assert resumed == PAGES
+    assert fetcher.tokens == ["2"]
+
+
+def test_resume_completed_shard_does_not_fetch(tmp_path):
+    list(_checkpoint(tmp_path).iter_pages(0, Fetcher()))
+
+    fetcher = Fetcher()
+    assert list(_checkpoint(tmp_path, resume=True).iter_pages(0, fetcher)) == PAGES
+    assert fetcher.tokens == []
+
+
+def test_resume_keeps_planned_shards(tmp_path):
+    Checkpoint(tmp_path, {}).plan(lambda: ["a", "b"])
+
+    assert Checkpoint(tmp_path, {}, resume=True).plan(lambda: ["c"]) == ["a", "b"]
+
+
+def test_without_resume_starts_over(tmp_path):
+    list(_checkpoint(tmp_path).iter_pages(0, Fetcher(fail_after=None)))
+
+    fetcher = Fetcher()
+    assert list(_checkpoint(tmp_path).iter_pages(0, fetcher)) == PAGES
+    assert fetcher.tokens == [None]
+
+
+def test_resume_other_export_fails(tmp_path):
+    _checkpoint(tmp_path)
+
+    with pytest.raises(CheckpointMismatchError):
+        _checkpoint(tmp_path, resume=True, fingerprint={"query": "other"})
@@ -0,0 +1,42 @@
+from datetime import UTC, datetime
+
+from jira_export.fetch.incremental import latest_update, merge_items, updated_since
+from jira_export.models.project_item import ProjectItem
+
+
+def _item(key: str, summary: str = "Summary") -> ProjectItem:
+    return ProjectItem(key, summary, None, None, None, None)
+
+
+def _issue(updated: str):
+    return {"key": "TEST-1", "fields": {"updated": updated}}
+
+
+def test_updated_since_unknown_time_zone_widens_window():
+    watermark = datetime(2024, 1, 2, 12, 0, tzinfo=UTC)
+    assert updated_since(watermark, "Not/AZone") == 'updated >= "2024/01/01 12:00"'
+
+
+def test_latest_update():
+    current = datetime(2024, 1, 1, tzinfo=UTC)
+    issues = [
+        _issue("2024-01-03T00:00:00.000+0100"),
+        _issue("2024-01-02T00:00:00.000+0000"),
+    ]
+
+    assert latest_update(issues, current) == datetime(2024, 1, 2, 23, tzinfo=UTC)
+    assert latest_update([], current) == current
+
+
+def test_merge_items_replaces_and_appends():
+    previous = [_item("TEST-1"), _item("TEST-2")]
+    changed = {"TEST-3": _item("TEST-3"), "TEST-1": _item("TEST-1", "Changed")}
+
+    merged = list(merge_items(previous, changed))
+
+    assert [(item.key, item.summary) for item in merged] == [
+        ("TEST-1", "Changed"),
+        ("TEST-2", "Summary"),
+        ("TEST-3", "Summary"),
+    ]
+    assert len(changed) == 2
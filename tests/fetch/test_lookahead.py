@@ -0,0 +1,47 @@
+import threading
+
+import pytest
+
+from jira_export.fetch.lookahead import iter_ahead
+
+
+def test_keeps_order():
+    release_first = threading.Event()
+
+    def fetch(page):
+        if page == 1:
+            # The second page is done first, but still yielded after this one.
+            release_first.wait(timeout=5)
+        else:
+            release_first.set()
+        return page * 10
+
+    assert list(iter_ahead([1, 2, 3], fetch, workers=2)) == [
+        (1, 10),
+        (2, 20),
+        (3, 30),
+    ]
+
+
+def test_fetches_ahead_of_the_consumer():
+    produced = []
+
+    def pages():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    results = iter_ahead(pages(), lambda page: page, workers=2)
+    next(results)
+
+    # The first page is only yielded once two more are in flight, and no more.
+    assert produced == [0, 1, 2]
+    results.close()
+
+
+def test_reraises_errors():
+    def fetch(page):
+        raise ValueError(page)
+
+    with pytest.raises(ValueError, match="1"):
+        list(iter_ahead([1, 2], fetch))
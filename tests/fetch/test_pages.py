@@ -0,0 +1,32 @@
+from unittest.mock import MagicMock
+
+from jira_export.fetch.pages import iter_issue_pages
+
+
+def _page(issues, next_page_token=None):
+    return {"issues": issues, "nextPageToken": next_page_token}
+
+
+def test_follows_next_page_token():
+    jira = MagicMock()
+    jira.enhanced_search_issues.side_effect = [
+        _page(["a", "b"], "token-1"),
+        _page(["c"], None),
+    ]
+
+    pages = list(iter_issue_pages(jira, "project=TEST", page_size=2))
+
+    assert pages == [["a", "b"], ["c"]]
+    assert (
+        jira.enhanced_search_issues.call_args_list[1].kwargs["nextPageToken"]
+        == "token-1"
+    )
+    assert jira.enhanced_search_issues.call_args.kwargs["json_result"] is True
+
+
+def test_stops_on_empty_page():
+    jira = MagicMock()
+    jira.enhanced_search_issues.return_value = _page([], "token")
+
+    assert list(iter_issue_pages(jira, "project=TEST")) == []
+    assert jira.enhanced_search_issues.call_count == 1
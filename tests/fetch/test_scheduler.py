@@ -0,0 +1,148 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+
+from jira_export.constants import REQUEST_RATE
+from jira_export.fetch.scheduler import (
+    RequestScheduler,
+    get_scheduler,
+    scheduled,
+)
+
+
+class FakeJiraError(Exception):
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def _failing(*errors):
+    remaining = list(errors)
+
+    def fn():
+        if remaining:
+            raise remaining.pop(0)
+        return "ok"
+
+    return fn
+
+
+def _scheduler(**kwargs) -> RequestScheduler:
+    return RequestScheduler(**{"base_delay": 0.01, "rate": 1000, **kwargs})
+
+
+def test_retries_transient_errors():
+    scheduler = _scheduler()
+
+    result = scheduler.call(_failing(FakeJiraError(503), RequestsConnectionError()))
+
+    assert result == "ok"
+    assert scheduler.stats.retries == 2
+    assert scheduler.stats.requests == 3
+
+
+def test_does_not_retry_client_errors():
+    scheduler = _scheduler()
+
+    with pytest.raises(FakeJiraError):
+        scheduler.call(_failing(FakeJiraError(400)))
+
+    assert scheduler.stats.retries == 0
+
+
+def test_gives_up_after_max_retries():
+    scheduler = _scheduler(max_retries=2)
+
+    with pytest.raises(FakeJiraError):
+        scheduler.call(_failing(*(FakeJiraError(502) for _ in range(3))))
+
+    assert scheduler.stats.retries == 2
+
+
+def test_rate_limit_honours_retry_after_and_halves_concurrency():
+    scheduler = _scheduler(max_concurrency=8)
+
+    started = time.monotonic()
+    scheduler.call(_failing(FakeJiraError(429, {"Retry-After": "0.2"})))
+
+    assert time.monotonic() - started >= 0.2
+    assert scheduler.concurrency_limit == 4
+    assert scheduler.stats.rate_limited == 1
+    assert scheduler.stats.throttled_seconds >= 0.15
+
+
+def test_rate_limit_jitter_counts_as_throttled():
+    scheduler = _scheduler(base_delay=0.05, rng=random.Random(0))
+    jitter = random.Random(0)
+    expected = jitter.uniform(0, 0.05) + jitter.uniform(0, 0.05)
+
+    scheduler.call(
+        _failing(*(FakeJiraError(429, {"Retry-After": "0"}) for _ in range(2)))
+    )
+
+    assert scheduler.stats.rate_limited == 2
+    assert scheduler.stats.throttled_seconds >= expected
+
+
+def test_token_bucket_limits_rate():
+    scheduler = RequestScheduler(rate=50, burst=1)
+
+    started = time.monotonic()
+    for _ in range(4):
+        scheduler.call(lambda: None)
+
+    assert time.monotonic() - started >= 0.05
+
+
+def test_limits_concurrency():
+    scheduler = _scheduler(max_concurrency=2)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        for future in [executor.submit(scheduler.call, work) for _ in range(12)]:
+            future.result()
+
+    assert peak == 2
+
+
+def test_scheduled_without_scheduler_is_identity():
+    def fn():
+        return 1
+
+    assert scheduled(fn, None) is fn
+    assert scheduled(fn, _scheduler())() == 1
+
+
+def test_get_scheduler_is_shared_per_domain():
+    first = get_scheduler("a.atlassian.net", max_concurrency=2)
+
+    assert get_scheduler("a.atlassian.net", max_concurrency=4) is first
+    assert first.max_concurrency == 4
+    assert get_scheduler("b.atlassian.net") is not first
+
+
+def test_get_scheduler_rate_is_configurable():
+    scheduler = get_scheduler("a.atlassian.net", rate=2.5)
+
+    assert (scheduler.rate, scheduler.burst) == (2.5, 3)
+    # Without a rate, the scheduler keeps its own.
+    assert get_scheduler("a.atlassian.net").burst == 3
+    assert get_scheduler("a.atlassian.net", rate=20).burst == 20
+    assert get_scheduler("b.atlassian.net").rate == REQUEST_RATE
@@ -0,0 +1,105 @@
+import re
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from jira_export.fetch.shards import iter_sharded_pages, plan_created_shards
+
+
+class FakeJira:
+    """Answers `created` window queries over an in-memory list of issues."""
+
+    def __init__(self, count: int, fail_on: str | None = None):
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        self.issues = [
+            {
+                "key": f"TEST-{i}",
+                "fields": {
+                    "created": (start + timedelta(hours=i)).isoformat(
+                        timespec="milliseconds"
+                    )
+                },
+            }
+            for i in range(1, count + 1)
+        ]
+        self.fail_on = fail_on
+        self.queries: list[str] = []
+
+    def _matches(self, query: str, issue) -> bool:
+        created = datetime.fromisoformat(issue["fields"]["created"]).strftime(
+            "%Y/%m/%d %H:%M"
+        )
+        for op, bound in re.findall(r'created (>=|<) "([^"]+)"', query):
+            if op == ">=" and not created >= bound:
+                return False
+            if op == "<" and not created < bound:
+                return False
+        return True
+
+    def enhanced_search_issues(self, query, maxResults=50, nextPageToken=None, **_):
+        self.queries.append(query)
+        if self.fail_on and self.fail_on in query:
+            raise RuntimeError("search failed")
+
+        matches = [issue for issue in self.issues if self._matches(query, issue)]
+        if "ORDER BY created DESC" in query:
+            matches.reverse()
+        start = int(nextPageToken or 0)
+        end = start + maxResults
+        response = {"issues": matches[start:end]}
+        if end < len(matches):
+            response["nextPageToken"] = str(end)
+        return response
+
+
+def test_plan_single_shard_keeps_query():
+    jira = FakeJira(10)
+    assert plan_created_shards(jira, 'project="TEST"', 1) == ['project="TEST"']
+    assert jira.queries == []
+
+
+def test_plan_shards_are_disjoint_and_complete():
+    jira = FakeJira(100)
+    queries = plan_created_shards(jira, 'project="TEST"', 4)
+
+    assert len(queries) == 4
+    matched = [
+        issue["key"]
+        for query in queries
+        for issue in jira.issues
+        if jira._matches(query, issue)
+    ]
+    assert sorted(matched) == sorted(issue["key"] for issue in jira.issues)
+
+
+def test_sharded_pages_are_merged_in_key_order():
+    jira = FakeJira(95)
+
+    pages = list(
+        iter_sharded_pages(jira, 'project="TEST"', workers=3, count=95, page_size=10)
+    )
+
+    keys = [issue["key"] for page in pages for issue in page]
+    assert keys == [f"TEST-{i}" for i in range(1, 96)]
+    assert all(len(page) <= 10 for page in pages)
+    assert sum('created >= "' in query for query in jira.queries) > 0
+
+
+def test_small_count_uses_single_shard():
+    jira = FakeJira(5)
+
+    pages = list(iter_sharded_pages(jira, 'project="TEST"', workers=8, count=5))
+
+    assert [issue["key"] for issue in pages[0]] == [f"TEST-{i}" for i in range(1, 6)]
+    assert jira.queries == ['project="TEST" ORDER BY key ASC']
+
+
+def test_shard_failure_is_raised():
+    jira = FakeJira(50, fail_on="created >=")
+
+    with pytest.raises(RuntimeError, match="search failed"):
+        list(
+            iter_sharded_pages(
+                jira, 'project="TEST"', workers=2, count=50, page_size=10
+            )
+        )
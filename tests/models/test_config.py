@@ -2,6 +2,8 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch
 
+from pydantic import ValidationError
+
 from jira_export.models.config import Config
 from jira_export.models.project import Project
 from jira_export.models.errors import ProjectNotFoundError
@@ -60,7 +62,7 @@ def test_remove_project():
     config.projects["alpha"] = Project(
         user="test@example.com", domain="test.atlassian.net", project="TEST"
     )
-    with patch("jira_export.models.project.keyring.delete_password"):
+    with patch("keyring.delete_password"):
         config.remove_project("alpha")
     assert "alpha" not in config.projects
 
@@ -70,7 +72,82 @@ def test_get_and_load_project():
     config.projects["alpha"] = Project(
         user="test@example.com", domain="test.atlassian.net", project="TEST"
     )
-    with patch("jira_export.models.project.keyring.get_password", return_value="secret"):
+    with patch("keyring.get_password", return_value="secret"):
         result = config.get_and_load_project("alpha")
         assert result.user == "test@example.com"
-        assert result.api_key.get_secret_value() == "secret"
\ No newline at end of file
+        assert result.api_key.get_secret_value() == "secret"
+
+def test_load_projects_resolves_keys_in_one_batch():
+    config = Config()
+    for project_id in ["alpha", "beta"]:
+        config.projects[project_id] = Project(
+            user="test@example.com", domain="test.atlassian.net", project="TEST"
+        )
+
+    with patch("keyring.get_password", return_value="secret") as get_password:
+        projects = config.load_projects(["alpha", "beta"])
+
+    assert [project.api_key.get_secret_value() for project in projects.values()] == [
+        "secret",
+        "secret",
+    ]
+    get_password.assert_called_once()
+
+
+def _write_profiles(config_path, count):
+    config_path.write_text(
+        "".join(
+            f'[projects.p{i}]\nuser = "u{i}"\ndomain = "d{i}"\nproject = "P{i}"\n\n'
+            for i in range(count)
+        )
+    )
+
+
+def test_projects_are_validated_on_access(tmp_path):
+    config_path = tmp_path / "config.toml"
+    _write_profiles(config_path, 2)
+    # An invalid profile does not get in the way of the others.
+    config_path.write_text(config_path.read_text() + "[projects.broken]\nuser = 1\n")
+
+    config = Config.load(config_path)
+
+    assert list(config.projects) == ["p0", "p1", "broken"]
+    assert config.get_project("p1").domain == "d1"
+    with pytest.raises(ValidationError):
+        config.get_project("broken")
+
+
+def test_save_keeps_unvalidated_projects(tmp_path):
+    config_path = tmp_path / "config.toml"
+    _write_profiles(config_path, 3)
+
+    config = Config.load(config_path)
+    config.projects["p1"] = Project(user="new", domain="d1", project="P1")
+    config.save(config_path)
+
+    loaded = Config.load(config_path)
+    assert [project.user for project in loaded.projects.values()] == ["u0", "new", "u2"]
+
+
+def test_load_uses_cache_while_file_is_unchanged(tmp_path):
+    config_path = tmp_path / "config.toml"
+    cache = tmp_path / ".config.toml.cache"
+    _write_profiles(config_path, 2)
+
+    Config.load(config_path, cache=cache)
+    with patch("tomllib.loads") as loads:
+        config = Config.load(config_path, cache=cache)
+    assert list(config.projects) == ["p0", "p1"]
+    loads.assert_not_called()
+
+    _write_profiles(config_path, 3)
+    assert list(Config.load(config_path, cache=cache).projects) == ["p0", "p1", "p2"]
+
+
+def test_load_ignores_corrupt_cache(tmp_path):
+    config_path = tmp_path / "config.toml"
+    cache = tmp_path / ".config.toml.cache"
+    _write_profiles(config_path, 1)
+    cache.write_text("{not json")
+
+    assert list(Config.load(config_path, cache=cache).projects) == ["p0"]
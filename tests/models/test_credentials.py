@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+import pytest
+
+from jira_export.models.credentials import CredentialResolver, read_env_file
+from jira_export.models.project import Project
+
+
+def _projects(*project_ids, domain="test.atlassian.net", project="TEST"):
+    return {
+        project_id: Project(user="test@example.com", domain=domain, project=project)
+        for project_id in project_ids
+    }
+
+
+def test_environment_comes_before_keyring():
+    resolver = CredentialResolver(
+        environ={"JIRA_EXPORT_API_KEY_ALPHA": "alpha-key", "JIRA_EXPORT_API_KEY": "key"}
+    )
+
+    with patch("keyring.get_password") as get_password:
+        keys = resolver.resolve(_projects("alpha", "beta"))
+
+    assert keys["alpha"].get_secret_value() == "alpha-key"
+    assert keys["beta"].get_secret_value() == "key"
+    get_password.assert_not_called()
+
+
+def test_env_file(tmp_path):
+    env_file = tmp_path / "keys.env"
+    env_file.write_text(
+        "# API keys\n"
+        "\n"
+        "export JIRA_EXPORT_API_KEY_MY_PROJECT='file-key'\n"
+        'JIRA_EXPORT_API_KEY = "shared key"\n'
+        "not a variable\n"
+    )
+
+    assert read_env_file(env_file) == {
+        "JIRA_EXPORT_API_KEY_MY_PROJECT": "file-key",
+        "JIRA_EXPORT_API_KEY": "shared key",
+    }
+
+    resolver = CredentialResolver(
+        env_file=env_file, environ={"JIRA_EXPORT_API_KEY_OTHER": "env-key"}
+    )
+    keys = resolver.resolve(_projects("my-project", "other", "third"))
+
+    assert {project_id: key.get_secret_value() for project_id, key in keys.items()} == {
+        "my-project": "file-key",
+        "other": "env-key",
+        "third": "shared key",
+    }
+
+
+def test_keyring_is_queried_once_per_key():
+    resolver = CredentialResolver(environ={})
+    projects = {
+        **_projects("alpha", "alias"),
+        **_projects("gamma", domain="other.atlassian.net"),
+    }
+
+    with patch("keyring.get_password", return_value="secret") as get_password:
+        resolver.resolve(projects)
+        resolver.resolve(projects)
+
+    # "alpha" and "alias" share their keyring entry.
+    assert get_password.call_count == 2
+
+
+def test_missing_key():
+    resolver = CredentialResolver(environ={})
+
+    with (
+        patch("keyring.get_password", return_value=None),
+        pytest.raises(ValueError, match="JIRA_EXPORT_API_KEY_ALPHA"),
+    ):
+        resolver.resolve(_projects("alpha"))
+
+
+def test_logs_timing_by_source(caplog):
+    resolver = CredentialResolver(environ={"JIRA_EXPORT_API_KEY_ALPHA": "key"})
+
+    with (
+        caplog.at_level("DEBUG", logger="jira_export.models.credentials"),
+        patch("keyring.get_password", return_value="secret"),
+    ):
+        resolver.resolve(_projects("alpha", "beta"))
+
+    assert "environment: 1, keyring: 1" in caplog.text
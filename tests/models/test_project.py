@@ -22,16 +22,66 @@ def test_loaded_project_get_jira():
         project="TEST",
         api_key=SecretStr("secret"),
     )
-    with patch("jira_export.models.project.JIRA") as mock_jira:
+    with patch("jira.JIRA") as mock_jira:
         jira = loaded.get_jira()
         mock_jira.assert_called_once_with(
-            server="https://test.atlassian.net", basic_auth=("test@example.com", "secret")
+            server="https://test.atlassian.net",
+            basic_auth=("test@example.com", "secret"),
+            get_server_info=False,
+            max_retries=0,
         )
+        assert jira.deploymentType == "Cloud"
+
+
+def _loaded(project: str = "TEST", api_key: str = "secret") -> LoadedProject:
+    return LoadedProject(
+        user="test@example.com",
+        domain="test.atlassian.net",
+        project=project,
+        api_key=SecretStr(api_key),
+    )
+
+
+def test_loaded_project_get_jira_is_cached_per_domain_and_user():
+    with patch("jira.JIRA") as mock_jira:
+        first = _loaded("TEST").get_jira()
+        second = _loaded("OTHER").get_jira()
+
+    assert first is second
+    mock_jira.assert_called_once()
+
+
+def test_loaded_project_get_jira_recreated_when_api_key_changes():
+    with patch("jira.JIRA") as mock_jira:
+        _loaded(api_key="old").get_jira()
+        _loaded(api_key="new").get_jira()
+
+    assert mock_jira.call_count == 2
+
+
+def test_loaded_project_get_jira_grows_pool():
+    with patch("jira.JIRA") as mock_jira:
+        loaded = _loaded()
+        loaded.get_jira(pool_size=4)
+        loaded.get_jira(pool_size=2)
+        loaded.get_jira(pool_size=16)
+
+    session = mock_jira.return_value._session
+    pool_sizes = [call.args[1]._pool_maxsize for call in session.mount.call_args_list]
+    assert pool_sizes == [4, 4, 16, 16]
+
+
+def test_loaded_project_get_jira_uses_scheme():
+    loaded = _loaded().model_copy(update={"domain": "127.0.0.1:8080", "scheme": "http"})
+    with patch("jira.JIRA") as mock_jira:
+        loaded.get_jira()
+
+    assert mock_jira.call_args.kwargs["server"] == "http://127.0.0.1:8080"
 
 
 def test_project_set_api_key():
     project = Project(user="test@example.com", domain="test.atlassian.net", project="TEST")
-    with patch("jira_export.models.project.keyring.set_password") as mock_set:
+    with patch("keyring.set_password") as mock_set:
         project.set_api_key(SecretStr("secret"))
         mock_set.assert_called_once_with(
             f"{APP_NAME}-test.atlassian.net-TEST", "test@example.com", "secret"
@@ -40,7 +90,7 @@ def test_project_set_api_key():
 
 def test_project_get_api_key():
     project = Project(user="test@example.com", domain="test.atlassian.net", project="TEST")
-    with patch("jira_export.models.project.keyring.get_password", return_value="secret") as mock_get:
+    with patch("keyring.get_password", return_value="secret") as mock_get:
         api_key = project.get_api_key()
         assert api_key == SecretStr("secret")
         mock_get.assert_called_once_with(f"{APP_NAME}-test.atlassian.net-TEST", "test@example.com")
@@ -48,14 +98,14 @@ def test_project_get_api_key():
 
 def test_project_get_api_key_not_found():
     project = Project(user="test@example.com", domain="test.atlassian.net", project="TEST")
-    with patch("jira_export.models.project.keyring.get_password", return_value=None):
+    with patch("keyring.get_password", return_value=None):
         with pytest.raises(ValueError):
             project.get_api_key()
 
 
 def test_project_delete_api_key():
     project = Project(user="test@example.com", domain="test.atlassian.net", project="TEST")
-    with patch("jira_export.models.project.keyring.delete_password") as mock_delete:
+    with patch("keyring.delete_password") as mock_delete:
         project.delete_api_key()
         mock_delete.assert_called_once_with(f"{APP_NAME}-test.atlassian.net-TEST", "test@example.com")
 
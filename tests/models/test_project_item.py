@@ -32,4 +32,57 @@ def test_from_issue_none_fields():
     assert item.status is None
     assert item.assignee is None
     assert item.reporter is None
-    assert item.description is None
\ No newline at end of file
+    assert item.description is None
+
+def test_from_issue_extra_fields():
+    mock_issue = MagicMock()
+    mock_issue.raw = {"fields": {"labels": ["a", "b"]}}
+    item = ProjectItem.from_issue(mock_issue, ["labels", "customfield_1"])
+    assert item.extra == {"labels": ["a", "b"], "customfield_1": None}
+
+
+def test_from_raw_reads_extra_fields_by_id():
+    raw = {"key": "A-1", "fields": {"customfield_10016": 5, "labels": ["x"]}}
+
+    item = ProjectItem.from_raw(
+        raw, ["Story Points", "labels"], {"Story Points": "customfield_10016"}
+    )
+
+    assert item.extra == {"Story Points": 5, "labels": ["x"]}
+
+
+def test_to_dict_and_from_dict_round_trip():
+    item = ProjectItem(
+        key="TEST-1",
+        summary="Summary",
+        status=None,
+        assignee="Assignee",
+        reporter=None,
+        description=None,
+        extra={"labels": ["a"]},
+    )
+    data = item.to_dict()
+    assert list(data) == [
+        "key",
+        "summary",
+        "status",
+        "assignee",
+        "reporter",
+        "description",
+        "labels",
+    ]
+    assert ProjectItem.from_dict(data) == item
+
+
+def test_from_dict_missing_optional_fields():
+    item = ProjectItem.from_dict({"key": "TEST-1", "summary": "Summary"})
+    assert item.status is None
+    assert item.extra == {}
+
+
+def test_project_item_is_slotted():
+    item = ProjectItem("TEST-1", "Summary", None, None, None, None)
+
+    assert not hasattr(item, "__dict__")
+    assert item.extra == {}
+    assert dict(item.items()) == item.to_dict()
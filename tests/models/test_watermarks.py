@@ -0,0 +1,27 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from jira_export.models.watermarks import Watermarks
+
+
+def test_load_nonexistent_file(tmp_path):
+    watermarks = Watermarks.load(tmp_path / "watermarks.toml")
+    assert watermarks.projects == {}
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "watermarks.toml"
+    moment = datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=UTC)
+
+    Watermarks(projects={"alpha": moment}).save(path)
+
+    assert Watermarks.load(path).projects == {"alpha": moment}
+
+
+def test_load_invalid_file(tmp_path):
+    path = tmp_path / "watermarks.toml"
+    path.write_text('projects = "unterminated')
+
+    with pytest.raises(ValueError, match="Failed to parse watermarks file"):
+        Watermarks.load(path)
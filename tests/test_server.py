@@ -0,0 +1,208 @@
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import jira
+import pytest
+
+from jira_export.models.app_state import AppState
+from jira_export.models.credentials import CredentialResolver
+from jira_export.server import ExportServer
+
+
+@pytest.fixture
+def servers(fake_jira, tmp_path):
+    started = []
+
+    def start(token: str | None = None, **knobs) -> ExportServer:
+        fake_jira(**knobs)
+        server = ExportServer(
+            ("127.0.0.1", 0),
+            AppState(
+                config_file=tmp_path / "config.toml",
+                credentials=CredentialResolver(environ={"JIRA_EXPORT_API_KEY": "key"}),
+            ),
+            token=token,
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        started.append(server)
+        return server
+
+    yield start
+
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def _post(
+    server: ExportServer, path: str, body: dict, headers: dict | None = None
+) -> bytes:
+    request = urllib.request.Request(
+        f"{server.base_url}{path}",
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"} | (headers or {}),
+        method="POST",
+    )
+    with urllib.request.urlopen(request) as response:
+        return response.read()
+
+
+def _error(
+    server: ExportServer, body: dict, headers: dict | None = None
+) -> tuple[int, str]:
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        _post(server, "/export", body, headers)
+
+    return excinfo.value.code, json.loads(excinfo.value.read())["error"]
+
+
+def test_export_jobs_share_the_warm_client(servers):
+    server = servers(issues=250, max_page_size=100)
+
+    with patch("jira.JIRA", wraps=jira.JIRA) as client_cls:
+        first = _post(server, "/export", {"project_id": "fake", "format": "json"})
+        second = _post(
+            server, "/export", {"project_id": "fake", "format": "json", "parallel": 2}
+        )
+
+    issues = json.loads(first)["issues"]
+    assert [issue["key"] for issue in issues] == [f"FAKE-{n}" for n in range(1, 251)]
+    assert json.loads(second) == json.loads(first)
+    assert client_cls.call_count == 1
+
+
+def test_export_streams_toml_by_default(servers):
+    server = servers(issues=3)
+
+    body = _post(server, "/export", {"project_id": "fake", "fields": ["labels"]})
+
+    assert body.decode().count("[[issues]]") == 3
+    assert "labels = " in body.decode()
+
+
+@pytest.mark.parametrize(
+    ("body", "status", "error"),
+    [
+        ({"project_id": "missing"}, 404, "Project with ID 'missing' not found"),
+        ({"format": "json"}, 400, "project_id"),
+        ({"project_id": "fake", "output": "x.json"}, 400, "output"),
+        ({"project_id": "fake", "format": "parquet"}, 400, "cannot be streamed"),
+    ],
+)
+def test_invalid_jobs_are_rejected(servers, body, status, error):
+    server = servers(issues=3)
+
+    code, message = _error(server, body)
+
+    assert code == status
+    assert error in message
+
+
+@pytest.mark.parametrize(
+    ("headers", "status"),
+    [
+        ({"Content-Length": str(10**9)}, 413),
+        ({"Content-Length": "12abc"}, 400),
+        ({"Content-Length": str(10**9), "Host": "attacker.example:8765"}, 403),
+    ],
+)
+def test_bodies_are_not_read_before_the_job_is_accepted(servers, headers, status):
+    server = servers(issues=3)
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=5)
+
+    # Only the headers are sent: reading the declared body would time out.
+    connection.putrequest("POST", "/export", skip_host="Host" in headers)
+    for name, value in {"Content-Type": "application/json", **headers}.items():
+        connection.putheader(name, value)
+    connection.endheaders()
+    response = connection.getresponse()
+
+    assert response.status == status
+    assert response.getheader("Connection") == "close"
+    connection.close()
+
+
+@pytest.mark.parametrize(
+    ("headers", "status"),
+    [
+        ({"Host": "attacker.example:8765"}, 403),
+        ({"Origin": "http://attacker.example"}, 403),
+        ({"Content-Type": "text/plain"}, 415),
+    ],
+)
+def test_cross_site_requests_are_rejected(servers, headers, status):
+    server = servers(issues=3)
+
+    with patch("jira.JIRA") as client_cls:
+        code, _ = _error(server, {"project_id": "fake"}, headers)
+
+    assert code == status
+    client_cls.assert_not_called()
+
+
+def test_loopback_names_are_accepted(servers):
+    server = servers(issues=3)
+    port = server.server_address[1]
+
+    body = _post(
+        server,
+        "/export",
+        {"project_id": "fake", "format": "json"},
+        {"Host": f"localhost:{port}", "Origin": f"http://localhost:{port}"},
+    )
+
+    assert len(json.loads(body)["issues"]) == 3
+
+
+@pytest.mark.parametrize("authorization", [None, "Bearer wrong", "secret"])
+def test_token_is_required_when_configured(servers, authorization):
+    server = servers(token="secret", issues=3)
+    headers = {"Authorization": authorization} if authorization else {}
+
+    code, message = _error(server, {"project_id": "fake"}, headers)
+
+    assert code == 401
+    assert "token" in message
+
+
+def test_token_allows_any_host(servers):
+    server = servers(token="secret", issues=3)
+
+    body = _post(
+        server,
+        "/export",
+        {"project_id": "fake", "format": "json"},
+        {"Host": "exports.example:8765", "Authorization": "Bearer secret"},
+    )
+
+    assert len(json.loads(body)["issues"]) == 3
+
+
+def test_failed_export_is_cut_short(servers):
+    server = servers(issues=250, max_page_size=100, fail_after=1)
+
+    with pytest.raises(http.client.IncompleteRead):
+        _post(server, "/export", {"project_id": "fake", "format": "json"})
+
+
+def test_projects_follow_config_changes(servers, tmp_path):
+    server = servers(issues=3)
+
+    def projects() -> list[str]:
+        with urllib.request.urlopen(f"{server.base_url}/projects") as response:
+            return json.loads(response.read())["projects"]
+
+    assert projects() == ["fake"]
+
+    config = tmp_path / "config.toml"
+    config.write_text(
+        config.read_text()
+        + '\n[projects.other]\nuser = "a@example.com"\ndomain = "x"\nproject = "X"\n'
+    )
+
+    assert projects() == ["fake", "other"]
@@ -0,0 +1,118 @@
+import re
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fake_jira import FakeJiraServer
+from jira_export.exporter import ExportOptions
+from jira_export.fetch.incremental import WATERMARK_MARGIN
+from jira_export.fetch.pages import iter_issue_page_tokens
+from jira_export.models.project import LoadedProject
+from jira_export.watcher import watch_project
+
+
+@pytest.fixture
+def fake(fake_jira) -> FakeJiraServer:
+    return fake_jira(issues=120, max_page_size=50)
+
+
+def _project(server: FakeJiraServer) -> LoadedProject:
+    host, port = server.server_address[:2]
+    return LoadedProject(
+        user="fake@example.com",
+        domain=f"{host}:{port}",
+        project="FAKE",
+        scheme="http",
+        api_key="key",
+    )
+
+
+def _keys(pages) -> list[list[str]]:
+    return [[item.key for item in page] for page in pages]
+
+
+def test_polls_only_emit_changed_issues(fake):
+    def add_issues(_: float) -> None:
+        fake.knobs.issues += 10
+
+    pages = _keys(
+        watch_project(
+            _project(fake),
+            ExportOptions(),
+            interval=60,
+            polls=3,
+            sleep=add_issues,
+        )
+    )
+
+    emitted = [key for page in pages for key in page]
+    assert emitted == [f"FAKE-{n}" for n in range(1, 141)]
+    # The issues updated in the same minute as the watermark are fetched again
+    # by the next poll, without being emitted twice.
+    assert fake.counters.searches == 3 + 1 + 1
+
+
+def test_first_poll_starts_from_since(fake):
+    pages = watch_project(
+        _project(fake),
+        ExportOptions(extra_fields=["labels"]),
+        interval=60,
+        since=datetime(2024, 1, 1, 1, 50, tzinfo=UTC),
+        polls=1,
+        sleep=lambda _: None,
+    )
+
+    (items,) = list(pages)
+    assert [item.key for item in items] == [f"FAKE-{n}" for n in range(110, 121)]
+    assert "labels" in items[0].extra
+
+
+def test_recent_issues_are_polled_again_but_emitted_once(fake):
+    # Issues updated around the start of a poll may change again before it
+    # ends, so the next poll starts before them, and skips them if unchanged.
+    queries = []
+
+    def pages(jira, query, **kwargs):
+        queries.append(query)
+        return iter_issue_page_tokens(jira, query, **kwargs)
+
+    with (
+        patch("benchmarks.fake_jira.EPOCH", datetime.now(UTC) - timedelta(minutes=118)),
+        patch("jira_export.watcher.iter_issue_page_tokens", pages),
+    ):
+        emitted = _keys(
+            watch_project(
+                _project(fake),
+                ExportOptions(),
+                interval=60,
+                polls=2,
+                sleep=lambda _: None,
+            )
+        )
+
+    assert [key for page in emitted for key in page] == [
+        f"FAKE-{n}" for n in range(1, 121)
+    ]
+    bound = re.search(r'updated >= "([^"]+)"', queries[1]).group(1)
+    polled_again = datetime.strptime(bound, "%Y/%m/%d %H:%M").replace(tzinfo=UTC)
+    assert polled_again <= datetime.now(UTC) - WATERMARK_MARGIN
+
+
+def test_failed_poll_is_retried(fake):
+    fake.knobs.fail_after = 0
+    delays = []
+
+    def recover(delay: float) -> None:
+        delays.append(delay)
+        fake.knobs.fail_after = None
+
+    pages = _keys(
+        watch_project(
+            _project(fake), ExportOptions(), interval=5, polls=2, sleep=recover
+        )
+    )
+
+    assert sum(len(page) for page in pages) == 120
+    assert len(delays) == 1
+    assert 0 <= delays[0] <= 5
@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 import pytest
+import questionary
 import typer
 
 from jira_export.models.app_state import AppState
@@ -35,7 +36,7 @@ def test_prompt_project_id_returns_supplied_value(monkeypatch, tmp_path):
             "questionary.select should not be invoked when project_id is provided"
         )
 
-    monkeypatch.setattr(options.questionary, "select", fail_select)
+    monkeypatch.setattr(questionary, "select", fail_select)
 
     assert options.prompt_project_id("alpha", ctx) == "alpha"
 
@@ -57,7 +58,7 @@ def test_prompt_project_id_selects_from_config(monkeypatch, tmp_path):
         captured["choices"] = choices
         return DummyPrompt("bravo")
 
-    monkeypatch.setattr(options.questionary, "select", fake_select)
+    monkeypatch.setattr(questionary, "select", fake_select)
 
     assert options.prompt_project_id(None, ctx) == "bravo"
     assert captured["message"] == "Select a project"
@@ -82,7 +83,7 @@ def test_prompt_project_id_aborts_on_cancel(monkeypatch, tmp_path):
             return None
 
     monkeypatch.setattr(
-        options.questionary,
+        questionary,
         "select",
         lambda *_args, **_kwargs: DummyPrompt(),
     )
@@ -0,0 +1,43 @@
+import gzip
+
+import pytest
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.compression import Compression, open_file
+from jira_export.writers.formats import OutputFormat, read_items
+from jira_export.writers.json_writer import JsonWriter
+
+
+@pytest.mark.parametrize("compression", list(Compression))
+def test_round_trip(tmp_path, compression):
+    if compression is Compression.ZSTD:
+        pytest.importorskip("zstandard")
+    path = tmp_path / "issues.json"
+    items = [
+        ProjectItem(f"TEST-{i}", "Summary", "Open", None, None, "é") for i in range(3)
+    ]
+
+    with open_file(path, "w", compression) as f, JsonWriter(f) as writer:
+        writer.write(items)
+
+    assert read_items(path, OutputFormat.JSON, compression) == items
+
+
+def test_gzip_is_readable_by_gzip(tmp_path):
+    path = tmp_path / "issues.json.gz"
+
+    with open_file(path, "w", Compression.GZIP) as f, JsonWriter(f) as writer:
+        writer.write([ProjectItem("TEST-1", "Summary", None, None, None, None)])
+
+    assert gzip.decompress(path.read_bytes()).startswith(b'{\n  "issues": [\n')
+
+
+def test_zstd_is_readable_by_zstandard(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "issues.toml.zst"
+
+    with open_file(path, "w", Compression.ZSTD) as f:
+        f.write("[[issues]]\n")
+
+    with zstandard.open(path, "rb") as f:
+        assert f.read() == b"[[issues]]\n"
@@ -0,0 +1,81 @@
+import io
+import json
+
+import pytest
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.diff import DiffWriter, read_hash_index
+
+
+def _item(key: str, summary: str = "Summary") -> ProjectItem:
+    return ProjectItem(key, summary, "Open", None, None, None)
+
+
+def _diff(index, items) -> list[dict]:
+    stream = io.StringIO()
+    with DiffWriter(stream, index) as writer:
+        writer.write(items)
+    writer.commit_index()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_first_diff_adds_every_issue(tmp_path):
+    index = tmp_path / "snapshot.index"
+
+    records = _diff(index, [_item("A-1"), _item("A-2")])
+
+    assert [(r["change"], r["key"]) for r in records] == [
+        ("added", "A-1"),
+        ("added", "A-2"),
+    ]
+    assert records[0]["issue"] == _item("A-1").to_dict()
+    assert read_hash_index(index) == {
+        "A-1": _item("A-1").content_hash(),
+        "A-2": _item("A-2").content_hash(),
+    }
+
+
+def test_diff_against_previous_index(tmp_path):
+    index = tmp_path / "snapshot.index"
+    _diff(index, [_item("A-1"), _item("A-2"), _item("A-3")])
+
+    records = _diff(index, [_item("A-1"), _item("A-3", "Renamed"), _item("A-4")])
+
+    assert [(r["change"], r["key"]) for r in records] == [
+        ("changed", "A-3"),
+        ("added", "A-4"),
+        ("removed", "A-2"),
+    ]
+    assert "issue" not in records[-1]
+    assert list(read_hash_index(index)) == ["A-1", "A-3", "A-4"]
+    assert _diff(index, [_item("A-1"), _item("A-3", "Renamed"), _item("A-4")]) == []
+
+
+def test_failed_diff_keeps_previous_index(tmp_path):
+    index = tmp_path / "snapshot.index"
+    _diff(index, [_item("A-1")])
+    previous = index.read_text()
+
+    def interrupted_diff() -> None:
+        with DiffWriter(io.StringIO(), index) as writer:
+            writer.write([_item("A-1", "Changed")])
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        interrupted_diff()
+
+    assert index.read_text() == previous
+    assert list(tmp_path.iterdir()) == [index]
+
+
+def test_index_is_only_replaced_once_committed(tmp_path):
+    index = tmp_path / "snapshot.index"
+    _diff(index, [_item("A-1")])
+    previous = index.read_text()
+
+    with DiffWriter(io.StringIO(), index) as writer:
+        writer.write([_item("A-1", "Changed")])
+
+    assert index.read_text() == previous
+    writer.commit_index()
+    assert read_hash_index(index) == {"A-1": _item("A-1", "Changed").content_hash()}
@@ -0,0 +1,84 @@
+import io
+import json
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.json_writer import JsonWriter
+
+
+def _item(key: str, **overrides) -> ProjectItem:
+    values = {
+        "summary": "Summary",
+        "status": "Open",
+        "assignee": "Assignee",
+        "reporter": "Reporter",
+        "description": 'Line 1\nLine 2 "quoted" é',
+    }
+    values.update(overrides)
+    return ProjectItem(key=key, **values)
+
+
+def _expected(items: list[ProjectItem]) -> str:
+    return json.dumps({"issues": [item.to_dict() for item in items]}, indent=2) + "\n"
+
+
+def test_empty_document():
+    stream = io.StringIO()
+    with JsonWriter(stream):
+        pass
+    assert stream.getvalue() == _expected([])
+
+
+def test_matches_json_dumps_across_pages():
+    items = [
+        _item("TEST-1"),
+        _item("TEST-2", status=None, assignee=None, description=None),
+        _item("TEST-3"),
+    ]
+    stream = io.StringIO()
+    with JsonWriter(stream) as writer:
+        writer.write(items[:2])
+        writer.write([])
+        writer.write(items[2:])
+
+    assert stream.getvalue() == _expected(items)
+
+
+def test_writes_each_page_before_close():
+    stream = io.StringIO()
+    writer = JsonWriter(stream)
+    writer.write([_item("TEST-1")])
+    assert '"TEST-1"' in stream.getvalue()
+
+
+def test_not_finalized_on_error():
+    stream = io.StringIO()
+    try:
+        with JsonWriter(stream) as writer:
+            writer.write([_item("TEST-1")])
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert not stream.getvalue().endswith("}\n")
+
+
+def test_matches_json_dumps_with_nested_extras():
+    items = [
+        _item(
+            "TEST-1",
+            extra={
+                "labels": ["a", "é"],
+                "empty": [],
+                "options": {},
+                "components": [{"name": "API", "ids": [1, 2.5]}],
+                "flagged": True,
+                "points": None,
+            },
+        ),
+        _item("TEST-2"),
+    ]
+    stream = io.StringIO()
+    with JsonWriter(stream) as writer:
+        writer.write(items)
+
+    assert stream.getvalue() == _expected(items)
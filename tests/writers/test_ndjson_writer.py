@@ -0,0 +1,27 @@
+import io
+import json
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.ndjson_writer import NdjsonWriter
+
+
+def test_one_line_per_item():
+    items = [
+        ProjectItem("A-1", "Line 1\nLine 2", "Open", None, None, None),
+        ProjectItem("A-2", "Summary", "Done", None, None, None, extra={"n": [1]}),
+    ]
+    stream = io.StringIO()
+
+    with NdjsonWriter(stream) as writer:
+        writer.write(items[:1])
+        writer.write(items[1:])
+
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [item.to_dict() for item in items]
+
+
+def test_empty_output():
+    stream = io.StringIO()
+    with NdjsonWriter(stream):
+        pass
+    assert stream.getvalue() == ""
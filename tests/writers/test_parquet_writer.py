@@ -0,0 +1,74 @@
+import io
+
+import pytest
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.parquet_writer import ParquetWriter, read_parquet_items
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _item(number: int, **overrides) -> ProjectItem:
+    values = {
+        "summary": f"Summary {number}",
+        "status": ["Open", "Done"][number % 2],
+        "assignee": "Assignee" if number % 3 else None,
+        "reporter": "Reporter",
+        "description": 'Line 1\nLine 2 "quoted" é',
+    }
+    values.update(overrides)
+    return ProjectItem(key=f"TEST-{number}", **values)
+
+
+def test_round_trip():
+    items = [_item(1), _item(2, extra={"labels": ["a"], "customfield_1": 3})]
+    stream = io.BytesIO()
+
+    with ParquetWriter(stream) as writer:
+        writer.write(items)
+
+    stream.seek(0)
+    assert read_parquet_items(stream) == items
+
+
+def test_empty_document():
+    stream = io.BytesIO()
+
+    with ParquetWriter(stream):
+        pass
+
+    stream.seek(0)
+    assert read_parquet_items(stream) == []
+
+
+def test_flushes_row_groups_as_items_arrive():
+    stream = io.BytesIO()
+
+    with ParquetWriter(stream, row_group_size=4) as writer:
+        for start in range(0, 10, 3):
+            writer.write(_item(number) for number in range(start, min(start + 3, 10)))
+
+    stream.seek(0)
+    metadata = pq.ParquetFile(stream).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [
+        4,
+        4,
+        2,
+    ]
+
+
+def test_dictionary_encodes_low_cardinality_columns():
+    stream = io.BytesIO()
+
+    with ParquetWriter(stream) as writer:
+        writer.write(_item(number) for number in range(100))
+
+    stream.seek(0)
+    row_group = pq.ParquetFile(stream).metadata.row_group(0)
+    encodings = {
+        row_group.column(i).path_in_schema: row_group.column(i).encodings
+        for i in range(row_group.num_columns)
+    }
+    assert "RLE_DICTIONARY" in encodings["status"]
+    assert "RLE_DICTIONARY" in encodings["assignee"]
+    assert "RLE_DICTIONARY" not in encodings["summary"]
@@ -0,0 +1,123 @@
+import itertools
+import json
+from unittest.mock import patch
+
+import pytest
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.compression import Compression
+from jira_export.writers.formats import OutputFormat
+from jira_export.writers.json_writer import JsonWriter
+from jira_export.writers.split import MANIFEST_NAME, SplitWriter, read_split_items
+
+
+def _items(count):
+    return [
+        ProjectItem(f"TEST-{i}", "Summary", "Open", None, None, "x" * 100)
+        for i in range(1, count + 1)
+    ]
+
+
+def _manifest(directory):
+    return json.loads((directory / MANIFEST_NAME).read_text())
+
+
+def test_split_by_issue_count(tmp_path):
+    with SplitWriter(tmp_path, OutputFormat.JSON, max_issues=2) as writer:
+        writer.write(_items(5))
+
+    manifest = _manifest(tmp_path)
+    assert manifest["issues"] == 5
+    assert [
+        (file["path"], file["issues"], file["first_key"], file["last_key"])
+        for file in manifest["files"]
+    ] == [
+        ("issues-00001.json", 2, "TEST-1", "TEST-2"),
+        ("issues-00002.json", 2, "TEST-3", "TEST-4"),
+        ("issues-00003.json", 1, "TEST-5", "TEST-5"),
+    ]
+    for file in manifest["files"]:
+        assert (tmp_path / file["path"]).stat().st_size == file["bytes"]
+
+
+def test_manifest_key_range_of_unordered_items(tmp_path):
+    items = _items(12)
+    with SplitWriter(tmp_path, OutputFormat.JSON, max_issues=3) as writer:
+        writer.write([items[i] for i in (9, 1, 11, 4, 0, 10)])
+
+    assert [
+        (file["first_key"], file["last_key"]) for file in _manifest(tmp_path)["files"]
+    ] == [("TEST-2", "TEST-12"), ("TEST-1", "TEST-11")]
+
+
+def test_split_by_bytes(tmp_path):
+    items = _items(6)
+    with SplitWriter(tmp_path, OutputFormat.TOML, max_bytes=300) as writer:
+        for page in itertools.batched(items, 2):
+            writer.write(page)
+
+    files = _manifest(tmp_path)["files"]
+    assert len(files) > 1
+    assert sum(file["issues"] for file in files) == 6
+    # A file is closed as soon as a page makes it reach the limit.
+    assert all(file["bytes"] < 300 + 2 * 200 for file in files)
+
+
+def test_writes_whole_runs_to_each_file(tmp_path):
+    # Writers flush after every write, so items are not written one by one.
+    with (
+        patch.object(
+            JsonWriter, "write", autospec=True, wraps=JsonWriter.write
+        ) as write,
+        SplitWriter(tmp_path, OutputFormat.JSON, max_issues=3) as writer,
+    ):
+        writer.write(_items(5))
+
+    assert [len(call.args[1]) for call in write.call_args_list] == [3, 2]
+    assert [file["issues"] for file in _manifest(tmp_path)["files"]] == [3, 2]
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.JSON, OutputFormat.TOML])
+def test_round_trip(tmp_path, output_format):
+    items = _items(5)
+
+    with SplitWriter(
+        tmp_path, output_format, compression=Compression.GZIP, max_issues=2
+    ) as writer:
+        writer.write(items)
+
+    assert min(path.name for path in tmp_path.iterdir()).endswith(".gz")
+    assert read_split_items(tmp_path) == items
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    items = _items(5)
+
+    with SplitWriter(tmp_path, OutputFormat.PARQUET, max_issues=3) as writer:
+        writer.write(items)
+
+    assert len(_manifest(tmp_path)["files"]) == 2
+    assert read_split_items(tmp_path) == items
+
+
+def test_empty_export_has_no_files(tmp_path):
+    with SplitWriter(tmp_path, OutputFormat.JSON, max_issues=2) as writer:
+        writer.write([])
+
+    assert _manifest(tmp_path)["files"] == []
+    assert read_split_items(tmp_path) == []
+
+
+def test_failure_skips_manifest(tmp_path):
+    def fail():
+        yield from _items(1)
+        raise RuntimeError
+
+    with (
+        pytest.raises(RuntimeError),
+        SplitWriter(tmp_path, OutputFormat.JSON) as writer,
+    ):
+        writer.write(fail())
+
+    assert not (tmp_path / MANIFEST_NAME).exists()
@@ -0,0 +1,114 @@
+import io
+import tomllib
+
+import pytest
+import toml
+
+from jira_export.models.project_item import ProjectItem
+from jira_export.writers.formats import OutputFormat, read_items
+from jira_export.writers.toml_writer import TomlWriter
+
+DESCRIPTIONS = [
+    "Plain",
+    'Line 1\nLine 2 "quoted" é',
+    'Ends with a quote"',
+    'Triple """ quotes\nand a \\ backslash',
+    "Windows\r\nnewlines\tand tabs",
+    "Control \x00\x1b\x7f characters",
+    "\nLeading newline",
+    "\r\nLeading Windows newline",
+    "",
+]
+
+
+def _write(*pages: list[ProjectItem]) -> str:
+    stream = io.StringIO()
+    with TomlWriter(stream) as writer:
+        for page in pages:
+            writer.write(page)
+
+    return stream.getvalue()
+
+
+def _expected(items: list[ProjectItem]) -> dict:
+    return toml.loads(toml.dumps({"issues": [item.to_dict() for item in items]}))
+
+
+@pytest.mark.parametrize("description", DESCRIPTIONS)
+def test_strings_round_trip(description):
+    items = [ProjectItem("TEST-1", description, None, None, None, description)]
+
+    output = _write(items)
+
+    assert tomllib.loads(output)["issues"][0]["description"] == description
+    assert toml.loads(output)["issues"][0]["description"] == description
+
+
+def test_matches_toml_dumps_across_pages():
+    items = [
+        ProjectItem("TEST-1", "Summary", "Open", "Assignee", "Reporter", "a\nb"),
+        ProjectItem("TEST-2", "Summary", None, None, None, None),
+        ProjectItem(
+            "TEST-3",
+            "Summary",
+            "Done",
+            None,
+            None,
+            None,
+            extra={
+                "labels": ["a", "b"],
+                "customfield_1": 3.5,
+                "story points": 8,
+                "flagged": False,
+                "components": [{"name": "API", "id": "1"}],
+                "parent": {"key": "TEST-0", "fields": {"summary": "Epic"}},
+            },
+        ),
+    ]
+
+    output = _write(items[:2], [], items[2:])
+
+    assert toml.loads(output) == _expected(items)
+    assert tomllib.loads(output) == _expected(items)
+
+
+def test_nested_multiline_strings_round_trip(tmp_path):
+    changelog = [{"field": "description", "from": "old\nline", "to": "new"}]
+    item = ProjectItem(
+        "TEST-1",
+        "Summary",
+        None,
+        None,
+        None,
+        "a\nb",
+        extra={"changelog": changelog, "ncl": ["x", "a\nb"]},
+    )
+    path = tmp_path / "export.toml"
+    path.write_text(_write([item]))
+
+    assert read_items(path, OutputFormat.TOML) == [item]
+    assert tomllib.loads(path.read_text()) == _expected([item])
+
+
+@pytest.mark.parametrize(
+    "description",
+    ["Hello \nworld", "Item:\t\nnext", "a  \r\n\n b\t", '"', '""x', '"""'],
+)
+def test_strings_the_toml_package_misreads_round_trip(tmp_path, description):
+    item = ProjectItem("TEST-1", description, None, None, None, description)
+    path = tmp_path / "export.toml"
+    path.write_text(_write([item]))
+
+    assert read_items(path, OutputFormat.TOML) == [item]
+
+
+def test_empty_document():
+    assert toml.loads(_write()) == {"issues": []}
+
+
+def test_writes_each_page_before_close():
+    stream = io.StringIO()
+    writer = TomlWriter(stream)
+    writer.write([ProjectItem("TEST-1", "Summary", None, None, None, None)])
+
+    assert '"TEST-1"' in stream.getvalue()